@@ -1,4 +1,4 @@
-from ._client import ZaiClient, ZhipuAiClient
+from ._client import AsyncZaiClient, AsyncZhipuAiClient, ZaiClient, ZhipuAiClient
 from ._version import __version__
 
-__all__ = ['ZaiClient', 'ZhipuAiClient', '__version__']
+__all__ = ['ZaiClient', 'ZhipuAiClient', 'AsyncZaiClient', 'AsyncZhipuAiClient', '__version__']
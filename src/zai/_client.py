@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from functools import cached_property
-from typing import TYPE_CHECKING, Mapping, Union
+from typing import TYPE_CHECKING, Callable, Mapping, Union
 
 import httpx
 from httpx import Timeout
@@ -14,8 +14,8 @@ if TYPE_CHECKING:
     from zai.api_resource.audio import Audio
     from zai.api_resource.batch import Batches
     from zai.api_resource.chat import Chat
-    from zai.api_resource.embeddings import Embeddings
-    from zai.api_resource.files import Files
+    from zai.api_resource.embeddings import EmbeddingCache, Embeddings
+    from zai.api_resource.files import Files, UploadIndex
     from zai.api_resource.images import Images
     from zai.api_resource.moderations import Moderations
     from zai.api_resource.tools import Tools
@@ -25,12 +25,35 @@ if TYPE_CHECKING:
     from zai.api_resource.web_reader import WebReaderApi
     from zai.api_resource.file_parser import FileParser
     from zai.api_resource.ocr import HandwritingOCR, LayoutParsing
+    from zai.api_resource.agents import AsyncAgents
+    from zai.api_resource.assistant import AsyncAssistant
+    from zai.api_resource.audio import AsyncAudio
+    from zai.api_resource.batch import AsyncBatches
+    from zai.api_resource.chat import AsyncChat
+    from zai.api_resource.embeddings import AsyncEmbeddings
+    from zai.api_resource.files import AsyncFiles
+    from zai.api_resource.images import AsyncImages
+    from zai.api_resource.moderations import AsyncModerations
+    from zai.api_resource.tools import AsyncTools
+    from zai.api_resource.videos import AsyncVideos
+    from zai.api_resource.voice import AsyncVoice
+    from zai.api_resource.web_search import AsyncWebSearchApi
+    from zai.api_resource.web_reader import AsyncWebReaderApi
+    from zai.api_resource.file_parser import AsyncFileParser
+    from zai.api_resource.ocr import AsyncHandwritingOCR, AsyncLayoutParsing
 
 from .core import (
     NOT_GIVEN,
     ZAI_DEFAULT_MAX_RETRIES,
+    AsyncHttpClient,
+    HedgePolicy,
     HttpClient,
     NotGiven,
+    RateLimiter,
+    RequestCoalescer,
+    ResponseCache,
+    RetryPolicy,
+    StreamMetrics,
     ZaiError,
     _jwt_token,
 )
@@ -65,6 +88,15 @@ class BaseClient(HttpClient):
             disable_token_cache: bool = True,
             _strict_response_validation: bool = False,
             source_channel: str | None = None,
+            stream_metrics_callback: Callable[[StreamMetrics], None] | None = None,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: RetryPolicy | None = None,
+            deadline: float | None = None,
+            hedge_policy: HedgePolicy | None = None,
+            coalescer: RequestCoalescer | None = None,
+            response_cache: ResponseCache | None = None,
+            embedding_cache: EmbeddingCache | None = None,
+            upload_index: UploadIndex | None = None,
     ) -> None:
         """
         Initialize the ZAI client
@@ -81,6 +113,24 @@ class BaseClient(HttpClient):
             disable_token_cache (bool): Whether to disable JWT token caching
             _strict_response_validation (bool): Whether to enable strict response validation
             source_channel (str | None): Source channel identifier
+            stream_metrics_callback (Callable[[StreamMetrics], None] | None): Called with the timing
+                                    metrics of every streamed response once it is finished or closed
+            rate_limiter (RateLimiter | None): Client-side requests/tokens per minute limits applied
+                                    before every request is sent
+            retry_policy (RetryPolicy | None): Which failures are retried and how long to wait between
+                                    attempts; honours `Retry-After` headers by default
+            deadline (float | None): Total seconds a request may take across all attempts and retry
+                                    sleeps; each attempt's timeout shrinks to the time left
+            hedge_policy (HedgePolicy | None): Opt-in hedging of slow requests to idempotent endpoints
+                                    such as embeddings and moderations
+            coalescer (RequestCoalescer | None): Opt-in sharing of one upstream call between concurrent
+                                    identical requests
+            response_cache (ResponseCache | None): Opt-in cache of responses to deterministic requests
+                                    such as embeddings and greedy chat completions
+            embedding_cache (EmbeddingCache | None): Opt-in per-text cache of embedding vectors; only
+                                    the texts missing from it are sent upstream
+            upload_index (UploadIndex | None): Opt-in index of uploaded content; `files.create` returns the
+                                    existing file instead of uploading identical content again
         """
         if api_key is None:
             api_key = os.environ.get('ZAI_API_KEY')
@@ -89,6 +139,8 @@ class BaseClient(HttpClient):
         self.api_key = api_key
         self.source_channel = source_channel
         self.disable_token_cache = disable_token_cache
+        self.embedding_cache = embedding_cache
+        self.upload_index = upload_index
 
         if base_url is None:
             base_url = os.environ.get('ZAI_BASE_URL')
@@ -106,6 +158,13 @@ class BaseClient(HttpClient):
             custom_httpx_client=http_client,
             custom_headers=custom_headers,
             _strict_response_validation=_strict_response_validation,
+            stream_metrics_callback=stream_metrics_callback,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            deadline=deadline,
+            hedge_policy=hedge_policy,
+            coalescer=coalescer,
+            response_cache=response_cache,
         )
 
     @property
@@ -211,6 +270,12 @@ class BaseClient(HttpClient):
         from zai.api_resource.ocr import LayoutParsing
         return LayoutParsing(self)
 
+    @property
+    @override
+    def _auth_identity(self) -> str:
+        # the API key, as the JWT in the Authorization header changes when it is regenerated
+        return self.api_key
+
     @property
     @override
     def auth_headers(self) -> dict[str, str]:
@@ -261,3 +326,259 @@ class ZhipuAiClient(BaseClient):
     @property
     def default_base_url(self):
         return 'https://open.bigmodel.cn/api/paas/v4'
+
+
+class AsyncBaseClient(AsyncHttpClient):
+    """
+    asyncio client for interacting with the ZAI API
+
+    Exposes the same resources as `BaseClient`, but every request method is a coroutine and
+    streaming responses are consumed with `async for`.
+
+    Attributes:
+        chat (AsyncChat): Chat completions API resource
+        api_key (str): API key for authentication
+        _disable_token_cache (bool): Whether to disable token caching
+        source_channel (str): Source channel identifier
+    """
+
+    chat: AsyncChat
+    api_key: str
+    base_url: str
+    disable_token_cache: bool = True
+    source_channel: str
+
+    def __init__(
+            self,
+            *,
+            api_key: str | None = None,
+            base_url: str | httpx.URL | None = None,
+            timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN,
+            max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+            http_client: httpx.AsyncClient | None = None,
+            custom_headers: Mapping[str, str] | None = None,
+            disable_token_cache: bool = True,
+            _strict_response_validation: bool = False,
+            source_channel: str | None = None,
+            stream_metrics_callback: Callable[[StreamMetrics], None] | None = None,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: RetryPolicy | None = None,
+            deadline: float | None = None,
+            hedge_policy: HedgePolicy | None = None,
+            coalescer: RequestCoalescer | None = None,
+            response_cache: ResponseCache | None = None,
+            embedding_cache: EmbeddingCache | None = None,
+            upload_index: UploadIndex | None = None,
+    ) -> None:
+        """
+        Initialize the asyncio ZAI client
+
+        Arguments:
+            api_key (str | None): API key for authentication.
+                                    If None, will try to get from ZAI_API_KEY environment variable.
+            base_url (str | httpx.URL | None): Base URL for the API.
+                                    If None, will try to get from ZAI_BASE_URL environment variable
+            timeout (Union[float, Timeout, None, NotGiven]): Request timeout configuration
+            max_retries (int): Maximum number of retries for failed requests
+            http_client (httpx.AsyncClient | None): Custom asyncio HTTP client to use
+            custom_headers (Mapping[str, str] | None): Additional headers to include in requests
+            disable_token_cache (bool): Whether to disable JWT token caching
+            _strict_response_validation (bool): Whether to enable strict response validation
+            source_channel (str | None): Source channel identifier
+            stream_metrics_callback (Callable[[StreamMetrics], None] | None): Called with the timing
+                                    metrics of every streamed response once it is finished or closed
+            rate_limiter (RateLimiter | None): Client-side requests/tokens per minute limits applied
+                                    before every request is sent
+            retry_policy (RetryPolicy | None): Which failures are retried and how long to wait between
+                                    attempts; honours `Retry-After` headers by default
+            deadline (float | None): Total seconds a request may take across all attempts and retry
+                                    sleeps; each attempt's timeout shrinks to the time left
+            hedge_policy (HedgePolicy | None): Opt-in hedging of slow requests to idempotent endpoints
+                                    such as embeddings and moderations
+            coalescer (RequestCoalescer | None): Opt-in sharing of one upstream call between concurrent
+                                    identical requests
+            response_cache (ResponseCache | None): Opt-in cache of responses to deterministic requests
+                                    such as embeddings and greedy chat completions
+            embedding_cache (EmbeddingCache | None): Opt-in per-text cache of embedding vectors; only
+                                    the texts missing from it are sent upstream
+            upload_index (UploadIndex | None): Opt-in index of uploaded content; `files.create` returns the
+                                    existing file instead of uploading identical content again
+        """
+        if api_key is None:
+            api_key = os.environ.get('ZAI_API_KEY')
+        if api_key is None:
+            raise ZaiError('api_key not provided, please provide it through parameters or environment variables')
+        self.api_key = api_key
+        self.source_channel = source_channel
+        self.disable_token_cache = disable_token_cache
+        self.embedding_cache = embedding_cache
+        self.upload_index = upload_index
+
+        if base_url is None:
+            base_url = os.environ.get('ZAI_BASE_URL')
+        if base_url is None:
+            base_url = self.default_base_url
+        self.base_url = base_url
+
+        from ._version import __version__
+
+        super().__init__(
+            version=__version__,
+            base_url=base_url,
+            max_retries=max_retries,
+            timeout=timeout,
+            custom_httpx_client=http_client,
+            custom_headers=custom_headers,
+            _strict_response_validation=_strict_response_validation,
+            stream_metrics_callback=stream_metrics_callback,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            deadline=deadline,
+            hedge_policy=hedge_policy,
+            coalescer=coalescer,
+            response_cache=response_cache,
+        )
+
+    @property
+    def default_base_url(self):
+        raise NotImplementedError('Subclasses must define default_base_url')
+
+    @cached_property
+    def chat(self) -> AsyncChat:
+        from zai.api_resource.chat import AsyncChat
+
+        return AsyncChat(self)
+
+    @cached_property
+    def assistant(self) -> AsyncAssistant:
+        from zai.api_resource.assistant import AsyncAssistant
+
+        return AsyncAssistant(self)
+
+    @cached_property
+    def agents(self) -> AsyncAgents:
+        from zai.api_resource.agents import AsyncAgents
+
+        return AsyncAgents(self)
+
+    @cached_property
+    def embeddings(self) -> AsyncEmbeddings:
+        from zai.api_resource.embeddings import AsyncEmbeddings
+
+        return AsyncEmbeddings(self)
+
+    @cached_property
+    def batches(self) -> AsyncBatches:
+        from zai.api_resource.batch import AsyncBatches
+
+        return AsyncBatches(self)
+
+    @cached_property
+    def tools(self) -> AsyncTools:
+        from zai.api_resource.tools import AsyncTools
+
+        return AsyncTools(self)
+
+    @cached_property
+    def web_search(self) -> AsyncWebSearchApi:
+        from zai.api_resource.web_search import AsyncWebSearchApi
+
+        return AsyncWebSearchApi(self)
+
+    @cached_property
+    def web_reader(self) -> AsyncWebReaderApi:
+        from zai.api_resource.web_reader import AsyncWebReaderApi
+
+        return AsyncWebReaderApi(self)
+
+    @cached_property
+    def files(self) -> AsyncFiles:
+        from zai.api_resource.files import AsyncFiles
+
+        return AsyncFiles(self)
+
+    @cached_property
+    def images(self) -> AsyncImages:
+        from zai.api_resource.images import AsyncImages
+
+        return AsyncImages(self)
+
+    @cached_property
+    def audio(self) -> AsyncAudio:
+        from zai.api_resource.audio import AsyncAudio
+
+        return AsyncAudio(self)
+
+    @cached_property
+    def videos(self) -> AsyncVideos:
+        from zai.api_resource.videos import AsyncVideos
+
+        return AsyncVideos(self)
+
+    @cached_property
+    def moderations(self) -> AsyncModerations:
+        from zai.api_resource.moderations import AsyncModerations
+
+        return AsyncModerations(self)
+
+    @cached_property
+    def voice(self) -> AsyncVoice:
+        from zai.api_resource.voice import AsyncVoice
+
+        return AsyncVoice(self)
+
+    @cached_property
+    def file_parser(self) -> AsyncFileParser:
+        from zai.api_resource.file_parser import AsyncFileParser
+        return AsyncFileParser(self)
+
+    @cached_property
+    def ocr(self) -> AsyncHandwritingOCR:
+        from zai.api_resource.ocr import AsyncHandwritingOCR
+        return AsyncHandwritingOCR(self)
+
+    @cached_property
+    def layout_parsing(self) -> AsyncLayoutParsing:
+        from zai.api_resource.ocr import AsyncLayoutParsing
+        return AsyncLayoutParsing(self)
+
+    @property
+    @override
+    def _auth_identity(self) -> str:
+        # the API key, as the JWT in the Authorization header changes when it is regenerated
+        return self.api_key
+
+    @property
+    @override
+    def auth_headers(self) -> dict[str, str]:
+        api_key = self.api_key
+        source_channel = self.source_channel or 'python-sdk'
+        if self.disable_token_cache:
+            return {
+                'Authorization': f'Bearer {api_key}',
+                'x-source-channel': source_channel,
+            }
+        else:
+            return {
+                'Authorization': f'Bearer {_jwt_token.generate_token(api_key)}',
+                'x-source-channel': source_channel,
+            }
+
+
+class AsyncZaiClient(AsyncBaseClient):
+    @property
+    def default_base_url(self):
+        return 'https://api.z.ai/api/paas/v4'
+
+    @property
+    @override
+    def auth_headers(self) -> dict[str, str]:
+        headers = super().auth_headers
+        headers['Accept-Language'] = 'en-US,en'
+        return headers
+
+
+class AsyncZhipuAiClient(AsyncBaseClient):
+    @property
+    def default_base_url(self):
+        return 'https://open.bigmodel.cn/api/paas/v4'
@@ -1,26 +1,44 @@
-from .agents import Agents
+from .agents import Agents, AsyncAgents
 from .assistant import (
 	Assistant,
+	AsyncAssistant,
 )
-from .audio import Audio
-from .batch import Batches
+from .audio import AsyncAudio, Audio
+from .batch import AsyncBatches, Batches, BatchResults
 from .chat import (
+	AsyncChat,
+	AsyncChatAsyncCompletions,
+	AsyncChatCompletions,
+	AsyncChatCompletionStream,
 	AsyncCompletions,
 	Chat,
+	ChatCompletionStream,
+	ChatCompletionStreamAccumulator,
 	Completions,
+	StreamedToolCall,
 )
-from .embeddings import Embeddings
-from .file_parser import FileParser
-from .files import Files, FilesWithRawResponse
-from .images import Images
-from .moderations import Moderations
-from .ocr import HandwritingOCR, LayoutParsing
-from .tools import Tools
+from .embeddings import (
+	AsyncEmbeddingBatcher,
+	AsyncEmbeddings,
+	EmbeddingBatcher,
+	EmbeddingCache,
+	Embeddings,
+	MemoryEmbeddingCache,
+	SQLiteEmbeddingCache,
+)
+from .file_parser import AsyncFileParser, FileParser
+from .files import AsyncFiles, Files, FilesWithRawResponse, UploadIndex
+from .images import AsyncImages, Images
+from .moderations import AsyncModerations, Moderations
+from .ocr import AsyncHandwritingOCR, AsyncLayoutParsing, HandwritingOCR, LayoutParsing
+from .tools import AsyncTools, Tools
 from .videos import (
+	AsyncVideos,
 	Videos,
 )
-from .web_reader import WebReaderApi
-from .web_search import WebSearchApi
+from .voice import AsyncVoice, Voice
+from .web_reader import AsyncWebReaderApi, WebReaderApi
+from .web_search import AsyncWebSearchApi, WebSearchApi
 
 __all__ = [
     'Videos',
@@ -42,4 +60,35 @@ __all__ = [
     'FileParser',
     'HandwritingOCR',
     'LayoutParsing',
+    'Voice',
+    'AsyncVideos',
+    'AsyncChat',
+    'AsyncChatCompletions',
+    'AsyncChatAsyncCompletions',
+    'AsyncImages',
+    'AsyncEmbeddings',
+    'AsyncFiles',
+    'AsyncBatches',
+    'AsyncTools',
+    'AsyncAssistant',
+    'AsyncAudio',
+    'AsyncModerations',
+    'AsyncWebSearchApi',
+    'AsyncWebReaderApi',
+    'AsyncAgents',
+    'AsyncFileParser',
+    'AsyncHandwritingOCR',
+    'AsyncLayoutParsing',
+    'AsyncVoice',
+    'ChatCompletionStream',
+    'AsyncChatCompletionStream',
+    'ChatCompletionStreamAccumulator',
+    'StreamedToolCall',
+    'EmbeddingCache',
+    'MemoryEmbeddingCache',
+    'SQLiteEmbeddingCache',
+    'EmbeddingBatcher',
+    'AsyncEmbeddingBatcher',
+    'UploadIndex',
+    'BatchResults',
 ]
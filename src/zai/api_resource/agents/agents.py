@@ -8,10 +8,12 @@ from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
 	NotGiven,
+	AsyncStreamResponse,
 	StreamResponse,
 	deepcopy_minimal,
 	make_request_options,
@@ -23,7 +25,7 @@ from zai.types.sensitive_word_check import SensitiveWordCheckRequest
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Agents(BaseAPI):
@@ -34,7 +36,7 @@ class Agents(BaseAPI):
 		self,
 		agent_id: Optional[str] | NotGiven = NOT_GIVEN,
 		request_id: Optional[str] | NotGiven = NOT_GIVEN,
-		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True, 'raw'] | NotGiven = NOT_GIVEN,
 		messages: Union[str, List[str], List[int], object, None] | NotGiven = NOT_GIVEN,
 		user_id: Optional[str] | NotGiven = NOT_GIVEN,
 		custom_variables: object = NOT_GIVEN,
@@ -42,7 +44,8 @@ class Agents(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
-	) -> AgentsCompletion | StreamResponse[AgentsCompletionChunk]:
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> AgentsCompletion | StreamResponse[AgentsCompletionChunk] | StreamResponse[dict]:
 		body = deepcopy_minimal(
 			{
 				'agent_id': agent_id,
@@ -50,7 +53,7 @@ class Agents(BaseAPI):
 				'user_id': user_id,
 				'messages': messages,
 				'sensitive_word_check': sensitive_word_check,
-				'stream': stream,
+				'stream': True if stream == 'raw' else stream,
 				'custom_variables': custom_variables,
 			}
 		)
@@ -58,10 +61,12 @@ class Agents(BaseAPI):
 		return self._post(
 			'/v1/agents',
 			body=body,
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=AgentsCompletion,
 			stream=stream or False,
-			stream_cls=StreamResponse[AgentsCompletionChunk],
+			stream_cls=StreamResponse[dict] if stream == 'raw' else StreamResponse[AgentsCompletionChunk],
 		)
 
 	def async_result(
@@ -73,6 +78,7 @@ class Agents(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> AgentsCompletion:
 		body = deepcopy_minimal(
 			{
@@ -85,6 +91,78 @@ class Agents(BaseAPI):
 		return self._post(
 			'/v1/agents/async-result',
 			body=body,
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=AgentsCompletion,
+		)
+
+
+class AsyncAgents(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def invoke(
+		self,
+		agent_id: Optional[str] | NotGiven = NOT_GIVEN,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True, 'raw'] | NotGiven = NOT_GIVEN,
+		messages: Union[str, List[str], List[int], object, None] | NotGiven = NOT_GIVEN,
+		user_id: Optional[str] | NotGiven = NOT_GIVEN,
+		custom_variables: object = NOT_GIVEN,
+		sensitive_word_check: Optional[SensitiveWordCheckRequest] | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> AgentsCompletion | AsyncStreamResponse[AgentsCompletionChunk] | AsyncStreamResponse[dict]:
+		body = deepcopy_minimal(
+			{
+				'agent_id': agent_id,
+				'request_id': request_id,
+				'user_id': user_id,
+				'messages': messages,
+				'sensitive_word_check': sensitive_word_check,
+				'stream': True if stream == 'raw' else stream,
+				'custom_variables': custom_variables,
+			}
+		)
+
+		return await self._post(
+			'/v1/agents',
+			body=body,
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=AgentsCompletion,
+			stream=stream or False,
+			stream_cls=AsyncStreamResponse[dict] if stream == 'raw' else AsyncStreamResponse[AgentsCompletionChunk],
+		)
+
+	async def async_result(
+		self,
+		agent_id: Optional[str] | NotGiven = NOT_GIVEN,
+		async_id: Optional[str] | NotGiven = NOT_GIVEN,
+		conversation_id: Optional[str] | NotGiven = NOT_GIVEN,
+		custom_variables: object = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> AgentsCompletion:
+		body = deepcopy_minimal(
+			{
+				'agent_id': agent_id,
+				'async_id': async_id,
+				'conversation_id': conversation_id,
+				'custom_variables': custom_variables,
+			}
+		)
+		return await self._post(
+			'/v1/agents/async-result',
+			body=body,
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=AgentsCompletion,
 		)
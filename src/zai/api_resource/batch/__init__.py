@@ -1,3 +1,4 @@
-from .batches import Batches
+from .batch_runner import BatchResults
+from .batches import AsyncBatches, Batches
 
-__all__ = ['Batches']
+__all__ = ['Batches', 'AsyncBatches', 'BatchResults']
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import tempfile
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional
+
+from zai.core import construct_type
+from zai.types.batch import Batch, BatchError, BatchResult
+from zai.types.chat.chat_completion import Completion
+from zai.types.embeddings import EmbeddingsResponded
+
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+def write_request(file: IO[str], request: Mapping[str, Any], endpoint: str, custom_ids: Dict[str, bool]) -> None:
+	"""
+	Append one request to a batch input file.
+
+	`request` is either a complete line with `custom_id` and `body` or only the body; missing
+	fields are filled in, the `custom_id` with `request-<position>`, skipping ids already in use.
+	`custom_ids` maps every id written so far to whether it was generated.
+	"""
+	line = dict(request) if 'body' in request else {'body': dict(request)}
+	if 'custom_id' in line:
+		custom_id = str(line['custom_id'])
+		if custom_id in custom_ids:
+			generated = ' generated for an earlier request without one' if custom_ids[custom_id] else ''
+			raise ValueError(f'Duplicate custom_id {custom_id!r}{generated} in batch requests')
+		custom_ids[custom_id] = False
+	else:
+		position = len(custom_ids)
+		while f'request-{position}' in custom_ids:
+			position += 1
+		custom_id = f'request-{position}'
+		custom_ids[custom_id] = True
+	line['custom_id'] = custom_id
+	line.setdefault('method', 'POST')
+	line.setdefault('url', endpoint)
+	file.write(json.dumps(line, ensure_ascii=False))
+	file.write('\n')
+
+
+def next_poll_interval(interval: float, max_interval: float) -> float:
+	return min(interval * 1.5, max_interval)
+
+
+def batch_failure(batch: Batch) -> str:
+	errors = batch.errors.data if batch.errors is not None and batch.errors.data else []
+	details = '; '.join(f'{error.code}: {error.message}' for error in errors)
+	return f'Batch {batch.id} {batch.status}' + (f': {details}' if details else '')
+
+
+def response_type(endpoint: str) -> type:
+	return EmbeddingsResponded if endpoint.rstrip('/').endswith('/embeddings') else Completion
+
+
+def _parse_result(line: Mapping[str, Any], cast_type: type) -> BatchResult:
+	response = line.get('response') or {}
+	status_code = response.get('status_code')
+	body = response.get('body')
+	error = line.get('error')
+	failed = error is not None or status_code is None or status_code >= 400
+	if failed and error is None and isinstance(body, dict):
+		error = body.get('error')
+	if failed and not isinstance(error, dict):
+		error = {'message': str(error) if error is not None else f'Request failed with status {status_code}'}
+	return BatchResult.construct(
+		custom_id=str(line.get('custom_id')),
+		status_code=status_code,
+		response=None if failed else construct_type(value=body, type_=cast_type),
+		error=construct_type(value=error, type_=BatchError) if failed else None,
+	)
+
+
+def _read_results(paths: List[str], pending: Dict[str, bool], cast_type: type) -> Iterator[BatchResult]:
+	for path in paths:
+		with open(path, encoding='utf-8') as file:
+			for raw in file:
+				if not raw.strip():
+					continue
+				result = _parse_result(json.loads(raw), cast_type)
+				pending.pop(result.custom_id, None)
+				yield result
+	for custom_id in pending:
+		yield BatchResult.construct(
+			custom_id=custom_id,
+			error=BatchError.construct(message='The request is in neither the output nor the error file'),
+		)
+
+
+class BatchResults(Iterator[BatchResult]):
+	"""
+	Lazy iterator over the results of a finished batch.
+
+	Results are parsed one line at a time from the downloaded output file, then the error file.
+	Requests missing from both are reported last with an error. The files are kept in a temporary
+	directory that is removed once the iterator is exhausted or closed.
+
+	Attributes:
+		batch (Batch): The finished batch
+	"""
+
+	def __init__(
+		self,
+		batch: Batch,
+		directory: tempfile.TemporaryDirectory,
+		paths: List[str],
+		custom_ids: Dict[str, bool],
+		endpoint: str,
+	) -> None:
+		self.batch = batch
+		self._directory = directory
+		self._results = _read_results(paths, custom_ids, response_type(endpoint))
+
+	def __iter__(self) -> BatchResults:
+		return self
+
+	def __next__(self) -> BatchResult:
+		try:
+			return next(self._results)
+		except StopIteration:
+			self.close()
+			raise
+
+	def __enter__(self) -> BatchResults:
+		return self
+
+	def __exit__(self, *args: Optional[object]) -> None:
+		self.close()
+
+	def close(self) -> None:
+		self._results.close()
+		self._directory.cleanup()
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Literal, Optional
+import os
+import pathlib
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, Iterable, List, Literal, Mapping, Optional, Union
 
+import anyio
 import httpx
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
 	NotGiven,
+	ZaiError,
 	make_request_options,
 	maybe_transform,
 )
-from zai.core.pagination import SyncCursorPage
+from zai.core.pagination import AsyncCursorPage, SyncCursorPage
 from zai.types.batch import Batch, BatchCreateParams, BatchListParams
 
+from .batch_runner import TERMINAL_STATUSES, BatchResults, batch_failure, next_poll_interval, write_request
+
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Batches(BaseAPI):
@@ -35,6 +44,7 @@ class Batches(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> Batch:
 		return self._post(
 			'/batches',
@@ -48,7 +58,9 @@ class Batches(BaseAPI):
 				},
 				BatchCreateParams,
 			),
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=Batch,
 		)
 
@@ -59,6 +71,7 @@ class Batches(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> Batch:
 		"""
 		Retrieves a batch.
@@ -69,12 +82,16 @@ class Batches(BaseAPI):
 		  extra_body: Add additional JSON properties to the request
 
 		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
 		"""
 		if not batch_id:
 			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
 		return self._get(
 			f'/batches/{batch_id}',
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=Batch,
 		)
 
@@ -86,6 +103,7 @@ class Batches(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> SyncCursorPage[Batch]:
 		"""List your organization's batches.
 
@@ -105,6 +123,8 @@ class Batches(BaseAPI):
 		  extra_body: Add additional JSON properties to the request
 
 		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
 		"""
 		return self._get_api_list(
 			'/batches',
@@ -113,6 +133,7 @@ class Batches(BaseAPI):
 				extra_headers=extra_headers,
 				extra_body=extra_body,
 				timeout=timeout,
+				deadline=deadline,
 				query=maybe_transform(
 					{
 						'after': after,
@@ -131,6 +152,7 @@ class Batches(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> Batch:
 		"""
 		Cancels an in-progress batch.
@@ -143,11 +165,353 @@ class Batches(BaseAPI):
 
 		  timeout: Override the client-level default timeout for this request, in seconds
 
+		  deadline: Override the client-level deadline for this request, in seconds
+
 		"""
 		if not batch_id:
 			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
 		return self._post(
 			f'/batches/{batch_id}/cancel',
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=Batch,
 		)
+
+	def run(
+		self,
+		requests: Iterable[Mapping[str, Any]],
+		*,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'] = '/v1/chat/completions',
+		completion_window: str | None = None,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		poll_interval: float = 5.0,
+		max_poll_interval: float = 60.0,
+		max_wait: Optional[float] = None,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> BatchResults:
+		"""
+		Runs a batch end to end: writes the requests to a JSONL file, uploads it, submits the
+		batch, polls until it finishes and downloads the output and error files.
+
+		The input file is written to a temporary directory one request at a time, so `requests`
+		can be a generator of any size. Polling starts every `poll_interval` seconds and backs off
+		to `max_poll_interval`. The returned iterator parses the results lazily from disk.
+
+		Args:
+		  requests: Request bodies, or complete lines with `custom_id` and `body`; requests without
+		    a `custom_id` get `request-<position>`
+
+		  endpoint: Endpoint every request is sent to, which also decides whether results are parsed
+		    as `Completion` or `EmbeddingsResponded`
+
+		  poll_interval: Seconds before the first status check
+
+		  max_poll_interval: Upper bound of the seconds between status checks
+
+		  max_wait: Give up with a `ZaiError` once the batch is unfinished after this many seconds;
+		    the batch keeps running on the server
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for each request, in seconds
+
+		  deadline: Override the client-level deadline for each request, in seconds; the whole run
+		    is bounded by `max_wait` instead
+		"""
+		directory = tempfile.TemporaryDirectory(prefix='zai-batch-')
+		try:
+			input_path = pathlib.Path(directory.name) / 'input.jsonl'
+			custom_ids: Dict[str, bool] = {}
+			with open(input_path, 'w', encoding='utf-8') as file:
+				for request in requests:
+					write_request(file, request, endpoint, custom_ids)
+			if not custom_ids:
+				raise ValueError('Expected at least one batch request')
+			input_file = self._client.files.create(
+				file=input_path, purpose='batch', extra_headers=extra_headers, timeout=timeout, deadline=deadline
+			)
+			os.remove(input_path)
+			batch = self.create(
+				endpoint=endpoint,
+				input_file_id=input_file.id,
+				completion_window=completion_window,
+				metadata=metadata,
+				extra_headers=extra_headers,
+				timeout=timeout,
+				deadline=deadline,
+			)
+
+			started = time.monotonic()
+			interval = poll_interval
+			while batch.status not in TERMINAL_STATUSES:
+				if max_wait is not None and time.monotonic() - started + interval > max_wait:
+					raise ZaiError(f'Batch {batch.id} is still {batch.status} after {max_wait} seconds')
+				time.sleep(interval)
+				interval = next_poll_interval(interval, max_poll_interval)
+				batch = self.retrieve(
+					batch.id, extra_headers=extra_headers, timeout=timeout, deadline=deadline
+				)
+
+			paths: List[str] = []
+			for name, file_id in (('output.jsonl', batch.output_file_id), ('errors.jsonl', batch.error_file_id)):
+				if file_id:
+					path = pathlib.Path(directory.name) / name
+					self._client.files.stream_content_to_path(
+						file_id, path, extra_headers=extra_headers, timeout=timeout, deadline=deadline
+					)
+					paths.append(str(path))
+			if not paths and batch.status != 'completed':
+				raise ZaiError(batch_failure(batch))
+		except BaseException:
+			directory.cleanup()
+			raise
+		return BatchResults(batch, directory, paths, custom_ids, endpoint)
+
+
+class AsyncBatches(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		completion_window: str | None = None,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'],
+		input_file_id: str,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		auto_delete_input_file: bool = True,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		return await self._post(
+			'/batches',
+			body=maybe_transform(
+				{
+					'completion_window': completion_window,
+					'endpoint': endpoint,
+					'input_file_id': input_file_id,
+					'metadata': metadata,
+					'auto_delete_input_file': auto_delete_input_file,
+				},
+				BatchCreateParams,
+			),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=Batch,
+		)
+
+	async def retrieve(
+		self,
+		batch_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		"""
+		Retrieves a batch.
+
+		Args:
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
+		"""
+		if not batch_id:
+			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
+		return await self._get(
+			f'/batches/{batch_id}',
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=Batch,
+		)
+
+	async def list(
+		self,
+		*,
+		after: str | NotGiven = NOT_GIVEN,
+		limit: int | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> AsyncCursorPage[Batch]:
+		"""List your organization's batches.
+
+		Args:
+		  after: A cursor for use in pagination.
+
+		    `after` is an object ID that defines your place
+		      in the list. For instance, if you make a list request and receive 100 objects,
+		      ending with obj_foo, your subsequent call can include after=obj_foo in order to
+		      fetch the next page of the list.
+
+		  limit: A limit on the number of objects to be returned. Limit can range between 1 and
+		      100, and the default is 20.
+
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
+		"""
+		return await self._get_api_list(
+			'/batches',
+			page=AsyncCursorPage[Batch],
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				deadline=deadline,
+				query=maybe_transform(
+					{
+						'after': after,
+						'limit': limit,
+					},
+					BatchListParams,
+				),
+			),
+			model=Batch,
+		)
+
+	async def cancel(
+		self,
+		batch_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> Batch:
+		"""
+		Cancels an in-progress batch.
+
+		Args:
+		  batch_id: The ID of the batch to cancel.
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
+
+		"""
+		if not batch_id:
+			raise ValueError(f'Expected a non-empty value for `batch_id` but received {batch_id!r}')
+		return await self._post(
+			f'/batches/{batch_id}/cancel',
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=Batch,
+		)
+
+	async def run(
+		self,
+		requests: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+		*,
+		endpoint: Literal['/v1/chat/completions', '/v1/embeddings'] = '/v1/chat/completions',
+		completion_window: str | None = None,
+		metadata: Optional[Dict[str, str]] | NotGiven = NOT_GIVEN,
+		poll_interval: float = 5.0,
+		max_poll_interval: float = 60.0,
+		max_wait: Optional[float] = None,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> BatchResults:
+		"""
+		Runs a batch end to end: writes the requests to a JSONL file, uploads it, submits the
+		batch, polls until it finishes and downloads the output and error files.
+
+		The input file is written to a temporary directory one request at a time, so `requests`
+		can be a generator or async generator of any size. Polling starts every `poll_interval` seconds and backs off
+		to `max_poll_interval`. The returned iterator parses the results lazily from disk.
+
+		Args:
+		  requests: Request bodies, or complete lines with `custom_id` and `body`; requests without
+		    a `custom_id` get `request-<position>`
+
+		  endpoint: Endpoint every request is sent to, which also decides whether results are parsed
+		    as `Completion` or `EmbeddingsResponded`
+
+		  poll_interval: Seconds before the first status check
+
+		  max_poll_interval: Upper bound of the seconds between status checks
+
+		  max_wait: Give up with a `ZaiError` once the batch is unfinished after this many seconds;
+		    the batch keeps running on the server
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for each request, in seconds
+
+		  deadline: Override the client-level deadline for each request, in seconds; the whole run
+		    is bounded by `max_wait` instead
+		"""
+		directory = tempfile.TemporaryDirectory(prefix='zai-batch-')
+		try:
+			input_path = pathlib.Path(directory.name) / 'input.jsonl'
+			custom_ids: Dict[str, bool] = {}
+			with open(input_path, 'w', encoding='utf-8') as file:
+				if isinstance(requests, AsyncIterable):
+					async for request in requests:
+						write_request(file, request, endpoint, custom_ids)
+				else:
+					for request in requests:
+						write_request(file, request, endpoint, custom_ids)
+			if not custom_ids:
+				raise ValueError('Expected at least one batch request')
+			input_file = await self._client.files.create(
+				file=input_path, purpose='batch', extra_headers=extra_headers, timeout=timeout, deadline=deadline
+			)
+			os.remove(input_path)
+			batch = await self.create(
+				endpoint=endpoint,
+				input_file_id=input_file.id,
+				completion_window=completion_window,
+				metadata=metadata,
+				extra_headers=extra_headers,
+				timeout=timeout,
+				deadline=deadline,
+			)
+
+			started = time.monotonic()
+			interval = poll_interval
+			while batch.status not in TERMINAL_STATUSES:
+				if max_wait is not None and time.monotonic() - started + interval > max_wait:
+					raise ZaiError(f'Batch {batch.id} is still {batch.status} after {max_wait} seconds')
+				await anyio.sleep(interval)
+				interval = next_poll_interval(interval, max_poll_interval)
+				batch = await self.retrieve(
+					batch.id, extra_headers=extra_headers, timeout=timeout, deadline=deadline
+				)
+
+			paths: List[str] = []
+			for name, file_id in (('output.jsonl', batch.output_file_id), ('errors.jsonl', batch.error_file_id)):
+				if file_id:
+					path = pathlib.Path(directory.name) / name
+					await self._client.files.stream_content_to_path(
+						file_id, path, extra_headers=extra_headers, timeout=timeout, deadline=deadline
+					)
+					paths.append(str(path))
+			if not paths and batch.status != 'completed':
+				raise ZaiError(batch_failure(batch))
+		except BaseException:
+			directory.cleanup()
+			raise
+		return BatchResults(batch, directory, paths, custom_ids, endpoint)
@@ -1,9 +1,22 @@
-from .async_completions import AsyncCompletions
-from .chat import Chat
-from .completions import Completions
+from .async_completions import AsyncChatAsyncCompletions, AsyncCompletions
+from .chat import AsyncChat, Chat
+from .completion_stream import (
+	AsyncChatCompletionStream,
+	ChatCompletionStream,
+	ChatCompletionStreamAccumulator,
+	StreamedToolCall,
+)
+from .completions import AsyncChatCompletions, Completions
 
 __all__ = [
 	'AsyncCompletions',
 	'Chat',
 	'Completions',
+	'AsyncChat',
+	'AsyncChatCompletions',
+	'AsyncChatAsyncCompletions',
+	'ChatCompletionStream',
+	'AsyncChatCompletionStream',
+	'ChatCompletionStreamAccumulator',
+	'StreamedToolCall',
 ]
@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING
 
-from zai.core import BaseAPI, cached_property
+from zai.core import AsyncBaseAPI, BaseAPI, cached_property
 
-from .async_completions import AsyncCompletions
-from .completions import Completions
+from .async_completions import AsyncChatAsyncCompletions, AsyncCompletions
+from .completions import AsyncChatCompletions, Completions
 
 if TYPE_CHECKING:
 	pass
@@ -23,3 +23,19 @@ class Chat(BaseAPI):
 	@cached_property
 	def asyncCompletions(self) -> AsyncCompletions:
 		return AsyncCompletions(self._client)
+
+
+class AsyncChat(AsyncBaseAPI):
+	"""
+	asyncio API resource for chat operations.
+
+	Provides access to chat completions and async completions.
+	"""
+
+	@cached_property
+	def completions(self) -> AsyncChatCompletions:
+		return AsyncChatCompletions(self._client)
+
+	@cached_property
+	def asyncCompletions(self) -> AsyncChatAsyncCompletions:
+		return AsyncChatAsyncCompletions(self._client)
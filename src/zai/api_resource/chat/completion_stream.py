@@ -0,0 +1,492 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+from zai.core import AsyncStreamResponse, IncrementalJSONParser, JSONEvent, StreamResponse, construct_type
+from zai.core._base_type import ResponseT
+from zai.core._json_encoder import json_loads
+from zai.types.chat.chat_completion import Completion
+
+_T = TypeVar('_T')
+
+
+class StreamedToolCall:
+	"""
+	A tool call whose arguments have been fully received while the stream is still running.
+
+	Attributes:
+		choice_index (int): Index of the choice the tool call belongs to
+		index (int): Index of the tool call within the choice
+		id (Optional[str]): Unique identifier for the tool call
+		type (str): Type of the tool call
+		name (Optional[str]): Function name
+		arguments (str): Raw JSON arguments
+		parsed_arguments (Any): Decoded arguments, `None` if they are not valid JSON
+	"""
+
+	__slots__ = ('choice_index', 'index', 'id', 'type', 'name', 'arguments', 'parsed_arguments')
+
+	def __init__(
+		self,
+		*,
+		choice_index: int,
+		index: int,
+		id: Optional[str],
+		type: str,
+		name: Optional[str],
+		arguments: str,
+		parsed_arguments: Any,
+	) -> None:
+		self.choice_index = choice_index
+		self.index = index
+		self.id = id
+		self.type = type
+		self.name = name
+		self.arguments = arguments
+		self.parsed_arguments = parsed_arguments
+
+	def __repr__(self) -> str:
+		return f'StreamedToolCall(index={self.index}, id={self.id!r}, name={self.name!r}, arguments={self.arguments!r})'
+
+
+ToolCallListener = Callable[[StreamedToolCall], Any]
+
+
+def _is_async_callable(handler: Any) -> bool:
+	while isinstance(handler, functools.partial):
+		handler = handler.func
+	return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, '__call__', None))
+
+
+def _delta_content(chunk: Any, choice_index: int) -> Optional[str]:
+	for choice in chunk.get('choices') or ():
+		if (choice.get('index') or 0) == choice_index:
+			delta = choice.get('delta')
+			return delta.get('content') if delta is not None else None
+	return None
+
+
+class _ToolCallBuilder:
+	__slots__ = ('id', 'type', 'name', 'arguments', 'dispatched', '_depth', '_in_string', '_escape')
+
+	def __init__(self) -> None:
+		self.id: Optional[str] = None
+		self.type: Optional[str] = None
+		self.name: Optional[str] = None
+		self.arguments: List[str] = []
+		self.dispatched = False
+		self._depth = 0
+		self._in_string = False
+		self._escape = False
+
+	def scan(self, fragment: str) -> bool:
+		"""Track JSON nesting across fragments; returns whether the top-level value was closed by `fragment`."""
+		closed = False
+		depth, in_string, escape = self._depth, self._in_string, self._escape
+		for char in fragment:
+			if escape:
+				escape = False
+			elif in_string:
+				if char == '\\':
+					escape = True
+				elif char == '"':
+					in_string = False
+			elif char == '"':
+				in_string = True
+			elif char == '{' or char == '[':
+				depth += 1
+			elif (char == '}' or char == ']') and depth:
+				depth -= 1
+				closed = depth == 0
+		self._depth, self._in_string, self._escape = depth, in_string, escape
+		return closed
+
+	def to_streamed(self, choice_index: int, index: int, *, final: bool) -> Optional[StreamedToolCall]:
+		arguments = ''.join(self.arguments)
+		try:
+			parsed = json_loads(arguments) if arguments.strip() else {}
+		except ValueError:
+			if not final:
+				return None
+			parsed = None
+		return StreamedToolCall(
+			choice_index=choice_index,
+			index=index,
+			id=self.id,
+			type=self.type or 'function',
+			name=self.name,
+			arguments=arguments,
+			parsed_arguments=parsed,
+		)
+
+	def build(self) -> Dict[str, Any]:
+		return {
+			'id': self.id,
+			'type': self.type or 'function',
+			'function': {'name': self.name, 'arguments': ''.join(self.arguments)},
+		}
+
+
+class _ChoiceBuilder:
+	__slots__ = ('role', 'content', 'reasoning_content', 'tool_calls', 'finish_reason')
+
+	def __init__(self) -> None:
+		self.role: Optional[str] = None
+		self.content: Optional[List[str]] = None
+		self.reasoning_content: Optional[List[str]] = None
+		self.tool_calls: Dict[int, _ToolCallBuilder] = {}
+		self.finish_reason: Optional[str] = None
+
+	def build(self, index: int) -> Dict[str, Any]:
+		message: Dict[str, Any] = {'role': self.role or 'assistant'}
+		if self.content is not None:
+			message['content'] = ''.join(self.content)
+		if self.reasoning_content is not None:
+			message['reasoning_content'] = ''.join(self.reasoning_content)
+		if self.tool_calls:
+			message['tool_calls'] = [self.tool_calls[i].build() for i in sorted(self.tool_calls)]
+		return {'index': index, 'finish_reason': self.finish_reason, 'message': message}
+
+
+class ChatCompletionStreamAccumulator:
+	"""
+	Merges streamed chat completion chunks into the `Completion` the non-streaming call would return.
+
+	Content, reasoning content and tool call arguments are collected as lists of fragments and
+	joined once in `get_completion()`, so the total work stays linear in the size of the stream.
+	Chunks may be `ChatCompletionChunk` models or the plain dicts of `stream='raw'`.
+
+	Tool call listeners are notified as soon as the arguments of a tool call form a complete JSON
+	value, and at the latest when its choice finishes or `finish()` is called.
+	"""
+
+	def __init__(self) -> None:
+		self._fields: Dict[str, Any] = {}
+		self._choices: Dict[int, _ChoiceBuilder] = {}
+		self._usage: Any = None
+		self._tool_call_listeners: List[ToolCallListener] = []
+
+	def add_tool_call_listener(self, listener: ToolCallListener) -> None:
+		"""Register `listener` to be called with every completed `StreamedToolCall`."""
+		self._tool_call_listeners.append(listener)
+
+	def add(self, chunk: Any) -> None:
+		"""Merge one chunk into the accumulated completion."""
+		fields = self._fields
+		for key in ('id', 'created', 'model', 'request_id'):
+			if key not in fields:
+				value = chunk.get(key)
+				if value is not None:
+					fields[key] = value
+
+		usage = chunk.get('usage')
+		if usage is not None:
+			self._usage = usage
+
+		for choice in chunk.get('choices') or ():
+			index = choice.get('index') or 0
+			builder = self._choices.get(index)
+			if builder is None:
+				builder = self._choices[index] = _ChoiceBuilder()
+
+			delta = choice.get('delta')
+			if delta is not None:
+				self._add_delta(builder, index, delta)
+
+			finish_reason = choice.get('finish_reason')
+			if finish_reason is not None:
+				builder.finish_reason = finish_reason
+				self._flush_tool_calls(builder, index)
+
+	def _add_delta(self, builder: _ChoiceBuilder, choice_index: int, delta: Any) -> None:
+		role = delta.get('role')
+		if role is not None:
+			builder.role = role
+		content = delta.get('content')
+		if content is not None:
+			if builder.content is None:
+				builder.content = []
+			builder.content.append(content)
+		reasoning_content = delta.get('reasoning_content')
+		if reasoning_content is not None:
+			if builder.reasoning_content is None:
+				builder.reasoning_content = []
+			builder.reasoning_content.append(reasoning_content)
+		for tool_call in delta.get('tool_calls') or ():
+			self._add_tool_call(builder, choice_index, tool_call)
+
+	def _add_tool_call(self, builder: _ChoiceBuilder, choice_index: int, tool_call: Any) -> None:
+		index = tool_call.get('index') or 0
+		call = builder.tool_calls.get(index)
+		if call is None:
+			call = builder.tool_calls[index] = _ToolCallBuilder()
+		if call.id is None:
+			call.id = tool_call.get('id')
+		if call.type is None:
+			call.type = tool_call.get('type')
+		function = tool_call.get('function')
+		if function is None:
+			return
+		if call.name is None:
+			call.name = function.get('name')
+		arguments = function.get('arguments')
+		if arguments:
+			call.arguments.append(arguments)
+			if self._tool_call_listeners and not call.dispatched and call.scan(arguments):
+				self._dispatch(call, choice_index, index, final=False)
+
+	def _dispatch(self, call: _ToolCallBuilder, choice_index: int, index: int, *, final: bool) -> None:
+		streamed = call.to_streamed(choice_index, index, final=final)
+		if streamed is None:
+			return
+		call.dispatched = True
+		for listener in self._tool_call_listeners:
+			listener(streamed)
+
+	def _flush_tool_calls(self, builder: _ChoiceBuilder, choice_index: int) -> None:
+		if not self._tool_call_listeners:
+			return
+		for index in sorted(builder.tool_calls):
+			call = builder.tool_calls[index]
+			if not call.dispatched:
+				self._dispatch(call, choice_index, index, final=True)
+
+	def finish(self) -> None:
+		"""Notify listeners of every tool call that has not been dispatched yet."""
+		for choice_index in sorted(self._choices):
+			self._flush_tool_calls(self._choices[choice_index], choice_index)
+
+	def get_completion(self) -> Completion:
+		"""Build the `Completion` from everything accumulated so far."""
+		data: Dict[str, Any] = dict(self._fields)
+		data['choices'] = [self._choices[i].build(i) for i in sorted(self._choices)]
+		usage = self._usage
+		if usage is not None and not isinstance(usage, dict):
+			usage = usage.to_dict()
+		data['usage'] = usage
+		return construct_type(type_=Completion, value=data)
+
+
+class ChatCompletionStream(StreamResponse[ResponseT]):
+	"""
+	Stream of chat completion chunks that also accumulates them into the final `Completion`.
+	"""
+
+	def __init__(self, **kwargs: Any) -> None:
+		self._accumulator = ChatCompletionStreamAccumulator()
+		self._tool_call_executor: Optional[ThreadPoolExecutor] = None
+		super().__init__(**kwargs)
+
+	def __stream__(self) -> Iterator[ResponseT]:
+		accumulator = self._accumulator
+		try:
+			for chunk in super().__stream__():
+				accumulator.add(chunk)
+				yield chunk
+			accumulator.finish()
+		finally:
+			if self._tool_call_executor is not None:
+				# Let submitted tool calls run to completion without blocking the consumer.
+				self._tool_call_executor.shutdown(wait=False)
+
+	def iter_json_events(self, *, schema: Any = None, choice_index: int = 0) -> Iterator[JSONEvent]:
+		"""
+		Parse JSON content (e.g. requested with `response_format={'type': 'json_object'}`) while it
+		streams in, yielding a `JSONEvent` for every value as soon as it is complete.
+
+		Arguments:
+			schema (Any): Type or precompiled validator the finished document is checked against;
+				the final event (with path `()`) then carries the validated value
+			choice_index (int): Choice whose content is parsed
+		"""
+		parser = IncrementalJSONParser(schema=schema)
+		for chunk in self:
+			content = _delta_content(chunk, choice_index)
+			if content:
+				yield from parser.feed(content)
+		parser.close()
+
+	def iter_partial_json(self, *, schema: Any = None, choice_index: int = 0) -> Iterator[Any]:
+		"""
+		Parse JSON content while it streams in, yielding the partially built document after every
+		content delta. The same live object is yielded each time.
+
+		Arguments:
+			schema (Any): Type or precompiled validator the finished document is checked against;
+				the validated value is yielded last
+			choice_index (int): Choice whose content is parsed
+		"""
+		parser = IncrementalJSONParser(schema=schema)
+		for chunk in self:
+			content = _delta_content(chunk, choice_index)
+			if content and not parser.done:
+				parser.feed(content)
+				if parser.value is not None:
+					yield parser.value
+		parser.close()
+		if schema is not None:
+			yield parser.result
+
+	def on_tool_call(self, listener: ToolCallListener) -> ChatCompletionStream[ResponseT]:
+		"""
+		Call `listener` with each `StreamedToolCall` as soon as its arguments are complete.
+
+		The listener runs inline while the stream is being iterated; register it before iterating.
+		"""
+		self._accumulator.add_tool_call_listener(listener)
+		return self
+
+	def dispatch_tool_calls(
+		self,
+		handler: Callable[[StreamedToolCall], _T],
+		*,
+		executor: Optional[Executor] = None,
+	) -> List[Future[_T]]:
+		"""
+		Submit `handler(tool_call)` to `executor` as soon as each tool call's arguments are complete,
+		so tool execution overlaps with the rest of the generation.
+
+		Arguments:
+			handler (Callable[[StreamedToolCall], T]): Executes a single tool call
+			executor (Optional[Executor]): Executor to submit to; defaults to a thread pool owned by the stream
+
+		Returns:
+			A list that is filled with one `Future` per tool call while the stream is iterated
+		"""
+		if executor is None:
+			if self._tool_call_executor is None:
+				self._tool_call_executor = ThreadPoolExecutor(thread_name_prefix='zai-tool-call')
+			executor = self._tool_call_executor
+
+		futures: List[Future[_T]] = []
+		self._accumulator.add_tool_call_listener(lambda call: futures.append(executor.submit(handler, call)))
+		return futures
+
+	def get_final_completion(self) -> Completion:
+		"""
+		Consume the rest of the stream and return the merged `Completion`.
+
+		Chunks that were already iterated over are included, so this can be called at any point.
+		"""
+		for _ in self:
+			pass
+		return self._accumulator.get_completion()
+
+
+class AsyncChatCompletionStream(AsyncStreamResponse[ResponseT]):
+	"""
+	asyncio stream of chat completion chunks that also accumulates them into the final `Completion`.
+	"""
+
+	def __init__(self, **kwargs: Any) -> None:
+		self._accumulator = ChatCompletionStreamAccumulator()
+		super().__init__(**kwargs)
+
+	async def __stream__(self) -> AsyncIterator[ResponseT]:
+		accumulator = self._accumulator
+		async for chunk in super().__stream__():
+			accumulator.add(chunk)
+			yield chunk
+		accumulator.finish()
+
+	async def iter_json_events(self, *, schema: Any = None, choice_index: int = 0) -> AsyncIterator[JSONEvent]:
+		"""
+		Parse JSON content (e.g. requested with `response_format={'type': 'json_object'}`) while it
+		streams in, yielding a `JSONEvent` for every value as soon as it is complete.
+
+		Arguments:
+			schema (Any): Type or precompiled validator the finished document is checked against;
+				the final event (with path `()`) then carries the validated value
+			choice_index (int): Choice whose content is parsed
+		"""
+		parser = IncrementalJSONParser(schema=schema)
+		async for chunk in self:
+			content = _delta_content(chunk, choice_index)
+			if content:
+				for event in parser.feed(content):
+					yield event
+		parser.close()
+
+	async def iter_partial_json(self, *, schema: Any = None, choice_index: int = 0) -> AsyncIterator[Any]:
+		"""
+		Parse JSON content while it streams in, yielding the partially built document after every
+		content delta. The same live object is yielded each time.
+
+		Arguments:
+			schema (Any): Type or precompiled validator the finished document is checked against;
+				the validated value is yielded last
+			choice_index (int): Choice whose content is parsed
+		"""
+		parser = IncrementalJSONParser(schema=schema)
+		async for chunk in self:
+			content = _delta_content(chunk, choice_index)
+			if content and not parser.done:
+				parser.feed(content)
+				if parser.value is not None:
+					yield parser.value
+		parser.close()
+		if schema is not None:
+			yield parser.result
+
+	def on_tool_call(self, listener: ToolCallListener) -> AsyncChatCompletionStream[ResponseT]:
+		"""
+		Call `listener` with each `StreamedToolCall` as soon as its arguments are complete.
+
+		The listener runs inline while the stream is being iterated; register it before iterating.
+		"""
+		self._accumulator.add_tool_call_listener(listener)
+		return self
+
+	def dispatch_tool_calls(
+		self,
+		handler: Callable[[StreamedToolCall], Union[Awaitable[_T], _T]],
+		*,
+		executor: Optional[Executor] = None,
+	) -> List[asyncio.Future[_T]]:
+		"""
+		Start `handler(tool_call)` as soon as each tool call's arguments are complete, so tool
+		execution overlaps with the rest of the generation.
+
+		Async handlers (coroutine functions, also behind `functools.partial` or as an async
+		`__call__`) are called on the running event loop; other callables are run in `executor` (the
+		loop's default executor if not given). Whenever a handler returns an awaitable, e.g. a
+		decorated coroutine function, it is awaited on the loop.
+
+		Arguments:
+			handler (Callable[[StreamedToolCall], Awaitable[T] | T]): Executes a single tool call
+			executor (Optional[Executor]): Executor for plain callables
+
+		Returns:
+			A list that is filled with one future per tool call while the stream is iterated
+		"""
+		futures: List[asyncio.Future[_T]] = []
+		on_loop = _is_async_callable(handler)
+
+		async def run(call: StreamedToolCall) -> _T:
+			if on_loop:
+				result = handler(call)
+			else:
+				result = await asyncio.get_running_loop().run_in_executor(executor, handler, call)
+			if inspect.isawaitable(result):
+				result = await result
+			return result
+
+		def listener(call: StreamedToolCall) -> None:
+			futures.append(asyncio.ensure_future(run(call)))
+
+		self._accumulator.add_tool_call_listener(listener)
+		return futures
+
+	async def get_final_completion(self) -> Completion:
+		"""
+		Consume the rest of the stream and return the merged `Completion`.
+
+		Chunks that were already iterated over are included, so this can be called at any point.
+		"""
+		async for _ in self:
+			pass
+		return self._accumulator.get_completion()
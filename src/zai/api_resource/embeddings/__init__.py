@@ -1,3 +1,13 @@
-from .embeddings import Embeddings
+from .embedding_batcher import AsyncEmbeddingBatcher, EmbeddingBatcher
+from .embedding_cache import EmbeddingCache, MemoryEmbeddingCache, SQLiteEmbeddingCache
+from .embeddings import AsyncEmbeddings, Embeddings
 
-__all__ = ['Embeddings']
+__all__ = [
+	'Embeddings',
+	'AsyncEmbeddings',
+	'EmbeddingCache',
+	'MemoryEmbeddingCache',
+	'SQLiteEmbeddingCache',
+	'EmbeddingBatcher',
+	'AsyncEmbeddingBatcher',
+]
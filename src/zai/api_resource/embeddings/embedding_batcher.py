@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import anyio
+
+from zai.core import NOT_GIVEN, NotGiven
+from zai.types.embeddings import Embedding
+
+if TYPE_CHECKING:
+	from .embeddings import AsyncEmbeddings, Embeddings
+
+
+class _Batch:
+	__slots__ = ('texts', 'full', 'done', 'results', 'error', 'abandoned')
+
+	def __init__(self, full: Any, done: Any) -> None:
+		self.texts: List[str] = []
+		self.full = full
+		self.done = done
+		self.results: List[Embedding] = []
+		self.error: Optional[BaseException] = None
+		# set when the dispatching caller was interrupted; the other callers then enqueue again
+		self.abandoned = False
+
+
+def _split_response(batch: _Batch, data: List[Embedding]) -> None:
+	if len(data) != len(batch.texts):
+		raise ValueError(f'Expected {len(batch.texts)} embeddings but received {len(data)}')
+	batch.results = sorted(data, key=lambda item: item.index if item.index is not None else 0)
+
+
+class EmbeddingBatcher:
+	"""
+	Merges concurrent single-text embedding calls from many threads into one `/embeddings` request.
+
+	The first caller of a batch waits up to `max_wait_ms` for more texts, or until `max_batch_size`
+	texts are collected, then sends them in one request; every caller receives its own `Embedding`.
+	Use `Embeddings.batcher` to create one.
+
+	Arguments:
+		embeddings (Embeddings): The resource used to send the batched requests
+		model (str): Model name to use for embedding generation
+		dimensions (int): Number of dimensions for the embedding vectors
+		encoding_format (str): Format for encoding the embeddings
+		max_batch_size (int): Maximum number of texts per request
+		max_wait_ms (float): How long the first text of a batch waits for others
+
+	Attributes:
+		requests (int): Upstream requests sent
+	"""
+
+	def __init__(
+		self,
+		embeddings: Embeddings,
+		*,
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		max_batch_size: int = 64,
+		max_wait_ms: float = 5.0,
+	) -> None:
+		self._embeddings = embeddings
+		self.model = model
+		self.dimensions = dimensions
+		self.encoding_format = encoding_format
+		self.max_batch_size = max_batch_size
+		self.max_wait_ms = max_wait_ms
+		self.requests = 0
+		self._open: Optional[_Batch] = None
+		self._lock = threading.Lock()
+
+	def embed(self, text: str) -> Embedding:
+		"""Return the embedding of `text`, sent together with concurrent calls."""
+		while True:
+			with self._lock:
+				batch = self._open
+				leader = batch is None
+				if batch is None:
+					batch = self._open = _Batch(threading.Event(), threading.Event())
+				index = len(batch.texts)
+				batch.texts.append(text)
+				if len(batch.texts) >= self.max_batch_size:
+					self._open = None
+					batch.full.set()
+
+			if leader:
+				try:
+					batch.full.wait(self.max_wait_ms / 1000)
+					self._close(batch)
+					self._dispatch(batch)
+				finally:
+					if not batch.done.is_set():
+						self._close(batch)
+						batch.abandoned = True
+						batch.done.set()
+			else:
+				batch.done.wait()
+
+			if not batch.abandoned:
+				if batch.error is not None:
+					raise batch.error
+				return batch.results[index]
+
+	def _close(self, batch: _Batch) -> None:
+		with self._lock:
+			if self._open is batch:
+				self._open = None
+
+	def _dispatch(self, batch: _Batch) -> None:
+		with self._lock:
+			self.requests += 1
+		try:
+			response = self._embeddings.create(
+				input=batch.texts,
+				model=self.model,
+				dimensions=self.dimensions,
+				encoding_format=self.encoding_format,
+			)
+			_split_response(batch, response.data)
+		except Exception as err:
+			batch.error = err
+		batch.done.set()
+
+
+class AsyncEmbeddingBatcher:
+	"""
+	Merges concurrent single-text embedding calls from many tasks into one `/embeddings` request.
+
+	The first caller of a batch waits up to `max_wait_ms` for more texts, or until `max_batch_size`
+	texts are collected, then sends them in one request; every caller receives its own `Embedding`.
+	Use `AsyncEmbeddings.batcher` to create one.
+
+	Arguments:
+		embeddings (AsyncEmbeddings): The resource used to send the batched requests
+		model (str): Model name to use for embedding generation
+		dimensions (int): Number of dimensions for the embedding vectors
+		encoding_format (str): Format for encoding the embeddings
+		max_batch_size (int): Maximum number of texts per request
+		max_wait_ms (float): How long the first text of a batch waits for others
+
+	Attributes:
+		requests (int): Upstream requests sent
+	"""
+
+	def __init__(
+		self,
+		embeddings: AsyncEmbeddings,
+		*,
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		max_batch_size: int = 64,
+		max_wait_ms: float = 5.0,
+	) -> None:
+		self._embeddings = embeddings
+		self.model = model
+		self.dimensions = dimensions
+		self.encoding_format = encoding_format
+		self.max_batch_size = max_batch_size
+		self.max_wait_ms = max_wait_ms
+		self.requests = 0
+		self._open: Optional[_Batch] = None
+
+	async def embed(self, text: str) -> Embedding:
+		"""Return the embedding of `text`, sent together with concurrent calls."""
+		while True:
+			batch = self._open
+			leader = batch is None
+			if batch is None:
+				batch = self._open = _Batch(anyio.Event(), anyio.Event())
+			index = len(batch.texts)
+			batch.texts.append(text)
+			if len(batch.texts) >= self.max_batch_size:
+				self._open = None
+				batch.full.set()
+
+			if leader:
+				try:
+					with anyio.move_on_after(self.max_wait_ms / 1000):
+						await batch.full.wait()
+					self._close(batch)
+					await self._dispatch(batch)
+				finally:
+					if not batch.done.is_set():
+						self._close(batch)
+						batch.abandoned = True
+						batch.done.set()
+			else:
+				await batch.done.wait()
+
+			if not batch.abandoned:
+				if batch.error is not None:
+					raise batch.error
+				return batch.results[index]
+
+	def _close(self, batch: _Batch) -> None:
+		if self._open is batch:
+			self._open = None
+
+	async def _dispatch(self, batch: _Batch) -> None:
+		self.requests += 1
+		try:
+			response = await self._embeddings.create(
+				input=batch.texts,
+				model=self.model,
+				dimensions=self.dimensions,
+				encoding_format=self.encoding_format,
+			)
+			_split_response(batch, response.data)
+		except Exception as err:
+			batch.error = err
+		batch.done.set()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from typing_extensions import Protocol
+
+from zai.types.chat.chat_completion import CompletionUsage
+from zai.types.embeddings import Embedding, EmbeddingsResponded
+
+# (model, dimensions, sha256 of the text); dimensions is 0 when the model default is used
+EmbeddingKey = Tuple[str, int, str]
+
+
+def embedding_key(model: str, dimensions: Optional[int], text: str) -> EmbeddingKey:
+	return model, dimensions or 0, hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+	"""Encode a vector as little-endian float32."""
+	packed = array('f', vector)
+	if sys.byteorder == 'big':
+		packed.byteswap()
+	return packed.tobytes()
+
+
+def unpack_vector(blob: bytes) -> array:
+	"""Decode a little-endian float32 blob written by `pack_vector`."""
+	vector = array('f')
+	vector.frombytes(blob)
+	if sys.byteorder == 'big':
+		vector.byteswap()
+	return vector
+
+
+class EmbeddingCacheBackend(Protocol):
+	def get_many(self, keys: Sequence[EmbeddingKey]) -> List[Optional[bytes]]: ...
+
+	def set_many(self, items: Sequence[Tuple[EmbeddingKey, bytes]]) -> None: ...
+
+
+class MemoryEmbeddingCache:
+	"""
+	In-process LRU of float32 vectors.
+
+	Arguments:
+		max_entries (int): Least recently used vectors are evicted beyond this many entries
+	"""
+
+	def __init__(self, max_entries: int = 100_000) -> None:
+		self.max_entries = max_entries
+		self._entries: OrderedDict[EmbeddingKey, bytes] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get_many(self, keys: Sequence[EmbeddingKey]) -> List[Optional[bytes]]:
+		with self._lock:
+			blobs = []
+			for key in keys:
+				blob = self._entries.get(key)
+				if blob is not None:
+					self._entries.move_to_end(key)
+				blobs.append(blob)
+			return blobs
+
+	def set_many(self, items: Sequence[Tuple[EmbeddingKey, bytes]]) -> None:
+		with self._lock:
+			for key, blob in items:
+				self._entries[key] = blob
+				self._entries.move_to_end(key)
+			while len(self._entries) > self.max_entries:
+				self._entries.popitem(last=False)
+
+
+class SQLiteEmbeddingCache:
+	"""
+	Persistent store of float32 vectors in a SQLite database that several processes can share.
+
+	Arguments:
+		path (str | os.PathLike): Database file, created if missing
+	"""
+
+	# SQLite limits the number of bound parameters per statement
+	_LOOKUP_CHUNK = 300
+
+	def __init__(self, path: str | os.PathLike[str]) -> None:
+		self.path = os.fspath(path)
+		self._local = threading.local()
+		with self._connect() as conn:
+			conn.execute(
+				'CREATE TABLE IF NOT EXISTS embeddings ('
+				'model TEXT NOT NULL, dimensions INTEGER NOT NULL, text_sha256 TEXT NOT NULL, vector BLOB NOT NULL, '
+				'PRIMARY KEY (model, dimensions, text_sha256))'
+			)
+
+	def _connect(self) -> sqlite3.Connection:
+		conn = getattr(self._local, 'conn', None)
+		if conn is None:
+			conn = sqlite3.connect(self.path, timeout=30)
+			conn.execute('PRAGMA journal_mode=WAL')
+			conn.execute('PRAGMA synchronous=NORMAL')
+			self._local.conn = conn
+		return conn
+
+	def get_many(self, keys: Sequence[EmbeddingKey]) -> List[Optional[bytes]]:
+		conn = self._connect()
+		found: Dict[EmbeddingKey, bytes] = {}
+		by_group: Dict[Tuple[str, int], List[str]] = {}
+		for model, dimensions, digest in keys:
+			by_group.setdefault((model, dimensions), []).append(digest)
+		for (model, dimensions), digests in by_group.items():
+			for start in range(0, len(digests), self._LOOKUP_CHUNK):
+				chunk = digests[start : start + self._LOOKUP_CHUNK]
+				rows = conn.execute(
+					'SELECT text_sha256, vector FROM embeddings WHERE model = ? AND dimensions = ? '
+					f'AND text_sha256 IN ({",".join("?" * len(chunk))})',
+					(model, dimensions, *chunk),
+				)
+				for digest, blob in rows:
+					found[(model, dimensions, digest)] = bytes(blob)
+		return [found.get(key) for key in keys]
+
+	def set_many(self, items: Sequence[Tuple[EmbeddingKey, bytes]]) -> None:
+		with self._connect() as conn:
+			conn.executemany(
+				'INSERT OR REPLACE INTO embeddings (model, dimensions, text_sha256, vector) VALUES (?, ?, ?, ?)',
+				[(model, dimensions, digest, blob) for (model, dimensions, digest), blob in items],
+			)
+
+	def close(self) -> None:
+		conn = getattr(self._local, 'conn', None)
+		if conn is not None:
+			conn.close()
+			self._local.conn = None
+
+
+class EmbeddingCache:
+	"""
+	Content-addressed cache of embedding vectors keyed by (model, dimensions, sha256(text)).
+
+	`Embeddings.create` looks every text input up first, sends only the misses upstream in a
+	single request and merges the results back in input order. Vectors are stored as float32.
+
+	Arguments:
+		backend (Optional[EmbeddingCacheBackend]): Where vectors are kept, a `MemoryEmbeddingCache` by default
+
+	Attributes:
+		hits (int): Inputs answered from the cache, not counting repeats of a text sent upstream
+		misses (int): Distinct texts sent upstream
+	"""
+
+	def __init__(self, backend: Optional[EmbeddingCacheBackend] = None) -> None:
+		self.backend: EmbeddingCacheBackend = backend if backend is not None else MemoryEmbeddingCache()
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+
+	def lookup(self, model: str, dimensions: Optional[int], texts: Sequence[str]) -> EmbeddingCacheLookup:
+		return EmbeddingCacheLookup(self, model, dimensions, texts)
+
+
+class EmbeddingCacheLookup:
+	"""
+	Cached vectors for one `Embeddings.create` call.
+
+	Attributes:
+		missing (List[str]): Distinct texts that have to be embedded upstream, in input order
+	"""
+
+	def __init__(self, cache: EmbeddingCache, model: str, dimensions: Optional[int], texts: Sequence[str]) -> None:
+		self._cache = cache
+		self._model = model
+		self._texts = texts
+		self._keys = [embedding_key(model, dimensions, text) for text in texts]
+		self._blobs = cache.backend.get_many(self._keys)
+		self.missing = list(dict.fromkeys(text for text, blob in zip(texts, self._blobs) if blob is None))
+		with cache._lock:
+			cache.hits += sum(blob is not None for blob in self._blobs)
+			cache.misses += len(self.missing)
+
+	def merge(self, response: Optional[EmbeddingsResponded]) -> EmbeddingsResponded:
+		"""
+		Store the vectors of `response`, the answer for `missing`, and build the response for all inputs.
+
+		Fetched vectors are returned as the API sent them; only cache hits are float32. Usage only
+		counts the tokens of the upstream request.
+		"""
+		fetched: Dict[str, List[float]] = {}
+		if response is not None:
+			data = sorted(response.data, key=lambda item: item.index if item.index is not None else 0)
+			if len(data) != len(self.missing):
+				raise ValueError(f'Expected {len(self.missing)} embeddings but received {len(data)}')
+			fetched = {text: item.embedding for text, item in zip(self.missing, data)}
+			keys = {text: key for text, key in zip(self._texts, self._keys)}
+			self._cache.backend.set_many([(keys[text], pack_vector(vector)) for text, vector in fetched.items()])
+
+		embeddings = [
+			Embedding(
+				object='embedding',
+				index=index,
+				embedding=unpack_vector(blob).tolist() if blob is not None else fetched[text],
+			)
+			for index, (text, blob) in enumerate(zip(self._texts, self._blobs))
+		]
+		usage = response.usage if response is not None else CompletionUsage(
+			prompt_tokens=0, completion_tokens=0, total_tokens=0
+		)
+		return EmbeddingsResponded(
+			object='list',
+			data=embeddings,
+			model=response.model if response is not None else self._model,
+			usage=usage,
+		)
@@ -1,14 +1,85 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
 
+import anyio
 import httpx
 
-from zai.core import NOT_GIVEN, BaseAPI, Body, Headers, NotGiven, make_request_options
-from zai.types.embeddings import EmbeddingsResponded
+from zai.core import (
+	NOT_GIVEN,
+	AsyncBaseAPI,
+	BaseAPI,
+	Body,
+	Headers,
+	NotGiven,
+	estimate_tokens,
+	make_request_options,
+)
+from zai.types.chat.chat_completion import CompletionUsage
+from zai.types.embeddings import Embedding, EmbeddingsResponded
+
+from .embedding_batcher import AsyncEmbeddingBatcher, EmbeddingBatcher
+from .embedding_cache import EmbeddingCacheLookup
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
+
+
+def _cache_lookup(
+	client: object,
+	input: object,
+	model: str,
+	dimensions: Optional[int] | NotGiven,
+	encoding_format: str | NotGiven,
+	disable_strict_validation: Optional[bool] | None,
+) -> Optional[EmbeddingCacheLookup]:
+	cache = getattr(client, 'embedding_cache', None)
+	if cache is None or disable_strict_validation or encoding_format not in (NOT_GIVEN, 'float'):
+		return None
+	texts = [input] if isinstance(input, str) else input
+	if not isinstance(texts, list) or not texts or not all(isinstance(text, str) for text in texts):
+		return None
+	return cache.lookup(model, None if isinstance(dimensions, NotGiven) else dimensions, texts)
+
+
+def _split_batches(
+	inputs: Sequence[Union[str, List[int]]], batch_size: int, max_batch_tokens: int
+) -> List[List[Union[str, List[int]]]]:
+	"""Split `inputs` into consecutive batches of at most `batch_size` items and about `max_batch_tokens` tokens."""
+	batches: List[List[Union[str, List[int]]]] = []
+	batch: List[Union[str, List[int]]] = []
+	tokens = 0
+	for item in inputs:
+		item_tokens = estimate_tokens({'input': item}) if isinstance(item, str) else len(item)
+		if batch and (len(batch) >= batch_size or tokens + item_tokens > max_batch_tokens):
+			batches.append(batch)
+			batch, tokens = [], 0
+		batch.append(item)
+		tokens += item_tokens
+	if batch:
+		batches.append(batch)
+	return batches
+
+
+def _merge_batches(model: str, responses: Sequence[EmbeddingsResponded]) -> EmbeddingsResponded:
+	data: List[Embedding] = []
+	for response in responses:
+		for item in sorted(response.data, key=lambda item: item.index if item.index is not None else 0):
+			data.append(Embedding.construct(object=item.object, index=len(data), embedding=item.embedding))
+	# responses are not validated, so a batch may come back without usage or with fields missing
+	usages = [response.usage for response in responses if response.usage is not None]
+	return EmbeddingsResponded(
+		object='list',
+		data=data,
+		model=responses[0].model if responses else model,
+		usage=CompletionUsage(
+			prompt_tokens=sum(usage.prompt_tokens or 0 for usage in usages),
+			completion_tokens=sum(usage.completion_tokens or 0 for usage in usages),
+			total_tokens=sum(usage.total_tokens or 0 for usage in usages),
+		),
+	)
 
 
 class Embeddings(BaseAPI):
@@ -36,15 +107,203 @@ class Embeddings(BaseAPI):
 		extra_body: Body | None = None,
 		disable_strict_validation: Optional[bool] | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> EmbeddingsResponded:
 		"""
 		Create embeddings for the given input
 
+		With an `embedding_cache` on the client only the texts missing from it are sent upstream.
+
 		Arguments:
 			input (Union[str, List[str], List[int], List[List[int]]]): Input text or tokens to embed
 			model (str): Model name to use for embedding generation
 			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings; with 'base64' the vectors are decoded
+				into float32 numpy arrays, or `array('f')` if numpy is not installed
+			user (str): User identifier
+			request_id (Optional[str]): Request identifier
+			sensitive_word_check (Optional[object]): Sensitive word checking configuration
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			disable_strict_validation (Optional[bool]): Whether to disable strict validation
+			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds across all attempts and retries
+		"""
+		cached = _cache_lookup(self._client, input, model, dimensions, encoding_format, disable_strict_validation)
+		if cached is not None:
+			if not cached.missing:
+				return cached.merge(None)
+			input = cached.missing
+		_cast_type = EmbeddingsResponded
+		if disable_strict_validation:
+			_cast_type = object
+		response = self._post(
+			'/embeddings',
+			body={
+				'input': input,
+				'model': model,
+				'dimensions': dimensions,
+				'encoding_format': encoding_format,
+				'user': user,
+				'request_id': request_id,
+				'sensitive_word_check': sensitive_word_check,
+			},
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=_cast_type,
+			stream=False,
+		)
+		if cached is not None:
+			return cached.merge(response)
+		if encoding_format == 'base64' and isinstance(response, EmbeddingsResponded):
+			response.decode_base64()
+		return response
+
+	def create_many(
+		self,
+		*,
+		inputs: Sequence[Union[str, List[int]]],
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		batch_size: int = 64,
+		max_batch_tokens: int = 32_000,
+		max_concurrency: int = 4,
+		batch_retries: int = 2,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> EmbeddingsResponded:
+		"""
+		Create embeddings for any number of inputs in concurrent batched requests
+
+		The inputs are split by count and estimated tokens. A failed batch is retried on its own;
+		the embeddings are returned in input order and `usage` is summed over all batches.
+
+		Arguments:
+			inputs (Sequence[Union[str, List[int]]]): Texts or token lists to embed
+			model (str): Model name to use for embedding generation
+			dimensions (int): Number of dimensions for the embedding vectors
+			batch_size (int): Maximum number of inputs per request
+			max_batch_tokens (int): Maximum estimated tokens per request
+			max_concurrency (int): Maximum number of requests in flight
+			batch_retries (int): How often a failed batch is sent again after the client's own retries
+			encoding_format (str): Format for encoding the embeddings, see `create`
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds for each batch across all attempts and retries
+		"""
+
+		def create_batch(batch: List[Union[str, List[int]]]) -> EmbeddingsResponded:
+			retry = 0
+			while True:
+				try:
+					return self.create(
+						input=batch,
+						model=model,
+						dimensions=dimensions,
+						encoding_format=encoding_format,
+						user=user,
+						extra_headers=extra_headers,
+						extra_body=extra_body,
+						timeout=timeout,
+						deadline=deadline,
+					)
+				except Exception as err:
+					delay = None
+					if retry < batch_retries:
+						delay = self._client.retry_policy.delay_after_error(err, retry, '/embeddings')
+					if delay is None:
+						raise
+				time.sleep(delay)
+				retry += 1
+
+		batches = _split_batches(inputs, batch_size, max_batch_tokens)
+		if len(batches) <= 1 or max_concurrency <= 1:
+			return _merge_batches(model, [create_batch(batch) for batch in batches])
+
+		with ThreadPoolExecutor(min(max_concurrency, len(batches)), thread_name_prefix='zai-embeddings') as pool:
+			futures = [pool.submit(create_batch, batch) for batch in batches]
+			try:
+				responses = [future.result() for future in futures]
+			except BaseException:
+				for future in futures:
+					future.cancel()
+				raise
+		return _merge_batches(model, responses)
+
+	def batcher(
+		self,
+		*,
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		max_batch_size: int = 64,
+		max_wait_ms: float = 5.0,
+	) -> EmbeddingBatcher:
+		"""
+		Create a dispatcher that merges concurrent single-text calls into batched requests
+
+		Arguments:
+			model (str): Model name to use for embedding generation
+			dimensions (int): Number of dimensions for the embedding vectors
 			encoding_format (str): Format for encoding the embeddings
+			max_batch_size (int): Maximum number of texts per request
+			max_wait_ms (float): How long the first text of a batch waits for others
+		"""
+		return EmbeddingBatcher(
+			self,
+			model=model,
+			dimensions=dimensions,
+			encoding_format=encoding_format,
+			max_batch_size=max_batch_size,
+			max_wait_ms=max_wait_ms,
+		)
+
+
+class AsyncEmbeddings(AsyncBaseAPI):
+	"""
+	asyncio embeddings API resource
+
+	Attributes:
+		client (AsyncZaiClient): The asyncio ZAI client instance
+	"""
+
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		input: Union[str, List[str], List[int], List[List[int]]],
+		model: Union[str],
+		dimensions: Union[int] | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		sensitive_word_check: Optional[object] | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		disable_strict_validation: Optional[bool] | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> EmbeddingsResponded:
+		"""
+		Create embeddings for the given input
+
+		With an `embedding_cache` on the client only the texts missing from it are sent upstream.
+
+		Arguments:
+			input (Union[str, List[str], List[int], List[List[int]]]): Input text or tokens to embed
+			model (str): Model name to use for embedding generation
+			dimensions (Union[int]): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings; with 'base64' the vectors are decoded
+				into float32 numpy arrays, or `array('f')` if numpy is not installed
 			user (str): User identifier
 			request_id (Optional[str]): Request identifier
 			sensitive_word_check (Optional[object]): Sensitive word checking configuration
@@ -52,11 +311,17 @@ class Embeddings(BaseAPI):
 			extra_body (Body): Additional request body parameters
 			disable_strict_validation (Optional[bool]): Whether to disable strict validation
 			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds across all attempts and retries
 		"""
+		cached = _cache_lookup(self._client, input, model, dimensions, encoding_format, disable_strict_validation)
+		if cached is not None:
+			if not cached.missing:
+				return cached.merge(None)
+			input = cached.missing
 		_cast_type = EmbeddingsResponded
 		if disable_strict_validation:
 			_cast_type = object
-		return self._post(
+		response = await self._post(
 			'/embeddings',
 			body={
 				'input': input,
@@ -67,7 +332,127 @@ class Embeddings(BaseAPI):
 				'request_id': request_id,
 				'sensitive_word_check': sensitive_word_check,
 			},
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=_cast_type,
 			stream=False,
 		)
+		if cached is not None:
+			return cached.merge(response)
+		if encoding_format == 'base64' and isinstance(response, EmbeddingsResponded):
+			response.decode_base64()
+		return response
+
+	async def create_many(
+		self,
+		*,
+		inputs: Sequence[Union[str, List[int]]],
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		batch_size: int = 64,
+		max_batch_tokens: int = 32_000,
+		max_concurrency: int = 4,
+		batch_retries: int = 2,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		user: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> EmbeddingsResponded:
+		"""
+		Create embeddings for any number of inputs in concurrent batched requests
+
+		The inputs are split by count and estimated tokens. A failed batch is retried on its own;
+		the embeddings are returned in input order and `usage` is summed over all batches.
+
+		Arguments:
+			inputs (Sequence[Union[str, List[int]]]): Texts or token lists to embed
+			model (str): Model name to use for embedding generation
+			dimensions (int): Number of dimensions for the embedding vectors
+			batch_size (int): Maximum number of inputs per request
+			max_batch_tokens (int): Maximum estimated tokens per request
+			max_concurrency (int): Maximum number of requests in flight
+			batch_retries (int): How often a failed batch is sent again after the client's own retries
+			encoding_format (str): Format for encoding the embeddings, see `create`
+			user (str): User identifier
+			extra_headers (Headers): Additional HTTP headers
+			extra_body (Body): Additional request body parameters
+			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds for each batch across all attempts and retries
+		"""
+
+		async def create_batch(batch: List[Union[str, List[int]]]) -> EmbeddingsResponded:
+			retry = 0
+			while True:
+				try:
+					return await self.create(
+						input=batch,
+						model=model,
+						dimensions=dimensions,
+						encoding_format=encoding_format,
+						user=user,
+						extra_headers=extra_headers,
+						extra_body=extra_body,
+						timeout=timeout,
+						deadline=deadline,
+					)
+				except Exception as err:
+					delay = None
+					if retry < batch_retries:
+						delay = self._client.retry_policy.delay_after_error(err, retry, '/embeddings')
+					if delay is None:
+						raise
+				await anyio.sleep(delay)
+				retry += 1
+
+		batches = _split_batches(inputs, batch_size, max_batch_tokens)
+		responses: List[Optional[EmbeddingsResponded]] = [None] * len(batches)
+		errors: List[Exception] = []
+		limiter = anyio.CapacityLimiter(max(1, max_concurrency))
+
+		async with anyio.create_task_group() as tg:
+
+			async def run(index: int, batch: List[Union[str, List[int]]]) -> None:
+				async with limiter:
+					try:
+						responses[index] = await create_batch(batch)
+					except Exception as err:
+						errors.append(err)
+						tg.cancel_scope.cancel()
+
+			for index, batch in enumerate(batches):
+				tg.start_soon(run, index, batch)
+
+		if errors:
+			raise errors[0]
+		return _merge_batches(model, [response for response in responses if response is not None])
+
+	def batcher(
+		self,
+		*,
+		model: str,
+		dimensions: int | NotGiven = NOT_GIVEN,
+		encoding_format: str | NotGiven = NOT_GIVEN,
+		max_batch_size: int = 64,
+		max_wait_ms: float = 5.0,
+	) -> AsyncEmbeddingBatcher:
+		"""
+		Create a dispatcher that merges concurrent single-text calls into batched requests
+
+		Arguments:
+			model (str): Model name to use for embedding generation
+			dimensions (int): Number of dimensions for the embedding vectors
+			encoding_format (str): Format for encoding the embeddings
+			max_batch_size (int): Maximum number of texts per request
+			max_wait_ms (float): How long the first text of a batch waits for others
+		"""
+		return AsyncEmbeddingBatcher(
+			self,
+			model=model,
+			dimensions=dimensions,
+			encoding_format=encoding_format,
+			max_batch_size=max_batch_size,
+			max_wait_ms=max_wait_ms,
+		)
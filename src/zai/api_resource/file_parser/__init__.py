@@ -1,3 +1,3 @@
-from .file_parser import FileParser
+from .file_parser import AsyncFileParser, FileParser
 
-__all__ = ['FileParser']
+__all__ = ['FileParser', 'AsyncFileParser']
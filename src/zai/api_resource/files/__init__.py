@@ -1,3 +1,4 @@
-from .files import Files, FilesWithRawResponse
+from .files import AsyncFiles, Files, FilesWithRawResponse
+from .upload_index import UploadIndex
 
-__all__ = ['Files', 'FilesWithRawResponse']
+__all__ = ['Files', 'AsyncFiles', 'FilesWithRawResponse', 'UploadIndex']
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Mapping, cast
+import os
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Mapping, Optional, Sequence, Union, cast
 
+import anyio
 import httpx
 from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	FileTypes,
@@ -19,6 +26,9 @@ from zai.core import (
 	make_request_options,
 	maybe_transform,
 )
+from zai.core._constants import RAW_RESPONSE_HEADER
+from zai.core._download import DEFAULT_PART_SIZE, async_download_to_path, download_to_path
+from zai.core._errors import APIStatusError
 from zai.types.files import (
 	FileDeleted,
 	FileObject,
@@ -27,8 +37,23 @@ from zai.types.files import (
 	file_create_params,
 )
 
+from .upload_index import file_sha256
+
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
+
+# only these answers to the existence probe mean an indexed file is gone; other errors are raised
+_GONE_STATUSES = (404, 410)
+
+
+def _probe_options(
+	extra_headers: Headers | None,
+	timeout: float | httpx.Timeout | None | NotGiven,
+	deadline: float | None | NotGiven,
+) -> Mapping[str, object]:
+	# the first byte of the content is enough to learn whether the file still exists
+	headers = {**(extra_headers or {}), RAW_RESPONSE_HEADER: 'stream', 'Range': 'bytes=0-0'}
+	return make_request_options(extra_headers=headers, timeout=timeout, deadline=deadline)
 
 
 class Files(BaseAPI):
@@ -46,9 +71,18 @@ class Files(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> FileObject:
 		if not file and not upload_detail:
 			raise ValueError('At least one of `file` and `upload_detail` must be provided.')
+		index = getattr(self._client, 'upload_index', None)
+		digest = file_sha256(file) if index is not None and file and not upload_detail else None
+		if digest is not None:
+			existing = index.get(digest, purpose, knowledge_id)
+			if existing is not None and self._uploaded_file_exists(existing.id, extra_headers, timeout, deadline):
+				index._count(hit=True)
+				return existing
+			index._count(hit=False)
 		body = deepcopy_minimal(
 			{
 				'file': file,
@@ -67,13 +101,40 @@ class Files(BaseAPI):
 				'Content-Type': 'multipart/form-data',
 				**(extra_headers or {}),
 			}
-		return self._post(
+		created = self._post(
 			'/files',
 			body=maybe_transform(body, file_create_params.FileCreateParams),
 			files=files,
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=FileObject,
 		)
+		if digest is not None:
+			index.set(digest, purpose, knowledge_id, created)
+		return created
+
+	def _uploaded_file_exists(
+		self,
+		file_id: Optional[str],
+		extra_headers: Headers | None,
+		timeout: float | httpx.Timeout | None | NotGiven,
+		deadline: float | None | NotGiven,
+	) -> bool:
+		if not file_id:
+			return False
+		try:
+			response = self._get(
+				f'/files/{file_id}/content',
+				options=_probe_options(extra_headers, timeout, deadline),
+				cast_type=httpx.Response,
+			)
+		except APIStatusError as err:
+			if err.status_code in _GONE_STATUSES:
+				return False
+			raise
+		response.close()
+		return True
 
 	# def retrieve(
 	#         self,
@@ -114,6 +175,7 @@ class Files(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> ListOfFileObject:
 		return self._get(
 			'/files',
@@ -122,6 +184,7 @@ class Files(BaseAPI):
 				extra_headers=extra_headers,
 				extra_body=extra_body,
 				timeout=timeout,
+				deadline=deadline,
 				query={
 					'purpose': purpose,
 					'limit': limit,
@@ -138,6 +201,7 @@ class Files(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> FileDeleted:
 		"""
 		Delete a file.
@@ -149,14 +213,22 @@ class Files(BaseAPI):
 		  extra_body: Add additional JSON properties to the request
 
 		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
 		"""
 		if not file_id:
 			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
-		return self._delete(
+		deleted = self._delete(
 			f'/files/{file_id}',
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=FileDeleted,
 		)
+		index = getattr(self._client, 'upload_index', None)
+		if index is not None:
+			index.forget(file_id)
+		return deleted
 
 	def content(
 		self,
@@ -165,6 +237,7 @@ class Files(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> _legacy_response.HttpxBinaryResponseContent:
 		"""
 		Returns the contents of the specified file.
@@ -175,16 +248,466 @@ class Files(BaseAPI):
 		  extra_body: Add additional JSON properties to the request
 
 		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
 		"""
 		if not file_id:
 			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
 		extra_headers = {'Accept': 'application/binary', **(extra_headers or {})}
 		return self._get(
 			f'/files/{file_id}/content',
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
 		)
 
+	def stream_content_to_path(
+		self,
+		file_id: str,
+		path: str | os.PathLike[str],
+		*,
+		checksum: Optional[str] = None,
+		checksum_algorithm: str = 'sha256',
+		parallel: int = 1,
+		part_size: int = DEFAULT_PART_SIZE,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> pathlib.Path:
+		"""
+		Streams the contents of the specified file to `path` without holding it in memory.
+
+		The content is written to `<path>.part` and renamed once complete. Interrupted transfers are
+		resumed with HTTP Range requests, including by a later call after a sequential download failed.
+
+		Args:
+		  checksum: Expected hex digest of the content, verified before the file is moved into place
+
+		  checksum_algorithm: `hashlib` algorithm of `checksum`
+
+		  parallel: Number of concurrent range requests for large files
+
+		  part_size: Bytes per range request when `parallel` is greater than 1
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for each request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		extra_headers = {'Accept': 'application/binary', **(extra_headers or {})}
+		return download_to_path(
+			self._client,
+			f'/files/{file_id}/content',
+			path,
+			options=make_request_options(extra_headers=extra_headers, timeout=timeout, deadline=deadline),
+			checksum=checksum,
+			checksum_algorithm=checksum_algorithm,
+			parallel=parallel,
+			part_size=part_size,
+		)
+
+	def upload_many(
+		self,
+		files: Sequence[FileTypes],
+		*,
+		purpose: Literal['fine-tune', 'retrieval', 'batch', 'voice-clone-input'],
+		knowledge_id: str = None,
+		sentence_size: int = None,
+		max_concurrency: int = 8,
+		file_retries: int = 2,
+		return_exceptions: bool = False,
+		on_progress: Optional[Callable[[int, int], None]] = None,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> List[Union[FileObject, Exception]]:
+		"""
+		Uploads many files concurrently over the client's connection pool.
+
+		Each file is uploaded with `create` and retried on its own when it fails with a retryable
+		error. The results are returned in input order.
+
+		Args:
+		  files: Paths or other file inputs accepted by `create`
+
+		  max_concurrency: Maximum number of uploads in flight
+
+		  file_retries: How often a failed upload is sent again after the client's own retries
+
+		  return_exceptions: Put the error of a failed upload in its slot instead of raising it
+
+		  on_progress: Called with the number of finished uploads and the total after each upload,
+		    from the worker threads
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for each upload, in seconds
+		"""
+		lock = threading.Lock()
+		finished = [0]
+
+		def upload(file: FileTypes) -> Union[FileObject, Exception]:
+			retry = 0
+			while True:
+				try:
+					result: Union[FileObject, Exception] = self.create(
+						file=file,
+						purpose=purpose,
+						knowledge_id=knowledge_id,
+						sentence_size=sentence_size,
+						extra_headers=extra_headers,
+						timeout=timeout,
+						deadline=deadline,
+					)
+					break
+				except Exception as err:
+					delay = None
+					if retry < file_retries:
+						delay = self._client.retry_policy.delay_after_error(err, retry, '/files')
+					if delay is None:
+						if not return_exceptions:
+							raise
+						result = err
+						break
+				time.sleep(delay)
+				retry += 1
+			with lock:
+				finished[0] += 1
+				if on_progress is not None:
+					on_progress(finished[0], len(files))
+			return result
+
+		if not files:
+			return []
+		with ThreadPoolExecutor(min(max_concurrency, len(files)), thread_name_prefix='zai-upload') as pool:
+			futures = [pool.submit(upload, file) for file in files]
+			try:
+				return [future.result() for future in futures]
+			except BaseException:
+				for future in futures:
+					future.cancel()
+				raise
+
+
+class AsyncFiles(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def create(
+		self,
+		*,
+		file: FileTypes = None,
+		upload_detail: List[UploadDetail] = None,
+		purpose: Literal['fine-tune', 'retrieval', 'batch', 'voice-clone-input'],
+		knowledge_id: str = None,
+		sentence_size: int = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> FileObject:
+		if not file and not upload_detail:
+			raise ValueError('At least one of `file` and `upload_detail` must be provided.')
+		index = getattr(self._client, 'upload_index', None)
+		digest = None
+		if index is not None and file and not upload_detail:
+			# hashing and the index are blocking file I/O, keep them off the event loop
+			digest = await anyio.to_thread.run_sync(file_sha256, file)
+		if digest is not None:
+			existing = await anyio.to_thread.run_sync(index.get, digest, purpose, knowledge_id)
+			if existing is not None and await self._uploaded_file_exists(existing.id, extra_headers, timeout, deadline):
+				index._count(hit=True)
+				return existing
+			index._count(hit=False)
+		body = deepcopy_minimal(
+			{
+				'file': file,
+				'upload_detail': upload_detail,
+				'purpose': purpose,
+				'knowledge_id': knowledge_id,
+				'sentence_size': sentence_size,
+			}
+		)
+		files = extract_files(cast(Mapping[str, object], body), paths=[['file']])
+		if files:
+			# It should be noted that the actual Content-Type header that will be
+			# sent to the server will contain a `boundary` parameter, e.g.
+			# multipart/form-data; boundary=---abc--
+			extra_headers = {
+				'Content-Type': 'multipart/form-data',
+				**(extra_headers or {}),
+			}
+		created = await self._post(
+			'/files',
+			body=maybe_transform(body, file_create_params.FileCreateParams),
+			files=files,
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=FileObject,
+		)
+		if digest is not None:
+			await anyio.to_thread.run_sync(index.set, digest, purpose, knowledge_id, created)
+		return created
+
+	async def _uploaded_file_exists(
+		self,
+		file_id: Optional[str],
+		extra_headers: Headers | None,
+		timeout: float | httpx.Timeout | None | NotGiven,
+		deadline: float | None | NotGiven,
+	) -> bool:
+		if not file_id:
+			return False
+		try:
+			response = await self._get(
+				f'/files/{file_id}/content',
+				options=_probe_options(extra_headers, timeout, deadline),
+				cast_type=httpx.Response,
+			)
+		except APIStatusError as err:
+			if err.status_code in _GONE_STATUSES:
+				return False
+			raise
+		await response.aclose()
+		return True
+
+	async def list(
+		self,
+		*,
+		purpose: str | NotGiven = NOT_GIVEN,
+		limit: int | NotGiven = NOT_GIVEN,
+		after: str | NotGiven = NOT_GIVEN,
+		order: str | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> ListOfFileObject:
+		return await self._get(
+			'/files',
+			cast_type=ListOfFileObject,
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				deadline=deadline,
+				query={
+					'purpose': purpose,
+					'limit': limit,
+					'after': after,
+					'order': order,
+				},
+			),
+		)
+
+	async def delete(
+		self,
+		file_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> FileDeleted:
+		"""
+		Delete a file.
+
+		Args:
+		  file_id: The ID of the file to delete
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		deleted = await self._delete(
+			f'/files/{file_id}',
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=FileDeleted,
+		)
+		index = getattr(self._client, 'upload_index', None)
+		if index is not None:
+			await anyio.to_thread.run_sync(index.forget, file_id)
+		return deleted
+
+	async def content(
+		self,
+		file_id: str,
+		*,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> _legacy_response.HttpxBinaryResponseContent:
+		"""
+		Returns the contents of the specified file.
+
+		Args:
+		  extra_headers: Send extra headers
+
+		  extra_body: Add additional JSON properties to the request
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for this request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		extra_headers = {'Accept': 'application/binary', **(extra_headers or {})}
+		return await self._get(
+			f'/files/{file_id}/content',
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=_legacy_binary_response.HttpxBinaryResponseContent,
+		)
+
+	async def stream_content_to_path(
+		self,
+		file_id: str,
+		path: str | os.PathLike[str],
+		*,
+		checksum: Optional[str] = None,
+		checksum_algorithm: str = 'sha256',
+		parallel: int = 1,
+		part_size: int = DEFAULT_PART_SIZE,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> pathlib.Path:
+		"""
+		Streams the contents of the specified file to `path` without holding it in memory.
+
+		The content is written to `<path>.part` and renamed once complete. Interrupted transfers are
+		resumed with HTTP Range requests, including by a later call after a sequential download failed.
+
+		Args:
+		  checksum: Expected hex digest of the content, verified before the file is moved into place
+
+		  checksum_algorithm: `hashlib` algorithm of `checksum`
+
+		  parallel: Number of concurrent range requests for large files
+
+		  part_size: Bytes per range request when `parallel` is greater than 1
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for each request, in seconds
+		"""
+		if not file_id:
+			raise ValueError(f'Expected a non-empty value for `file_id` but received {file_id!r}')
+		extra_headers = {'Accept': 'application/binary', **(extra_headers or {})}
+		return await async_download_to_path(
+			self._client,
+			f'/files/{file_id}/content',
+			path,
+			options=make_request_options(extra_headers=extra_headers, timeout=timeout, deadline=deadline),
+			checksum=checksum,
+			checksum_algorithm=checksum_algorithm,
+			parallel=parallel,
+			part_size=part_size,
+		)
+
+	async def upload_many(
+		self,
+		files: Sequence[FileTypes],
+		*,
+		purpose: Literal['fine-tune', 'retrieval', 'batch', 'voice-clone-input'],
+		knowledge_id: str = None,
+		sentence_size: int = None,
+		max_concurrency: int = 8,
+		file_retries: int = 2,
+		return_exceptions: bool = False,
+		on_progress: Optional[Callable[[int, int], None]] = None,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> List[Union[FileObject, Exception]]:
+		"""
+		Uploads many files concurrently over the client's connection pool.
+
+		Each file is uploaded with `create` and retried on its own when it fails with a retryable
+		error. The results are returned in input order.
+
+		Args:
+		  files: Paths or other file inputs accepted by `create`
+
+		  max_concurrency: Maximum number of uploads in flight
+
+		  file_retries: How often a failed upload is sent again after the client's own retries
+
+		  return_exceptions: Put the error of a failed upload in its slot instead of raising it
+
+		  on_progress: Called with the number of finished uploads and the total after each upload
+
+		  extra_headers: Send extra headers
+
+		  timeout: Override the client-level default timeout for this request, in seconds
+
+		  deadline: Override the client-level deadline for each upload, in seconds
+		"""
+		results: List[Union[FileObject, Exception, None]] = [None] * len(files)
+		errors: List[Exception] = []
+		limiter = anyio.CapacityLimiter(max(1, max_concurrency))
+		finished = 0
+
+		async with anyio.create_task_group() as tg:
+
+			async def upload(index: int, file: FileTypes) -> None:
+				nonlocal finished
+				retry = 0
+				async with limiter:
+					while True:
+						try:
+							results[index] = await self.create(
+								file=file,
+								purpose=purpose,
+								knowledge_id=knowledge_id,
+								sentence_size=sentence_size,
+								extra_headers=extra_headers,
+								timeout=timeout,
+								deadline=deadline,
+							)
+							break
+						except Exception as err:
+							delay = None
+							if retry < file_retries:
+								delay = self._client.retry_policy.delay_after_error(err, retry, '/files')
+							if delay is None:
+								if return_exceptions:
+									results[index] = err
+									break
+								errors.append(err)
+								tg.cancel_scope.cancel()
+								return
+						await anyio.sleep(delay)
+						retry += 1
+				finished += 1
+				if on_progress is not None:
+					on_progress(finished, len(files))
+
+			for index, file in enumerate(files):
+				tg.start_soon(upload, index, file)
+
+		if errors:
+			raise errors[0]
+		return cast(List[Union[FileObject, Exception]], results)
+
 
 class FilesWithRawResponse:
 	def __init__(self, files: Files) -> None:
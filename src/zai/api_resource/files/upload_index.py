@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+from zai.core import FileTypes, parse_obj
+from zai.core._base_compat import model_json
+from zai.types.files import FileObject
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_stream(stream: io.BufferedIOBase) -> str:
+	digest = hashlib.sha256()
+	for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+		digest.update(chunk)
+	return digest.hexdigest()
+
+
+def file_sha256(file: FileTypes) -> Optional[str]:
+	"""
+	sha256 hex digest of the content of an upload, or `None` when it cannot be read twice.
+
+	Paths are read in chunks; seekable file objects are hashed and rewound to where they were.
+	"""
+	if isinstance(file, tuple):
+		file = file[1]
+	if isinstance(file, bytes):
+		return hashlib.sha256(file).hexdigest()
+	if isinstance(file, os.PathLike):
+		with open(file, 'rb') as stream:
+			return _hash_stream(stream)
+	seekable = getattr(file, 'seekable', None)
+	if seekable is None or not seekable():
+		return None
+	position = file.tell()
+	try:
+		return _hash_stream(file)
+	finally:
+		file.seek(position)
+
+
+class UploadIndex:
+	"""
+	Content-addressed index of uploaded files in a SQLite database that several processes can share.
+
+	With an `upload_index` on the client, `Files.create` hashes the file first and, when the same
+	content was uploaded before with the same purpose and knowledge base and the file still exists
+	on the server, returns that `FileObject` instead of uploading again.
+
+	Arguments:
+		path (str | os.PathLike): Database file, created if missing
+
+	Attributes:
+		hits (int): Uploads answered from the index
+		misses (int): Uploads sent to the server
+	"""
+
+	def __init__(self, path: str | os.PathLike[str]) -> None:
+		self.path = os.fspath(path)
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+		self._local = threading.local()
+		with self._connect() as conn:
+			conn.execute(
+				'CREATE TABLE IF NOT EXISTS uploads ('
+				'sha256 TEXT NOT NULL, purpose TEXT NOT NULL, knowledge_id TEXT NOT NULL, '
+				'file_id TEXT NOT NULL, file_object TEXT NOT NULL, '
+				'PRIMARY KEY (sha256, purpose, knowledge_id))'
+			)
+			conn.execute('CREATE INDEX IF NOT EXISTS uploads_file_id ON uploads (file_id)')
+
+	def _connect(self) -> sqlite3.Connection:
+		conn = getattr(self._local, 'conn', None)
+		if conn is None:
+			conn = sqlite3.connect(self.path, timeout=30)
+			conn.execute('PRAGMA journal_mode=WAL')
+			conn.execute('PRAGMA synchronous=NORMAL')
+			self._local.conn = conn
+		return conn
+
+	def get(self, sha256: str, purpose: str, knowledge_id: Optional[str]) -> Optional[FileObject]:
+		row = (
+			self._connect()
+			.execute(
+				'SELECT file_object FROM uploads WHERE sha256 = ? AND purpose = ? AND knowledge_id = ?',
+				(sha256, purpose, knowledge_id or ''),
+			)
+			.fetchone()
+		)
+		return parse_obj(FileObject, json.loads(row[0])) if row is not None else None
+
+	def set(self, sha256: str, purpose: str, knowledge_id: Optional[str], file: FileObject) -> None:
+		if not file.id:
+			return
+		with self._connect() as conn:
+			conn.execute(
+				'INSERT OR REPLACE INTO uploads (sha256, purpose, knowledge_id, file_id, file_object) '
+				'VALUES (?, ?, ?, ?, ?)',
+				(sha256, purpose, knowledge_id or '', file.id, model_json(file)),
+			)
+
+	def forget(self, file_id: str) -> None:
+		"""Drop every entry pointing at `file_id`, e.g. after the file was deleted."""
+		with self._connect() as conn:
+			conn.execute('DELETE FROM uploads WHERE file_id = ?', (file_id,))
+
+	def _count(self, hit: bool) -> None:
+		with self._lock:
+			if hit:
+				self.hits += 1
+			else:
+				self.misses += 1
+
+	def close(self) -> None:
+		conn = getattr(self._local, 'conn', None)
+		if conn is not None:
+			conn.close()
+			self._local.conn = None
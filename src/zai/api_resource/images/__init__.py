@@ -1,3 +1,3 @@
-from .images import Images
+from .images import AsyncImages, Images
 
-__all__ = ['Images']
+__all__ = ['Images', 'AsyncImages']
@@ -1,3 +1,3 @@
-from .moderations import Moderations
+from .moderations import AsyncModerations, Moderations
 
-__all__ = ['Moderations']
+__all__ = ['Moderations', 'AsyncModerations']
@@ -1,4 +1,4 @@
-from .handwriting_ocr import HandwritingOCR
-from .layout_parsing import LayoutParsing
+from .handwriting_ocr import AsyncHandwritingOCR, HandwritingOCR
+from .layout_parsing import AsyncLayoutParsing, LayoutParsing
 
-__all__ = ["HandwritingOCR", "LayoutParsing"]
+__all__ = ["HandwritingOCR", "LayoutParsing", "AsyncHandwritingOCR", "AsyncLayoutParsing"]
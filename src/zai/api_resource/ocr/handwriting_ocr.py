@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Mapping, cast
 import httpx
 from typing_extensions import Literal
 from zai.core import (
+    AsyncBaseAPI,
     BaseAPI,
     maybe_transform,
     NOT_GIVEN,
@@ -20,7 +21,7 @@ from zai.types.ocr.handwriting_ocr_params import HandwritingOCRParams
 from zai.types.ocr.handwriting_ocr_resp import HandwritingOCRResp
 
 if TYPE_CHECKING:
-    from zai._client import ZaiClient
+    from zai._client import AsyncZaiClient, ZaiClient
 
 __all__ = ["HandwritingOCR"]
 
@@ -40,6 +41,7 @@ class HandwritingOCR(BaseAPI):
             extra_headers: Headers | None = None,
             extra_body: Body | None = None,
             timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+            deadline: float | None | NotGiven = NOT_GIVEN,
     ) -> HandwritingOCRResp:
         if not file:
             raise ValueError("`file` must be provided.")
@@ -61,7 +63,50 @@ class HandwritingOCR(BaseAPI):
             body=maybe_transform(body, HandwritingOCRParams),
             files=files,
             options=make_request_options(
-                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+            ),
+            cast_type=HandwritingOCRResp,
+        )
+
+
+class AsyncHandwritingOCR(AsyncBaseAPI):
+
+    def __init__(self, client: "AsyncZaiClient") -> None:
+        super().__init__(client)
+
+    async def handwriting_ocr(
+            self,
+            *,
+            file: FileTypes,
+            tool_type: Literal["hand_write"],
+            language_type: str = None,  # optional,
+            probability: bool = None,
+            extra_headers: Headers | None = None,
+            extra_body: Body | None = None,
+            timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+            deadline: float | None | NotGiven = NOT_GIVEN,
+    ) -> HandwritingOCRResp:
+        if not file:
+            raise ValueError("`file` must be provided.")
+        if not tool_type:
+            raise ValueError("`tool_type` must be provided.")
+        body = deepcopy_minimal(
+            {
+                "file": file,
+                "tool_type": tool_type,
+                "language_type": language_type,
+                "probability": probability
+            }
+        )
+        files = extract_files(cast(Mapping[str, object], body), paths=[["file"]])
+        if files:
+            extra_headers = {"Content-Type": "multipart/form-data", **(extra_headers or {})}
+        return await self._post(
+            "/files/ocr",
+            body=maybe_transform(body, HandwritingOCRParams),
+            files=files,
+            options=make_request_options(
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
             ),
             cast_type=HandwritingOCRResp,
         )
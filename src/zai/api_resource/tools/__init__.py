@@ -1,3 +1,3 @@
-from .tools import Tools
+from .tools import AsyncTools, Tools
 
-__all__ = ['Tools']
+__all__ = ['Tools', 'AsyncTools']
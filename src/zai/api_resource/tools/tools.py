@@ -8,10 +8,12 @@ from typing_extensions import Literal
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
 	NotGiven,
+	AsyncStreamResponse,
 	StreamResponse,
 	deepcopy_minimal,
 	make_request_options,
@@ -22,7 +24,7 @@ from zai.types.tools import WebSearch, WebSearchChunk, tools_web_search_params
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Tools(BaseAPI):
@@ -40,7 +42,7 @@ class Tools(BaseAPI):
 		*,
 		model: str,
 		request_id: Optional[str] | NotGiven = NOT_GIVEN,
-		stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True, 'raw'] | NotGiven = NOT_GIVEN,
 		messages: Union[str, List[str], List[int], object, None],
 		scope: Optional[str] | NotGiven = NOT_GIVEN,
 		location: Optional[str] | NotGiven = NOT_GIVEN,
@@ -48,14 +50,16 @@ class Tools(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
-	) -> WebSearch | StreamResponse[WebSearchChunk]:
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> WebSearch | StreamResponse[WebSearchChunk] | StreamResponse[dict]:
 		"""
 		Perform web search using AI models
 
 		Arguments:
 			model (str): The model to use for web search
 			request_id (Optional[str]): Unique identifier for the request
-			stream (Optional[Literal[False]] | Literal[True]): Whether to stream the response
+			stream (Optional[Literal[False]] | Literal[True, 'raw']): Whether to stream the response; `'raw'`
+				yields every chunk as the plain decoded JSON dict without building response models
 			messages (Union[str, List[str], List[int], object, None]): Search query or messages
 			scope (Optional[str]): Search scope or domain
 			location (Optional[str]): Geographic location for search
@@ -63,13 +67,14 @@ class Tools(BaseAPI):
 			extra_headers (Headers): Additional headers to send
 			extra_body (Body): Additional body parameters
 			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds across all attempts and retries
 		"""
 		body = deepcopy_minimal(
 			{
 				'model': model,
 				'request_id': request_id,
 				'messages': messages,
-				'stream': stream,
+				'stream': True if stream == 'raw' else stream,
 				'scope': scope,
 				'location': location,
 				'recent_days': recent_days,
@@ -78,8 +83,75 @@ class Tools(BaseAPI):
 		return self._post(
 			'/tools',
 			body=maybe_transform(body, tools_web_search_params.WebSearchParams),
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=WebSearch,
 			stream=stream or False,
-			stream_cls=StreamResponse[WebSearchChunk],
+			stream_cls=StreamResponse[dict] if stream == 'raw' else StreamResponse[WebSearchChunk],
+		)
+
+
+class AsyncTools(AsyncBaseAPI):
+	"""
+	asyncio API resource for tools functionality.
+
+	Provides access to various tool operations including web search.
+	"""
+
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def web_search(
+		self,
+		*,
+		model: str,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		stream: Optional[Literal[False]] | Literal[True, 'raw'] | NotGiven = NOT_GIVEN,
+		messages: Union[str, List[str], List[int], object, None],
+		scope: Optional[str] | NotGiven = NOT_GIVEN,
+		location: Optional[str] | NotGiven = NOT_GIVEN,
+		recent_days: Optional[int] | NotGiven = NOT_GIVEN,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> WebSearch | AsyncStreamResponse[WebSearchChunk] | AsyncStreamResponse[dict]:
+		"""
+		Perform web search using AI models
+
+		Arguments:
+			model (str): The model to use for web search
+			request_id (Optional[str]): Unique identifier for the request
+			stream (Optional[Literal[False]] | Literal[True, 'raw']): Whether to stream the response; `'raw'`
+				yields every chunk as the plain decoded JSON dict without building response models
+			messages (Union[str, List[str], List[int], object, None]): Search query or messages
+			scope (Optional[str]): Search scope or domain
+			location (Optional[str]): Geographic location for search
+			recent_days (Optional[int]): Number of recent days to search within
+			extra_headers (Headers): Additional headers to send
+			extra_body (Body): Additional body parameters
+			timeout (float | httpx.Timeout): Request timeout
+			deadline (float): Total time limit in seconds across all attempts and retries
+		"""
+		body = deepcopy_minimal(
+			{
+				'model': model,
+				'request_id': request_id,
+				'messages': messages,
+				'stream': True if stream == 'raw' else stream,
+				'scope': scope,
+				'location': location,
+				'recent_days': recent_days,
+			}
+		)
+		return await self._post(
+			'/tools',
+			body=maybe_transform(body, tools_web_search_params.WebSearchParams),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=WebSearch,
+			stream=stream or False,
+			stream_cls=AsyncStreamResponse[dict] if stream == 'raw' else AsyncStreamResponse[WebSearchChunk],
 		)
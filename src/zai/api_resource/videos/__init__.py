@@ -1,7 +1,9 @@
 from .videos import (
+	AsyncVideos,
 	Videos,
 )
 
 __all__ = [
 	'Videos',
+	'AsyncVideos',
 ]
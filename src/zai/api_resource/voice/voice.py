@@ -7,6 +7,7 @@ from httpx import stream
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
@@ -24,7 +25,7 @@ from zai.types.voiceclone import (
 )
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class Voice(BaseAPI):
@@ -47,6 +48,7 @@ class Voice(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> VoiceCloneResult:
 		"""
 		Clone a voice with the provided audio sample and parameters
@@ -61,6 +63,7 @@ class Voice(BaseAPI):
 			extra_headers: Additional headers to include in the request
 			extra_body: Additional body parameters
 			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
 
 		Returns:
 			Voice clone response
@@ -83,6 +86,7 @@ class Voice(BaseAPI):
 				extra_headers=extra_headers,
 				extra_body=extra_body,
 				timeout=timeout,
+				deadline=deadline,
 			),
 			cast_type=VoiceCloneResult,
 			stream=False,
@@ -96,6 +100,7 @@ class Voice(BaseAPI):
 		extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> VoiceDeleteResult:
 		"""
 		Delete a cloned voice by voice ID
@@ -106,6 +111,7 @@ class Voice(BaseAPI):
 			extra_headers: Additional headers to include in the request
 			extra_body: Additional body parameters
 			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
 			
 		Returns:
 			Voice deletion response
@@ -123,6 +129,7 @@ class Voice(BaseAPI):
 				extra_headers=extra_headers,
 				extra_body=extra_body,
 				timeout=timeout,
+				deadline=deadline,
 			),
 			cast_type=VoiceDeleteResult,
 			stream=False,
@@ -136,6 +143,7 @@ class Voice(BaseAPI):
 		request_id: Optional[str] = None,
 		extra_headers: Headers | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> VoiceListResult:
 		"""
 		List voices with optional filtering
@@ -146,6 +154,7 @@ class Voice(BaseAPI):
 			request_id: Optional request ID for tracking
 			extra_headers: Additional headers to include in the request
 			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
 			
 		Returns:
 			List of voices response
@@ -166,6 +175,160 @@ class Voice(BaseAPI):
 					VoiceListParams,
 				),
 				timeout=timeout,
+				deadline=deadline,
 			),
 			cast_type=VoiceListResult,
-		)
\ No newline at end of file
+		)
+
+
+class AsyncVoice(AsyncBaseAPI):
+	"""
+	asyncio voice API resource for handling voice cloning operations
+	"""
+
+	def __init__(self, client: AsyncZaiClient) -> None:
+		super().__init__(client)
+
+	async def clone(
+		self,
+		*,
+		voice_name: str,
+		text: str,
+		input: str,
+		file_id: str,
+		request_id: Optional[str] = None,
+		model: str,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> VoiceCloneResult:
+		"""
+		Clone a voice with the provided audio sample and parameters
+
+		Args:
+			voice_name: Name for the cloned voice
+			text: Text content corresponding to the sample audio
+			input: Target text for preview audio
+			file_id: File ID of the uploaded audio file
+			request_id: Optional request ID for tracking
+			model: Model
+			extra_headers: Additional headers to include in the request
+			extra_body: Additional body parameters
+			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
+
+		Returns:
+			Voice clone response
+		"""
+			
+		return await self._post(
+			"/voice/clone",
+			body=maybe_transform(
+				{
+					"voice_name": voice_name,
+					"text": text,
+					"input": input,
+					"file_id": file_id,
+					"request_id": request_id,
+					"model": model,
+				},
+				VoiceCloneParams,
+			),
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				deadline=deadline,
+			),
+			cast_type=VoiceCloneResult,
+			stream=False,
+		)
+
+	async def delete(
+		self,
+		*,
+		voice: str,
+		request_id: Optional[str] = None,
+		extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> VoiceDeleteResult:
+		"""
+		Delete a cloned voice by voice ID
+		
+		Args:
+			voice: The voice to delete
+			request_id: Optional request ID for tracking
+			extra_headers: Additional headers to include in the request
+			extra_body: Additional body parameters
+			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
+			
+		Returns:
+			Voice deletion response
+		"""
+		return await self._post(
+			"/voice/delete",
+			body=maybe_transform(
+				{
+					"voice": voice,
+					"request_id": request_id,
+				},
+				VoiceDeleteParams,
+			),
+			options=make_request_options(
+				extra_headers=extra_headers,
+				extra_body=extra_body,
+				timeout=timeout,
+				deadline=deadline,
+			),
+			cast_type=VoiceDeleteResult,
+			stream=False,
+		)
+
+	async def list(
+		self,
+		*,
+		voice_type: Optional[str] = None,
+		voice_name: Optional[str] = None,
+		request_id: Optional[str] = None,
+		extra_headers: Headers | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> VoiceListResult:
+		"""
+		List voices with optional filtering
+		
+		Args:
+			voice_type: Type of voice to filter by
+			voice_name: Name of voice to filter by
+			request_id: Optional request ID for tracking
+			extra_headers: Additional headers to include in the request
+			timeout: Request timeout
+			deadline: Total time limit in seconds across all attempts and retries
+			
+		Returns:
+			List of voices response
+		"""
+		return await self._get(
+			"/voice/list",
+			options=make_request_options(
+				extra_headers={
+					**({} if request_id is None else {"Request-Id": request_id}),
+					**(extra_headers or {}),
+				},
+				extra_query=maybe_transform(
+					{
+						"voiceType": voice_type,
+						"voiceName": voice_name,
+						"request_id": request_id,
+					},
+					VoiceListParams,
+				),
+				timeout=timeout,
+				deadline=deadline,
+			),
+			cast_type=VoiceListResult,
+		)
@@ -1,3 +1,3 @@
-from .web_reader import WebReaderApi
+from .web_reader import AsyncWebReaderApi, WebReaderApi
 
-__all__ = ["WebReaderApi"]
\ No newline at end of file
+__all__ = ["WebReaderApi", "AsyncWebReaderApi"]
\ No newline at end of file
@@ -6,6 +6,7 @@ import httpx
 
 from zai.core import (
     NOT_GIVEN,
+    AsyncBaseAPI,
     BaseAPI,
     Body,
     Headers,
@@ -18,7 +19,7 @@ from zai.types.web_reader.web_reader_params import WebReaderParams
 from zai.types.web_reader.web_reader_resp import WebReaderResult
 
 if TYPE_CHECKING:
-    from zai._client import ZaiClient
+    from zai._client import AsyncZaiClient, ZaiClient
 
 
 class WebReaderApi(BaseAPI):
@@ -42,6 +43,7 @@ class WebReaderApi(BaseAPI):
         extra_headers: Headers | None = None,
         extra_body: Body | None = None,
         timeout_override: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+        deadline: float | None | NotGiven = NOT_GIVEN,
     ) -> WebReaderResult:
         body = deepcopy_minimal(
             {
@@ -62,7 +64,55 @@ class WebReaderApi(BaseAPI):
             "/reader",
             body=maybe_transform(body, WebReaderParams),
             options=make_request_options(
-                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout_override
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout_override, deadline=deadline
             ),
             cast_type=WebReaderResult,
-        )
\ No newline at end of file
+        )
+
+
+class AsyncWebReaderApi(AsyncBaseAPI):
+    def __init__(self, client: "AsyncZaiClient") -> None:
+        super().__init__(client)
+
+    async def web_reader(
+        self,
+        *,
+        url: str,
+        request_id: Optional[str] | NotGiven = NOT_GIVEN,
+        user_id: Optional[str] | NotGiven = NOT_GIVEN,
+        timeout: Optional[str] | NotGiven = NOT_GIVEN,
+        no_cache: Optional[bool] | NotGiven = NOT_GIVEN,
+        return_format: Optional[str] | NotGiven = NOT_GIVEN,
+        retain_images: Optional[bool] | NotGiven = NOT_GIVEN,
+        no_gfm: Optional[bool] | NotGiven = NOT_GIVEN,
+        keep_img_data_url: Optional[bool] | NotGiven = NOT_GIVEN,
+        with_images_summary: Optional[bool] | NotGiven = NOT_GIVEN,
+        with_links_summary: Optional[bool] | NotGiven = NOT_GIVEN,
+        extra_headers: Headers | None = None,
+        extra_body: Body | None = None,
+        timeout_override: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+        deadline: float | None | NotGiven = NOT_GIVEN,
+    ) -> WebReaderResult:
+        body = deepcopy_minimal(
+            {
+                "url": url,
+                "request_id": request_id,
+                "user_id": user_id,
+                "timeout": timeout,
+                "no_cache": no_cache,
+                "return_format": return_format,
+                "retain_images": retain_images,
+                "no_gfm": no_gfm,
+                "keep_img_data_url": keep_img_data_url,
+                "with_images_summary": with_images_summary,
+                "with_links_summary": with_links_summary,
+            }
+        )
+        return await self._post(
+            "/reader",
+            body=maybe_transform(body, WebReaderParams),
+            options=make_request_options(
+                extra_headers=extra_headers, extra_body=extra_body, timeout=timeout_override, deadline=deadline
+            ),
+            cast_type=WebReaderResult,
+        )
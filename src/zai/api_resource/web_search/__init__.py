@@ -1,3 +1,3 @@
-from .web_search import WebSearchApi
+from .web_search import AsyncWebSearchApi, WebSearchApi
 
-__all__ = ['WebSearchApi']
+__all__ = ['WebSearchApi', 'AsyncWebSearchApi']
@@ -7,6 +7,7 @@ import httpx
 
 from zai.core import (
 	NOT_GIVEN,
+	AsyncBaseAPI,
 	BaseAPI,
 	Body,
 	Headers,
@@ -22,7 +23,7 @@ from zai.types.web_search.web_search_resp import WebSearchResp
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-	from zai._client import ZaiClient
+	from zai._client import AsyncZaiClient, ZaiClient
 
 
 class WebSearchApi(BaseAPI):
@@ -46,6 +47,7 @@ class WebSearchApi(BaseAPI):
         extra_headers: Headers | None = None,
 		extra_body: Body | None = None,
 		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
 	) -> WebSearchResp:
 		body = deepcopy_minimal(
 			{
@@ -65,6 +67,56 @@ class WebSearchApi(BaseAPI):
 		return self._post(
 			'/web_search',
 			body=maybe_transform(body, web_search_create_params.WebSearchCreatParams),
-			options=make_request_options(extra_headers=extra_headers, extra_body=extra_body, timeout=timeout),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
+			cast_type=WebSearchResp,
+		)
+
+
+class AsyncWebSearchApi(AsyncBaseAPI):
+	def __init__(self, client: 'AsyncZaiClient') -> None:
+		super().__init__(client)
+
+	async def web_search(
+		self,
+		*,
+		request_id: Optional[str] | NotGiven = NOT_GIVEN,
+		search_engine: Optional[str] | NotGiven = NOT_GIVEN,
+		search_query: Optional[str] | NotGiven = NOT_GIVEN,
+		user_id: Optional[str] | NotGiven = NOT_GIVEN,
+		sensitive_word_check: Optional[SensitiveWordCheckRequest] | NotGiven = NOT_GIVEN,
+		count: Optional[int] | NotGiven = NOT_GIVEN,
+		search_domain_filter: Optional[str] | NotGiven = NOT_GIVEN,
+		search_recency_filter: Optional[str] | NotGiven = NOT_GIVEN,
+		content_size: Optional[str] | NotGiven = NOT_GIVEN,
+		search_intent: Optional[bool] | NotGiven = NOT_GIVEN,
+        include_image: Optional[bool] | NotGiven = NOT_GIVEN,
+        extra_headers: Headers | None = None,
+		extra_body: Body | None = None,
+		timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+		deadline: float | None | NotGiven = NOT_GIVEN,
+	) -> WebSearchResp:
+		body = deepcopy_minimal(
+			{
+				'request_id': request_id,
+				'search_engine': search_engine,
+				'search_query': search_query,
+				'user_id': user_id,
+				'sensitive_word_check': sensitive_word_check,
+				'count': count,
+				'search_domain_filter': search_domain_filter,
+				'search_recency_filter': search_recency_filter,
+				'content_size': content_size,
+				'search_intent': search_intent,
+                'include_image': include_image
+			}
+		)
+		return await self._post(
+			'/web_search',
+			body=maybe_transform(body, web_search_create_params.WebSearchCreatParams),
+			options=make_request_options(
+				extra_headers=extra_headers, extra_body=extra_body, timeout=timeout, deadline=deadline
+			),
 			cast_type=WebSearchResp,
 		)
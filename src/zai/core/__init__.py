@@ -1,4 +1,4 @@
-from ._base_api import BaseAPI
+from ._base_api import AsyncBaseAPI, BaseAPI
 from ._base_compat import (
 	PYDANTIC_V2,
 	ConfigDict,
@@ -41,9 +41,18 @@ from ._errors import (
 	APITimeoutError,
 	ZaiError,
 )
+from ._cache import CachedResponse, MemoryCache, ResponseCache, SQLiteCache
+from ._coalescing import RequestCoalescer
 from ._files import is_file_content
-from ._http_client import HttpClient, make_request_options
-from ._streaming import StreamResponse
+from ._fingerprint import request_fingerprint
+from ._json_stream import IncrementalJSONParser, JSONEvent, validate_json
+from ._hedging import HedgePolicy
+from ._http_client import AsyncHttpClient, HttpClient, make_request_options
+from ._rate_limit import RateLimit, RateLimiter, TokenBucket, estimate_tokens
+from ._retry import EndpointRetryRule, RetryBudget, RetryPolicy, parse_retry_after
+from ._sse_proxy import aiter_sse_frames, iter_sse_frames, sse_asgi_app, sse_wsgi_app
+from ._stream_metrics import StreamMetrics
+from ._streaming import AsyncStreamResponse, StreamResponse
 from ._utils import (
 	deepcopy_minimal,
 	drop_prefix_image_data,
@@ -60,6 +69,7 @@ __all__ = [
 	'BaseModel',
 	'construct_type',
 	'BaseAPI',
+	'AsyncBaseAPI',
 	'NOT_GIVEN',
 	'Headers',
 	'NotGiven',
@@ -93,6 +103,7 @@ __all__ = [
 	'APITimeoutError',
 	'make_request_options',
 	'HttpClient',
+	'AsyncHttpClient',
 	'ZAI_DEFAULT_TIMEOUT',
 	'ZAI_DEFAULT_MAX_RETRIES',
 	'ZAI_DEFAULT_LIMITS',
@@ -106,4 +117,28 @@ __all__ = [
 	'drop_prefix_image_data',
 	'extract_files',
 	'StreamResponse',
+	'AsyncStreamResponse',
+	'StreamMetrics',
+	'IncrementalJSONParser',
+	'JSONEvent',
+	'validate_json',
+	'RateLimit',
+	'RateLimiter',
+	'TokenBucket',
+	'estimate_tokens',
+	'RetryPolicy',
+	'HedgePolicy',
+	'RequestCoalescer',
+	'ResponseCache',
+	'MemoryCache',
+	'SQLiteCache',
+	'CachedResponse',
+	'request_fingerprint',
+	'RetryBudget',
+	'EndpointRetryRule',
+	'parse_retry_after',
+	'iter_sse_frames',
+	'aiter_sse_frames',
+	'sse_wsgi_app',
+	'sse_asgi_app',
 ]
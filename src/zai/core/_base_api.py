@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-	from .._client import ZaiClient
+	from .._client import AsyncZaiClient, ZaiClient
 
 
 class BaseAPI:
@@ -33,3 +33,31 @@ class BaseAPI:
 		self._put = client.put
 		self._patch = client.patch
 		self._get_api_list = client.get_api_list
+
+
+class AsyncBaseAPI:
+	"""
+	Base class for the asyncio API resource classes.
+
+	Mirrors `BaseAPI`, but the bound HTTP method shortcuts are coroutines and must be awaited.
+
+	Attributes:
+		_client (AsyncZaiClient): The asyncio client instance for making API requests
+	"""
+
+	_client: AsyncZaiClient
+
+	def __init__(self, client: AsyncZaiClient) -> None:
+		"""
+		Initialize the API resource with an asyncio client instance.
+
+		Args:
+			client (AsyncZaiClient): The asyncio client instance for making API requests
+		"""
+		self._client = client
+		self._delete = client.delete
+		self._get = client.get
+		self._post = client.post
+		self._put = client.put
+		self._patch = client.patch
+		self._get_api_list = client.get_api_list
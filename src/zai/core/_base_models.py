@@ -273,6 +273,9 @@ class BaseModel(pydantic.BaseModel):
 			object.__setattr__(m, '__pydantic_private__', None)
 			object.__setattr__(m, '__pydantic_extra__', _extra)
 			object.__setattr__(m, '__pydantic_fields_set__', _fields_set)
+			if cls.__pydantic_post_init__:
+				# initializes private attributes, as `model_construct()` does
+				m.model_post_init(None)
 		else:
 			# init_private_attributes() does not exist in v2
 			m._init_private_attributes()  # type: ignore
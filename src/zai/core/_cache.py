@@ -0,0 +1,358 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Iterator, List, Mapping, Optional, Tuple
+
+import httpx
+from typing_extensions import Protocol
+
+from ._request_opt import FinalRequestOptions
+from ._utils import is_mapping
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Seconds a response stays cached, by API path prefix
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+	'/embeddings': 24 * 3600,
+	'/reader': 3600,
+	'/layout_parsing': 24 * 3600,
+	'/chat/completions': 3600,
+}
+# Chat completions are only cached when sampling is effectively greedy
+_DETERMINISTIC_TEMPERATURE = 0.01
+_CHAT_COMPLETIONS = '/chat/completions'
+
+
+class CachedResponse:
+	"""
+	Body and content type of a successful response.
+
+	Attributes:
+		content (bytes): Response body; for streams the raw server-sent events
+		content_type (str): Value of the `Content-Type` header
+	"""
+
+	__slots__ = ('content', 'content_type')
+
+	def __init__(self, content: bytes, content_type: str) -> None:
+		self.content = content
+		self.content_type = content_type
+
+	def to_response(self, request: httpx.Request) -> httpx.Response:
+		return httpx.Response(
+			200,
+			headers={'content-type': self.content_type, 'x-zai-cache': 'hit'},
+			content=self.content,
+			request=request,
+		)
+
+
+class CacheBackend(Protocol):
+	def get(self, key: str) -> Optional[CachedResponse]: ...
+
+	def set(self, key: str, value: CachedResponse, ttl: float) -> None: ...
+
+	def clear(self) -> None: ...
+
+
+class MemoryCache:
+	"""
+	In-process LRU cache bounded by the total size of the cached bodies.
+
+	Arguments:
+		max_bytes (int): Least recently used entries are evicted beyond this many body bytes
+	"""
+
+	def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+		self.max_bytes = max_bytes
+		self.size = 0
+		self.evictions = 0
+		self._entries: OrderedDict[str, Tuple[CachedResponse, float]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return None
+			if entry[1] <= time.time():
+				self._remove(key)
+				return None
+			self._entries.move_to_end(key)
+			return entry[0]
+
+	def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+		size = len(value.content)
+		if size > self.max_bytes:
+			return
+		with self._lock:
+			if key in self._entries:
+				self._remove(key)
+			self._entries[key] = (value, time.time() + ttl)
+			self.size += size
+			while self.size > self.max_bytes:
+				self._remove(next(iter(self._entries)))
+				self.evictions += 1
+
+	def _remove(self, key: str) -> None:
+		value, _ = self._entries.pop(key)
+		self.size -= len(value.content)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self.size = 0
+
+
+class SQLiteCache:
+	"""
+	Persistent cache in a SQLite database that several processes can share.
+
+	The database runs in WAL mode so readers do not block the writer. Each thread uses its own
+	connection.
+
+	Arguments:
+		path (str | os.PathLike): Database file, created if missing
+		max_bytes (Optional[int]): Least recently used entries are evicted beyond this many body bytes
+	"""
+
+	def __init__(self, path: str | os.PathLike[str], max_bytes: Optional[int] = None) -> None:
+		self.path = os.fspath(path)
+		self.max_bytes = max_bytes
+		self.evictions = 0
+		self._local = threading.local()
+		with self._connect() as conn:
+			conn.execute(
+				'CREATE TABLE IF NOT EXISTS responses ('
+				'key TEXT PRIMARY KEY, content BLOB NOT NULL, content_type TEXT NOT NULL, '
+				'size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+			)
+			conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+
+	def _connect(self) -> sqlite3.Connection:
+		conn = getattr(self._local, 'conn', None)
+		if conn is None:
+			conn = sqlite3.connect(self.path, timeout=30)
+			conn.execute('PRAGMA journal_mode=WAL')
+			conn.execute('PRAGMA synchronous=NORMAL')
+			self._local.conn = conn
+		return conn
+
+	def get(self, key: str) -> Optional[CachedResponse]:
+		conn = self._connect()
+		now = time.time()
+		row = conn.execute(
+			'SELECT content, content_type, expires_at FROM responses WHERE key = ?',
+			(key,),
+		).fetchone()
+		if row is None:
+			return None
+		with conn:
+			if row[2] <= now:
+				conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+				return None
+			conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+		return CachedResponse(bytes(row[0]), row[1])
+
+	def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+		conn = self._connect()
+		now = time.time()
+		with conn:
+			conn.execute(
+				'INSERT OR REPLACE INTO responses (key, content, content_type, size, expires_at, accessed_at) '
+				'VALUES (?, ?, ?, ?, ?, ?)',
+				(key, value.content, value.content_type, len(value.content), now + ttl, now),
+			)
+			conn.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+			if self.max_bytes is not None:
+				self._evict(conn)
+
+	def _evict(self, conn: sqlite3.Connection) -> None:
+		total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+		if total <= self.max_bytes:
+			return
+		for key, size in conn.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+			conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+			self.evictions += 1
+			total -= size
+			if total <= self.max_bytes:
+				break
+
+	def clear(self) -> None:
+		with self._connect() as conn:
+			conn.execute('DELETE FROM responses')
+
+	def close(self) -> None:
+		conn = getattr(self._local, 'conn', None)
+		if conn is not None:
+			conn.close()
+			self._local.conn = None
+
+
+class ResponseCache:
+	"""
+	Caches successful responses of deterministic requests.
+
+	Requests are keyed by `request_fingerprint`, which includes the client's API key, so a cache
+	shared between clients or processes never answers one key with another key's response.
+	A request is cached when its path matches one
+	of `ttls`; chat completions additionally need `do_sample=False` or a temperature of about 0.
+	Streams are only cached, as the raw list of server-sent events that is replayed on a hit, if
+	`cache_streams` is set.
+
+	Arguments:
+		backend (Optional[CacheBackend]): Where entries are kept, a `MemoryCache` by default
+		ttls (Mapping[str, float]): Seconds entries are kept, by API path prefix
+		cache_streams (bool): Whether streamed responses are recorded and replayed
+
+	Attributes:
+		hits (int): Requests answered from the cache
+		misses (int): Cacheable requests sent to the API
+		stores (int): Responses written to the cache
+	"""
+
+	def __init__(
+		self,
+		backend: Optional[CacheBackend] = None,
+		*,
+		ttls: Mapping[str, float] = DEFAULT_CACHE_TTLS,
+		cache_streams: bool = False,
+	) -> None:
+		self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+		self.ttls = {'/' + path.lstrip('/'): ttl for path, ttl in ttls.items()}
+		self.cache_streams = cache_streams
+		self.hits = 0
+		self.misses = 0
+		self.stores = 0
+		self._lock = threading.Lock()
+
+	@property
+	def hit_rate(self) -> float:
+		total = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+	def ttl_for(self, options: FinalRequestOptions, stream: bool) -> Optional[float]:
+		"""Seconds to cache the response to `options` for, or `None` if it must not be cached."""
+		if stream and not self.cache_streams:
+			return None
+		path = '/' + options.url.lstrip('/')
+		matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+		if not matches:
+			return None
+		prefix = max(matches, key=len)
+		if prefix == _CHAT_COMPLETIONS and not _is_deterministic(options.json_data):
+			return None
+		return self.ttls[prefix]
+
+	def lookup(self, key: str) -> Optional[CachedResponse]:
+		try:
+			entry = self.backend.get(key)
+		except Exception:
+			log.warning('Response cache lookup failed', exc_info=True)
+			entry = None
+		with self._lock:
+			if entry is None:
+				self.misses += 1
+			else:
+				self.hits += 1
+		return entry
+
+	def store(self, key: str, response: httpx.Response, ttl: float, content: Optional[bytes] = None) -> None:
+		entry = CachedResponse(
+			response.content if content is None else content,
+			response.headers.get('content-type', 'application/json'),
+		)
+		try:
+			self.backend.set(key, entry, ttl)
+		except Exception:
+			log.warning('Response cache store failed', exc_info=True)
+			return
+		with self._lock:
+			self.stores += 1
+
+
+def _is_deterministic(body: object) -> bool:
+	if not is_mapping(body):
+		return False
+	if body.get('do_sample') is False:
+		return True
+	temperature = body.get('temperature')
+	return isinstance(temperature, (int, float)) and temperature <= _DETERMINISTIC_TEMPERATURE
+
+
+def _ends_with_done(parts: List[bytes]) -> bool:
+	tail = b''.join(parts[-2:]).rstrip()
+	return tail.endswith(b'data: [DONE]')
+
+
+class _RecordingStream(httpx.SyncByteStream):
+	def __init__(self, stream: httpx.SyncByteStream, on_complete: Callable[[bytes], None]) -> None:
+		self._stream = stream
+		self._on_complete = on_complete
+		self._parts: List[bytes] = []
+		self._complete = False
+
+	def __iter__(self) -> Iterator[bytes]:
+		for part in self._stream:
+			self._parts.append(part)
+			yield part
+		self._finish()
+
+	def _finish(self) -> None:
+		if not self._complete:
+			self._complete = True
+			self._on_complete(b''.join(self._parts))
+
+	def close(self) -> None:
+		# streams are closed as soon as `[DONE]` arrives, before the body is exhausted
+		if _ends_with_done(self._parts):
+			self._finish()
+		self._stream.close()
+
+
+class _AsyncRecordingStream(httpx.AsyncByteStream):
+	def __init__(self, stream: httpx.AsyncByteStream, on_complete: Callable[[bytes], None]) -> None:
+		self._stream = stream
+		self._on_complete = on_complete
+		self._parts: List[bytes] = []
+		self._complete = False
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		async for part in self._stream:
+			self._parts.append(part)
+			yield part
+		self._finish()
+
+	def _finish(self) -> None:
+		if not self._complete:
+			self._complete = True
+			self._on_complete(b''.join(self._parts))
+
+	async def aclose(self) -> None:
+		if _ends_with_done(self._parts):
+			self._finish()
+		await self._stream.aclose()
+
+
+def record_stream(response: httpx.Response, on_complete: Callable[[bytes], None], *, is_async: bool) -> None:
+	"""Call `on_complete` with the raw body of a streamed `response` once it has been read to the end."""
+	try:
+		content = response.content
+	except httpx.ResponseNotRead:
+		pass
+	else:
+		on_complete(content)
+		return
+	if is_async:
+		response.stream = _AsyncRecordingStream(response.stream, on_complete)  # type: ignore[arg-type]
+	else:
+		response.stream = _RecordingStream(response.stream, on_complete)  # type: ignore[arg-type]
@@ -0,0 +1,117 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+import anyio
+
+_T = TypeVar('_T')
+
+# Endpoints whose identical requests return interchangeable results
+DEFAULT_COALESCED_ENDPOINTS = ('/embeddings', '/web_search', '/reader', '/moderations', '/async-result')
+
+
+class _Call:
+	__slots__ = ('done', 'result', 'error', 'abandoned')
+
+	def __init__(self, done: Any) -> None:
+		self.done = done
+		self.result: Any = None
+		self.error: Optional[BaseException] = None
+		# set when the leading caller was interrupted; waiting callers then send the request themselves
+		self.abandoned = False
+
+
+class RequestCoalescer:
+	"""
+	Shares one upstream call between concurrent identical requests ("singleflight").
+
+	While a request is in flight, identical requests (same API key, method, URL, query, headers
+	and JSON body, see `request_fingerprint`) wait for it instead of being sent, and all callers get
+	the same parsed result or exception. Results are not kept once the call is finished.
+	Streaming requests, file uploads and raw responses are never coalesced.
+
+	Note that the callers share the same result object.
+
+	Arguments:
+		endpoints (Optional[Sequence[str]]): API path prefixes whose requests are coalesced,
+			`None` for every endpoint
+	"""
+
+	def __init__(self, *, endpoints: Optional[Sequence[str]] = DEFAULT_COALESCED_ENDPOINTS) -> None:
+		self.endpoints = None if endpoints is None else tuple('/' + e.lstrip('/') for e in endpoints)
+		self.coalesced = 0
+		self._calls: Dict[Any, _Call] = {}
+		self._async_calls: Dict[Any, _Call] = {}
+		self._lock = threading.Lock()
+
+	def applies_to(self, path: str) -> bool:
+		if self.endpoints is None:
+			return True
+		path = '/' + path.lstrip('/')
+		return any(path.startswith(endpoint) for endpoint in self.endpoints)
+
+	def _join(self, calls: Dict[Any, _Call], key: Any, make_done: Callable[[], Any]) -> Tuple[_Call, bool]:
+		with self._lock:
+			call = calls.get(key)
+			if call is not None:
+				self.coalesced += 1
+				return call, False
+			call = calls[key] = _Call(make_done())
+			return call, True
+
+	def _finish(self, calls: Dict[Any, _Call], key: Any, call: _Call) -> None:
+		with self._lock:
+			if calls.get(key) is call:
+				del calls[key]
+
+	def do(self, key: Any, fn: Callable[[], _T]) -> _T:
+		"""Run `fn`, or wait for the call already running under `key` and return its result."""
+		while True:
+			call, leader = self._join(self._calls, key, threading.Event)
+			if leader:
+				break
+			call.done.wait()
+			if not call.abandoned:
+				if call.error is not None:
+					raise call.error
+				return call.result
+
+		try:
+			call.result = fn()
+		except Exception as err:
+			call.error = err
+			raise
+		except BaseException:
+			call.abandoned = True
+			raise
+		finally:
+			self._finish(self._calls, key, call)
+			call.done.set()
+		return call.result
+
+	async def ado(self, key: Any, fn: Callable[[], Awaitable[_T]]) -> _T:
+		"""Await `fn()`, or wait for the call already running under `key` and return its result."""
+		while True:
+			call, leader = self._join(self._async_calls, key, anyio.Event)
+			if leader:
+				break
+			await call.done.wait()
+			if not call.abandoned:
+				if call.error is not None:
+					raise call.error
+				return call.result
+
+		try:
+			call.result = await fn()
+		except Exception as err:
+			call.error = err
+			raise
+		except BaseException:
+			call.abandoned = True
+			raise
+		finally:
+			self._finish(self._async_calls, key, call)
+			call.done.set()
+		return call.result
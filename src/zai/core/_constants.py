@@ -1,6 +1,8 @@
 import httpx
 
 RAW_RESPONSE_HEADER = 'X-Stainless-Raw-Response'
+# `response.extensions` key holding the `time.monotonic()` deadline of the request, checked while streaming
+DEADLINE_AT_EXTENSION = 'zai_deadline_at'
 # Control interface `connect` and `read` timeout through `Timeout`, default is `timeout=300.0, connect=8.0`
 ZAI_DEFAULT_TIMEOUT = httpx.Timeout(timeout=300.0, connect=8.0)
 # Control retry count through `retry` parameter, default is 3 times
@@ -0,0 +1,382 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+import anyio
+import httpx
+
+from ._constants import RAW_RESPONSE_HEADER
+from ._errors import APIStatusError, ZaiError
+
+if TYPE_CHECKING:
+	from ._http_client import AsyncHttpClient, HttpClient
+	from ._request_opt import UserRequestInput
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+_CONTENT_RANGE = re.compile(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)')
+
+
+class _Fetched(NamedTuple):
+	position: int
+	total: Optional[int]
+	validator: Optional[str]
+	ranged: bool
+
+
+def _parse_content_range(header: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+	"""Start and total size from a `Content-Range` header such as `bytes 100-199/1000` or `bytes */1000`."""
+	match = _CONTENT_RANGE.match(header or '')
+	if match is None:
+		return None, None
+	start, total = match.groups()
+	return (int(start) if start else None), (int(total) if total != '*' else None)
+
+
+def _validator(headers: httpx.Headers) -> Optional[str]:
+	"""A strong ETag or the Last-Modified date, the values `If-Range` accepts."""
+	etag = headers.get('etag')
+	if etag and not etag.startswith('W/'):
+		return etag
+	return headers.get('last-modified')
+
+
+def _range_options(
+	options: UserRequestInput, start: int, end: Optional[int], validator: Optional[str]
+) -> UserRequestInput:
+	headers = {
+		**(options.get('headers') or {}),
+		RAW_RESPONSE_HEADER: 'stream',
+		'Accept-Encoding': 'identity',
+		'Range': f'bytes={start}-' if end is None else f'bytes={start}-{end}',
+	}
+	if validator:
+		headers['If-Range'] = validator
+	return {**options, 'headers': headers}
+
+
+def _split_parts(start: int, total: int, part_size: int) -> List[Tuple[int, int]]:
+	return [(offset, min(offset + part_size, total) - 1) for offset in range(start, total, part_size)]
+
+
+def _begin_range(
+	response: httpx.Response, file: IO[bytes], start: int, end: Optional[int]
+) -> Tuple[int, Optional[int]]:
+	"""Position the file for the body of `response`; returns the write position and the total size."""
+	if response.status_code == 206:
+		range_start, total = _parse_content_range(response.headers.get('content-range'))
+		if range_start != start:
+			raise ZaiError(f'Requested bytes from {start} but the server sent bytes from {range_start}')
+		file.seek(start)
+		if start == 0:
+			file.truncate()
+		return start, total
+	if start > 0 and end is not None:
+		raise ZaiError('The server ignored the range request of a parallel download')
+	# a full body: the server does not support ranges or the file changed since the last attempt
+	file.seek(0)
+	file.truncate()
+	length = response.headers.get('content-length')
+	return 0, int(length) if length is not None else None
+
+
+def _complete_after(
+	err: APIStatusError, position: int, end: Optional[int], validator: Optional[str]
+) -> Optional[_Fetched]:
+	"""The result of resuming at `position` when that is already the end of the content."""
+	if err.status_code != 416 or end is not None or position == 0:
+		return None
+	return _Fetched(position, _parse_content_range(err.response.headers.get('content-range'))[1], validator, True)
+
+
+def _verify(partial: pathlib.Path, total: Optional[int], checksum: Optional[str], algorithm: str) -> None:
+	size = partial.stat().st_size
+	if total is not None and size != total:
+		raise ZaiError(f'Downloaded {size} bytes but expected {total}; call again to resume')
+	if checksum is None:
+		return
+	digest = hashlib.new(algorithm)
+	with open(partial, 'rb') as file:
+		for chunk in iter(lambda: file.read(1024 * 1024), b''):
+			digest.update(chunk)
+	if digest.hexdigest() != checksum.lower():
+		_discard(partial)
+		raise ZaiError(f'{algorithm} checksum mismatch: expected {checksum}, got {digest.hexdigest()}')
+
+
+def _partial_path(path: str | os.PathLike[str]) -> Tuple[pathlib.Path, pathlib.Path]:
+	target = pathlib.Path(path)
+	return target, target.with_name(target.name + '.part')
+
+
+def _state_path(partial: pathlib.Path) -> pathlib.Path:
+	return partial.with_name(partial.name + '.json')
+
+
+def _resume_state(partial: pathlib.Path) -> Tuple[int, Optional[str]]:
+	"""
+	Offset and `If-Range` validator to resume `partial` with.
+
+	A `.part` file is only resumed when the validator of its content was saved next to it, so a
+	file that changed on the server is fetched again instead of being appended to an old prefix.
+	"""
+	if not partial.exists():
+		return 0, None
+	try:
+		state = json.loads(_state_path(partial).read_text())
+		validator, total = state.get('validator'), state.get('total')
+	except (OSError, ValueError, AttributeError):
+		return 0, None
+	offset = partial.stat().st_size
+	if not validator or (total is not None and offset > total):
+		return 0, None
+	return offset, validator
+
+
+def _save_resume_state(partial: pathlib.Path, validator: Optional[str], total: Optional[int]) -> None:
+	state = _state_path(partial)
+	if validator:
+		state.write_text(json.dumps({'validator': validator, 'total': total}))
+	elif state.exists():
+		state.unlink()
+
+
+def _discard(partial: pathlib.Path) -> None:
+	for path in (partial, _state_path(partial)):
+		if path.exists():
+			path.unlink()
+
+
+def _finish(partial: pathlib.Path, target: pathlib.Path) -> None:
+	os.replace(partial, target)
+	if _state_path(partial).exists():
+		_state_path(partial).unlink()
+
+
+def download_to_path(
+	client: HttpClient,
+	url: str,
+	path: str | os.PathLike[str],
+	*,
+	options: UserRequestInput,
+	checksum: Optional[str] = None,
+	checksum_algorithm: str = 'sha256',
+	parallel: int = 1,
+	part_size: int = DEFAULT_PART_SIZE,
+	resume_attempts: int = 3,
+) -> pathlib.Path:
+	"""
+	Stream the body of a GET request to `path` with constant memory.
+
+	The body is written to `<path>.part` and moved into place once its length, and `checksum` if
+	given, are verified. An interrupted transfer is resumed with an HTTP `Range` request, also by a
+	later call when a sequential download left a `.part` file behind. The ETag or Last-Modified
+	date of the content, kept in `<path>.part.json`, is sent as `If-Range`, so content that changed
+	in between is fetched again from the start; without one a sequential download restarts from
+	the beginning instead of resuming. With `parallel` > 1 and a server that supports ranges the
+	file is fetched in `part_size` ranges concurrently.
+
+	Arguments:
+		client (HttpClient): Client sending the requests
+		url (str): API path of the content
+		path (str | os.PathLike): Destination file
+		options (UserRequestInput): Request options such as headers and timeout
+		checksum (Optional[str]): Expected hex digest of the content
+		checksum_algorithm (str): `hashlib` algorithm of `checksum`
+		parallel (int): Number of concurrent range requests
+		part_size (int): Bytes per range request when downloading in parallel
+		resume_attempts (int): How often each range is resumed after the connection drops
+	"""
+	target, partial = _partial_path(path)
+
+	def fetch(
+		file: IO[bytes], start: int, end: Optional[int], validator: Optional[str], save_state: bool = False
+	) -> _Fetched:
+		position, total, failures = start, None, 0
+		while True:
+			try:
+				response = client.get(
+					url, cast_type=httpx.Response, options=_range_options(options, position, end, validator)
+				)
+			except APIStatusError as err:
+				# the `.part` file may already hold the whole content
+				complete = _complete_after(err, position, end, validator)
+				if complete is None:
+					raise
+				return complete
+			try:
+				ranged = response.status_code == 206
+				position, total = _begin_range(response, file, position, end)
+				if ranged and end is not None and total is not None:
+					# a range past the end of the content is answered up to its last byte
+					end = min(end, total - 1)
+				validator = _validator(response.headers) or (validator if ranged else None)
+				if save_state:
+					_save_resume_state(partial, validator, total)
+				for chunk in response.iter_raw():
+					file.write(chunk)
+					position += len(chunk)
+				if ranged and end is not None and position <= end:
+					raise httpx.RemoteProtocolError('Range response ended early', request=response.request)
+			except httpx.TransportError:
+				failures += 1
+				if failures > resume_attempts:
+					raise
+				log.debug('Download of %s interrupted at byte %d, resuming', url, position, exc_info=True)
+				if end is None and validator is None:
+					# nothing to tell whether the content is still the same
+					position = 0
+				continue
+			finally:
+				response.close()
+			return _Fetched(position, total, validator, ranged)
+
+	if parallel <= 1:
+		offset, validator = _resume_state(partial)
+		with open(partial, 'r+b' if offset else 'wb') as file:
+			total = fetch(file, offset, None, validator, save_state=True).total
+		_verify(partial, total, checksum, checksum_algorithm)
+		_finish(partial, target)
+		return target
+
+	try:
+		_discard(partial)
+		with open(partial, 'wb') as file:
+			first = fetch(file, 0, part_size - 1, None)
+		total = first.total
+		if first.ranged and total is not None and total > first.position:
+
+			def fetch_part(part: Tuple[int, int]) -> None:
+				with open(partial, 'r+b') as part_file:
+					fetch(part_file, part[0], part[1], first.validator)
+
+			with ThreadPoolExecutor(parallel, thread_name_prefix='zai-download') as pool:
+				list(pool.map(fetch_part, _split_parts(first.position, total, part_size)))
+		_verify(partial, total, checksum, checksum_algorithm)
+	except BaseException:
+		# parts may be missing anywhere in the file, so it cannot be resumed
+		_discard(partial)
+		raise
+	_finish(partial, target)
+	return target
+
+
+async def async_download_to_path(
+	client: AsyncHttpClient,
+	url: str,
+	path: str | os.PathLike[str],
+	*,
+	options: UserRequestInput,
+	checksum: Optional[str] = None,
+	checksum_algorithm: str = 'sha256',
+	parallel: int = 1,
+	part_size: int = DEFAULT_PART_SIZE,
+	resume_attempts: int = 3,
+) -> pathlib.Path:
+	"""
+	Stream the body of a GET request to `path` with constant memory, see `download_to_path`.
+
+	Arguments:
+		client (AsyncHttpClient): Client sending the requests
+		url (str): API path of the content
+		path (str | os.PathLike): Destination file
+		options (UserRequestInput): Request options such as headers and timeout
+		checksum (Optional[str]): Expected hex digest of the content
+		checksum_algorithm (str): `hashlib` algorithm of `checksum`
+		parallel (int): Number of concurrent range requests
+		part_size (int): Bytes per range request when downloading in parallel
+		resume_attempts (int): How often each range is resumed after the connection drops
+	"""
+	target, partial = _partial_path(path)
+
+	async def fetch(
+		file: IO[bytes], start: int, end: Optional[int], validator: Optional[str], save_state: bool = False
+	) -> _Fetched:
+		position, total, failures = start, None, 0
+		while True:
+			try:
+				response = await client.get(
+					url, cast_type=httpx.Response, options=_range_options(options, position, end, validator)
+				)
+			except APIStatusError as err:
+				# the `.part` file may already hold the whole content
+				complete = _complete_after(err, position, end, validator)
+				if complete is None:
+					raise
+				return complete
+			try:
+				ranged = response.status_code == 206
+				position, total = _begin_range(response, file, position, end)
+				if ranged and end is not None and total is not None:
+					# a range past the end of the content is answered up to its last byte
+					end = min(end, total - 1)
+				validator = _validator(response.headers) or (validator if ranged else None)
+				if save_state:
+					_save_resume_state(partial, validator, total)
+				async for chunk in response.aiter_raw():
+					file.write(chunk)
+					position += len(chunk)
+				if ranged and end is not None and position <= end:
+					raise httpx.RemoteProtocolError('Range response ended early', request=response.request)
+			except httpx.TransportError:
+				failures += 1
+				if failures > resume_attempts:
+					raise
+				log.debug('Download of %s interrupted at byte %d, resuming', url, position, exc_info=True)
+				if end is None and validator is None:
+					# nothing to tell whether the content is still the same
+					position = 0
+				continue
+			finally:
+				await response.aclose()
+			return _Fetched(position, total, validator, ranged)
+
+	if parallel <= 1:
+		offset, validator = _resume_state(partial)
+		with open(partial, 'r+b' if offset else 'wb') as file:
+			total = (await fetch(file, offset, None, validator, save_state=True)).total
+		_verify(partial, total, checksum, checksum_algorithm)
+		_finish(partial, target)
+		return target
+
+	try:
+		_discard(partial)
+		with open(partial, 'wb') as file:
+			first = await fetch(file, 0, part_size - 1, None)
+		total = first.total
+		if first.ranged and total is not None and total > first.position:
+			limiter = anyio.CapacityLimiter(parallel)
+			errors: List[Exception] = []
+
+			async with anyio.create_task_group() as tg:
+
+				async def fetch_part(part: Tuple[int, int]) -> None:
+					async with limiter:
+						try:
+							with open(partial, 'r+b') as part_file:
+								await fetch(part_file, part[0], part[1], first.validator)
+						except Exception as err:
+							errors.append(err)
+							tg.cancel_scope.cancel()
+
+				for part in _split_parts(first.position, total, part_size):
+					tg.start_soon(fetch_part, part)
+
+			if errors:
+				raise errors[0]
+		_verify(partial, total, checksum, checksum_algorithm)
+	except BaseException:
+		_discard(partial)
+		raise
+	_finish(partial, target)
+	return target
+
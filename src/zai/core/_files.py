@@ -54,21 +54,81 @@ def to_httpx_files(files: RequestFiles | None) -> HttpxRequestFiles | None:
 	return files
 
 
+class LazyPathFile(io.RawIOBase):
+	"""
+	Read-only binary file that is opened on the first read and closed again at end of file.
+
+	Multipart uploads read it in fixed-size chunks, so memory stays flat whatever the file size,
+	and no file descriptor is held between building a request and sending it. Reading after
+	`seek(0)` reopens the file, which lets retried requests send the whole file again.
+
+	Arguments:
+		path (str | os.PathLike): File to read
+	"""
+
+	def __init__(self, path: str | os.PathLike[str]) -> None:
+		super().__init__()
+		self.path = pathlib.Path(path)
+		self.name = self.path.name
+		self._file: io.BufferedReader | None = None
+		self._position = 0
+
+	def readable(self) -> bool:
+		return True
+
+	def seekable(self) -> bool:
+		return True
+
+	def tell(self) -> int:
+		return self._position
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		if whence == os.SEEK_CUR:
+			offset += self._position
+		elif whence == os.SEEK_END:
+			offset += self.path.stat().st_size
+		if offset < 0:
+			raise ValueError(f'Negative seek position {offset}')
+		self._position = offset
+		if self._file is not None:
+			self._file.seek(offset)
+		return offset
+
+	def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+		if self._file is None:
+			self._file = open(self.path, 'rb')
+			self._file.seek(self._position)
+		size = self._file.readinto(buffer)
+		self._position += size
+		if not size:
+			self._release()
+		return size
+
+	def _release(self) -> None:
+		if self._file is not None:
+			self._file.close()
+			self._file = None
+
+	def close(self) -> None:
+		self._release()
+		super().close()
+
+
 def _transform_file(file: FileTypes) -> HttpxFileTypes:
+	if is_tuple_t(file):
+		return (file[0], _read_file_content(file[1]), *file[2:])
+
 	if is_file_content(file):
 		if isinstance(file, os.PathLike):
 			path = pathlib.Path(file)
-			return (path.name, path.read_bytes())
+			return (path.name, LazyPathFile(path))
 
 		return file
 
-	if is_tuple_t(file):
-		return (file[0], _read_file_content(file[1]), *file[2:])
-
 	raise TypeError('Expected file types input to be a FileContent type or to be a tuple')
 
 
 def _read_file_content(file: FileContent) -> HttpxFileContent:
 	if isinstance(file, os.PathLike):
-		return pathlib.Path(file).read_bytes()
+		return LazyPathFile(file)
 	return file
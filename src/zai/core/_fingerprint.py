@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+from typing import Mapping, Optional
+
+from ._constants import RAW_RESPONSE_HEADER
+from ._json_encoder import json_dumps
+from ._request_opt import FinalRequestOptions
+from ._utils import is_given
+
+
+def request_fingerprint(
+	options: FinalRequestOptions,
+	base_url: str = '',
+	*,
+	identity: str = '',
+	default_headers: Optional[Mapping[str, str]] = None,
+) -> Optional[str]:
+	"""
+	Canonical sha256 of a request's credentials, method, URL, query, headers and JSON body.
+
+	Mapping keys are sorted, so bodies that only differ in key order share a fingerprint.
+	`identity`, e.g. the API key, is hashed in so that clients with different credentials never
+	share a fingerprint; the `Authorization` header itself is left out because it may be a token
+	that changes with every request.
+
+	Returns:
+		The hex digest, or `None` for requests that must not be deduplicated: file uploads,
+		raw response requests and bodies that cannot be serialized
+	"""
+	extra_headers = options.headers if is_given(options.headers) else {}
+	if options.files is not None or extra_headers.get(RAW_RESPONSE_HEADER):
+		return None
+	headers = {
+		key.lower(): value
+		for key, value in {**(default_headers or {}), **extra_headers}.items()
+		if key.lower() != 'authorization'
+	}
+	try:
+		canonical = json_dumps(
+			[
+				hashlib.sha256(identity.encode('utf-8')).hexdigest(),
+				options.method.upper(),
+				base_url + options.url,
+				options.params,
+				headers,
+				options.json_data,
+				options.extra_json,
+			],
+			sort_keys=True,
+			separators=(',', ':'),
+			ensure_ascii=False,
+		)
+	except (TypeError, ValueError):
+		return None
+	return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
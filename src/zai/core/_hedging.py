@@ -0,0 +1,100 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+
+import httpx
+
+from ._retry import RetryBudget
+
+# Idempotent endpoints whose slow responses are worth racing against a second request
+DEFAULT_HEDGED_ENDPOINTS = ('/embeddings', '/moderations', '/web_search', '/async-result', '/v1/agents/async-result')
+
+
+def copy_request(request: httpx.Request) -> httpx.Request:
+	"""A second, independent `httpx.Request` with the same method, URL, headers, body and timeout."""
+	return httpx.Request(
+		request.method,
+		request.url,
+		headers=request.headers,
+		content=request.read(),
+		extensions=dict(request.extensions),
+	)
+
+
+class HedgePolicy:
+	"""
+	Opt-in request hedging for idempotent endpoints.
+
+	When a request to one of `endpoints` has not been answered after the hedge delay, an identical
+	second request is sent; whichever response arrives first is used and the other one is
+	cancelled. The delay is either fixed or the `percentile` of the latencies recently observed for
+	the endpoint. Streaming requests are never hedged.
+
+	Arguments:
+		endpoints (Sequence[str]): API path prefixes that may be hedged, e.g. `/embeddings`
+		delay (Optional[float]): Fixed hedge delay in seconds; if None the delay is learned per endpoint
+		percentile (float): Latency percentile used as the learned delay
+		initial_delay (float): Delay used until `min_samples` latencies have been observed
+		min_samples (int): Observed latencies needed before the learned delay is used
+		window (int): Number of recent latencies kept per endpoint
+		max_hedge_ratio (float): Maximum fraction of hedgeable requests that may be hedged
+	"""
+
+	def __init__(
+		self,
+		*,
+		endpoints: Sequence[str] = DEFAULT_HEDGED_ENDPOINTS,
+		delay: Optional[float] = None,
+		percentile: float = 0.95,
+		initial_delay: float = 1.0,
+		min_samples: int = 20,
+		window: int = 500,
+		max_hedge_ratio: float = 0.05,
+	) -> None:
+		self.endpoints = tuple('/' + endpoint.lstrip('/') for endpoint in endpoints)
+		self.delay = delay
+		self.percentile = percentile
+		self.initial_delay = initial_delay
+		self.min_samples = min_samples
+		self.window = window
+		self._latencies: Dict[str, Deque[float]] = {}
+		self._budget = RetryBudget(ratio=max_hedge_ratio, min_retries=0)
+		self._lock = threading.Lock()
+
+	def _endpoint(self, path: str) -> Optional[str]:
+		path = '/' + path.lstrip('/')
+		matches = [endpoint for endpoint in self.endpoints if path.startswith(endpoint)]
+		return max(matches, key=len) if matches else None
+
+	def hedge_delay(self, path: str) -> Optional[float]:
+		"""Seconds to wait before hedging a request to `path`, or `None` if it must not be hedged."""
+		endpoint = self._endpoint(path)
+		if endpoint is None:
+			return None
+		self._budget.record_request()
+		if self.delay is not None:
+			return self.delay
+		with self._lock:
+			latencies = sorted(self._latencies.get(endpoint, ()))
+		if len(latencies) < self.min_samples:
+			return self.initial_delay
+		return latencies[min(len(latencies) - 1, math.ceil(self.percentile * len(latencies)) - 1)]
+
+	def record_latency(self, path: str, seconds: float) -> None:
+		"""Record how long a request to `path` took to be answered."""
+		endpoint = self._endpoint(path)
+		if endpoint is None:
+			return
+		with self._lock:
+			latencies = self._latencies.get(endpoint)
+			if latencies is None:
+				latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+			latencies.append(seconds)
+
+	def acquire_hedge(self) -> bool:
+		"""Take a hedge from the budget; returns `False` if hedges already exceed `max_hedge_ratio`."""
+		return self._budget.try_acquire()
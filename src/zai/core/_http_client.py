@@ -3,12 +3,14 @@ from __future__ import annotations
 
 import inspect
 import logging
+import queue
+import threading
 import time
 import warnings
-from random import random
 from typing import (
 	TYPE_CHECKING,
 	Any,
+	AsyncIterator,
 	Dict,
 	Generic,
 	Iterable,
@@ -16,6 +18,7 @@ from typing import (
 	Literal,
 	Mapping,
 	Optional,
+	Tuple,
 	Type,
 	TypeVar,
 	Union,
@@ -23,6 +26,7 @@ from typing import (
 	overload,
 )
 
+import anyio
 import httpx
 import pydantic
 from httpx import URL, Timeout
@@ -46,8 +50,7 @@ from ._base_type import (
 	ResponseT,
 )
 from ._constants import (
-	INITIAL_RETRY_DELAY,
-	MAX_RETRY_DELAY,
+	DEADLINE_AT_EXTENSION,
 	RAW_RESPONSE_HEADER,
 	ZAI_DEFAULT_LIMITS,
 	ZAI_DEFAULT_MAX_RETRIES,
@@ -59,11 +62,18 @@ from ._errors import (
 	APIStatusError,
 	APITimeoutError,
 )
+from ._cache import ResponseCache, record_stream
+from ._coalescing import RequestCoalescer
 from ._files import to_httpx_files
+from ._fingerprint import request_fingerprint
+from ._hedging import HedgePolicy, copy_request
 from ._legacy_response import LegacyAPIResponse
 from ._request_opt import FinalRequestOptions, UserRequestInput
+from ._rate_limit import RateLimiter
 from ._response import APIResponse, BaseAPIResponse, extract_response_type
-from ._streaming import StreamResponse
+from ._retry import RetryPolicy
+from ._stream_metrics import StreamMetricsCallback, record_request_timing
+from ._streaming import AsyncStreamResponse, StreamResponse
 from ._utils import flatten, is_given, is_mapping
 from ._json_encoder import json_dumps
 
@@ -71,10 +81,11 @@ log: logging.Logger = logging.getLogger(__name__)
 
 # TODO: make base page type vars covariant
 SyncPageT = TypeVar('SyncPageT', bound='BaseSyncPage[Any]')
-# AsyncPageT = TypeVar("AsyncPageT", bound="BaseAsyncPage[Any]")
+AsyncPageT = TypeVar('AsyncPageT', bound='BaseAsyncPage[Any]')
 
 _T = TypeVar('_T')
 _T_co = TypeVar('_T_co', covariant=True)
+_HttpxClientT = TypeVar('_HttpxClientT', bound=Union[httpx.Client, httpx.AsyncClient])
 
 if TYPE_CHECKING:
 	from httpx._config import DEFAULT_TIMEOUT_CONFIG as HTTPX_DEFAULT_TIMEOUT
@@ -219,15 +230,60 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
 		return self._client._request_api_list(self._model, page=self.__class__, options=options)
 
 
-class HttpClient:
-	_client: httpx.Client
+class BaseAsyncPage(BasePage[_T], Generic[_T]):
+	_client: AsyncHttpClient = pydantic.PrivateAttr()
+
+	def _set_private_attributes(
+		self,
+		client: AsyncHttpClient,
+		model: Type[_T],
+		options: FinalRequestOptions,
+	) -> None:
+		self._model = model
+		self._client = client
+		self._options = options
+
+	async def __aiter__(self) -> AsyncIterator[_T]:
+		async for page in self.iter_pages():
+			for item in page._get_page_items():
+				yield item
+
+	async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
+		page = self
+		while True:
+			yield page
+			if page.has_next_page():
+				page = await page.get_next_page()
+			else:
+				return
+
+	async def get_next_page(self: AsyncPageT) -> AsyncPageT:
+		info = self.next_page_info()
+		if not info:
+			raise RuntimeError(
+				'No next page expected; please check `.has_next_page()` before calling `.get_next_page()`.'
+			)
+
+		options = self._info_to_options(info)
+		return await self._client._request_api_list(self._model, page=self.__class__, options=options)
+
+
+class BaseHttpClient(Generic[_HttpxClientT]):
+	"""
+	Transport-independent part of the HTTP client.
+
+	Request building, header handling, retry decisions and response parsing live here so that
+	the blocking `HttpClient` and the asyncio based `AsyncHttpClient` behave identically.
+	"""
+
+	_client: _HttpxClientT
 	_version: str
 	_base_url: URL
 	max_retries: int
 	timeout: Union[float, Timeout, None]
 	_limits: httpx.Limits
 	_has_custom_http_client: bool
-	_default_stream_cls: Type[StreamResponse[Any]] | None = None
+	_default_stream_cls: Type[StreamResponse[Any]] | Type[AsyncStreamResponse[Any]] | None = None
 
 	_strict_response_validation: bool
 
@@ -240,15 +296,22 @@ class HttpClient:
 		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
 		timeout: Union[float, Timeout, None],
 		limits: httpx.Limits | None = None,
-		custom_httpx_client: httpx.Client | None = None,
+		custom_httpx_client: _HttpxClientT | None = None,
 		custom_headers: Mapping[str, str] | None = None,
+		stream_metrics_callback: StreamMetricsCallback | None = None,
+		rate_limiter: RateLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		deadline: float | None = None,
+		hedge_policy: HedgePolicy | None = None,
+		coalescer: RequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
 	) -> None:
 		if limits is not None:
 			warnings.warn(
 				'The `connection_pool_limits` argument is deprecated. '
 				'The `http_client` argument should be passed instead',
 				category=DeprecationWarning,
-				stacklevel=3,
+				stacklevel=4,
 			)
 			if custom_httpx_client is not None:
 				raise ValueError('The `http_client` argument is mutually exclusive with `connection_pool_limits`')
@@ -264,11 +327,6 @@ class HttpClient:
 		self.timeout = timeout
 		self._limits = limits
 		self._has_custom_http_client = bool(custom_httpx_client)
-		self._client = custom_httpx_client or httpx.Client(
-			base_url=base_url,
-			timeout=self.timeout,
-			limits=limits,
-		)
 		self._version = version
 		url = URL(url=base_url)
 		if not url.raw_path.endswith(b'/'):
@@ -276,6 +334,13 @@ class HttpClient:
 		self._base_url = url
 		self._custom_headers = custom_headers or {}
 		self._strict_response_validation = _strict_response_validation
+		self.stream_metrics_callback = stream_metrics_callback
+		self.rate_limiter = rate_limiter
+		self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+		self.deadline = deadline
+		self.hedge_policy = hedge_policy
+		self.coalescer = coalescer
+		self.response_cache = response_cache
 
 	def _prepare_url(self, url: str) -> URL:
 		sub_url = URL(url)
@@ -325,23 +390,148 @@ class HttpClient:
 		remaining_retries: int,
 		options: FinalRequestOptions,
 		response_headers: Optional[httpx.Headers] = None,
+		previous_delay: Optional[float] = None,
 	) -> float:
 		max_retries = options.get_max_retries(self.max_retries)
+		nb_retries = max_retries - remaining_retries
+		return self.retry_policy.compute_delay(nb_retries, response_headers, previous_delay)
+
+	def _deadline_at(self, options: FinalRequestOptions) -> Optional[float]:
+		deadline = options.get_deadline(self.deadline)
+		return time.monotonic() + deadline if deadline is not None else None
+
+	@staticmethod
+	def _limit_attempt_timeout(
+		request: httpx.Request,
+		timeout: Dict[str, Optional[float]],
+		deadline_at: Optional[float],
+	) -> bool:
+		"""
+		Shrink every phase of the httpx timeout of `request` to the time left before the deadline.
+
+		Returns:
+			`False` if the deadline has already passed
+		"""
+		if deadline_at is None:
+			return True
+		time_left = deadline_at - time.monotonic()
+		if time_left <= 0:
+			return False
+		request.extensions['timeout'] = {
+			key: time_left if value is None else min(value, time_left) for key, value in timeout.items()
+		}
+		return True
 
-		# If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-		# retry_after = self._parse_retry_after_header(response_headers)
-		# if retry_after is not None and 0 < retry_after <= 60:
-		#     return retry_after
+	def _coalescing_key(self, cast_type: Type[object], options: FinalRequestOptions, stream: bool) -> Any:
+		if self.coalescer is None or stream or not self.coalescer.applies_to(options.url):
+			return None
+		fingerprint = self._request_fingerprint(options)
+		return None if fingerprint is None else (fingerprint, cast_type)
 
-		nb_retries = max_retries - remaining_retries
+	def _response_cache_key(self, options: FinalRequestOptions, stream: bool) -> Tuple[Optional[str], float]:
+		if self.response_cache is None:
+			return None, 0.0
+		ttl = self.response_cache.ttl_for(options, stream)
+		if ttl is None:
+			return None, 0.0
+		return self._request_fingerprint(options), ttl
+
+	@property
+	def _auth_identity(self) -> str:
+		"""Who requests are sent as; coalescing and cache keys include it so credentials never share responses."""
+		return self.auth_headers.get('Authorization', '')
 
-		# Apply exponential backoff, but not more than the max.
-		sleep_seconds = min(INITIAL_RETRY_DELAY * pow(2.0, nb_retries), MAX_RETRY_DELAY)
+	def _request_fingerprint(self, options: FinalRequestOptions) -> Optional[str]:
+		return request_fingerprint(
+			options, str(self._base_url), identity=self._auth_identity, default_headers=self._default_headers
+		)
+
+	def _store_response(self, key: str, ttl: float, response: httpx.Response, stream: bool) -> None:
+		cache = self.response_cache
+		if cache is None:
+			return
+		if not stream:
+			cache.store(key, response, ttl)
+			return
+		record_stream(
+			response,
+			lambda content: cache.store(key, response, ttl, content),
+			is_async=isinstance(self._client, httpx.AsyncClient),
+		)
 
-		# Apply some jitter, plus-or-minus half a second.
-		jitter = 1 - 0.25 * random()
-		timeout = sleep_seconds * jitter
-		return timeout if timeout >= 0 else 0
+	def _hedge_delay(self, options: FinalRequestOptions, stream: bool) -> Optional[float]:
+		if self.hedge_policy is None or stream:
+			return None
+		return self.hedge_policy.hedge_delay(options.url)
+
+	def _reserve_attempt(self, options: FinalRequestOptions, deadline_at: Optional[float]) -> Optional[float]:
+		"""
+		Charge an attempt to the rate limiter.
+
+		Returns:
+			How long to wait before sending, or `None` if the wait would outlast the deadline; the
+			attempt is not charged then
+		"""
+		if self.rate_limiter is None:
+			return 0.0
+		if deadline_at is None:
+			return self.rate_limiter.reserve(options.url, options.json_data)
+		max_wait = deadline_at - time.monotonic()
+		delay = self.rate_limiter.reserve(options.url, options.json_data, max_wait=max_wait)
+		return None if delay > max_wait else delay
+
+	def _record_latency(self, options: FinalRequestOptions, stream: bool, sent_perf: float) -> None:
+		if self.hedge_policy is not None and not stream:
+			self.hedge_policy.record_latency(options.url, time.perf_counter() - sent_perf)
+
+	def _next_retry_delay(
+		self,
+		options: FinalRequestOptions,
+		retries: int,
+		previous_delay: Optional[float],
+		deadline_at: Optional[float],
+		*,
+		response: Optional[httpx.Response] = None,
+		error: Optional[BaseException] = None,
+	) -> Optional[float]:
+		"""
+		Decide whether a failed attempt is retried.
+
+		Arguments:
+			options (FinalRequestOptions): Options of the request
+			retries (int): Retries left before this one
+			previous_delay (Optional[float]): Delay before the previous retry, if any
+			deadline_at (Optional[float]): `time.monotonic()` value by which the request must be done
+			response (Optional[httpx.Response]): The error response, if one was received
+			error (Optional[BaseException]): The exception raised while sending, otherwise
+
+		Returns:
+			Seconds to wait before the next attempt, or `None` if the failure must be raised
+		"""
+		if retries <= 0:
+			return None
+		if response is not None:
+			if not self._should_retry(response, options):
+				return None
+		elif error is None or not self._should_retry_exception(error, options):
+			return None
+
+		remaining = retries - 1
+		delay = self._calculate_retry_timeout(
+			remaining, options, response.headers if response is not None else None, previous_delay
+		)
+		if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+			log.debug('Not retrying as the deadline would pass before the next attempt')
+			return None
+		if not self.retry_policy.acquire_retry():
+			return None
+
+		if remaining == 1:
+			log.debug('1 retry left')
+		else:
+			log.debug('%i retries left', remaining)
+		log.info('Retrying request to %s in %f seconds', options.url, delay)
+		return delay
 
 	def _build_request(self, options: FinalRequestOptions) -> httpx.Request:
 		kwargs: dict[str, Any] = {}
@@ -450,6 +640,10 @@ class HttpClient:
 		if cast_type is object:
 			return cast(ResponseT, data)
 
+		# Raw stream mode: hand the decoded JSON back untouched instead of building models.
+		if cast_type is dict and is_mapping(data):
+			return cast(ResponseT, data)
+
 		try:
 			if inspect.isclass(cast_type) and issubclass(cast_type, ModelBuilderProtocol):
 				return cast(ResponseT, cast_type.build(response=response, data=data))
@@ -464,205 +658,15 @@ class HttpClient:
 	def _should_stream_response_body(self, request: httpx.Request) -> bool:
 		return request.headers.get(RAW_RESPONSE_HEADER) == 'stream'  # type: ignore[no-any-return]
 
-	def _should_retry(self, response: httpx.Response) -> bool:
-		# Note: this is not a standard header
-		should_retry_header = response.headers.get('x-should-retry')
+	def _should_retry(self, response: httpx.Response, options: FinalRequestOptions | None = None) -> bool:
+		return self.retry_policy.should_retry_response(response, options.url if options is not None else None)
 
-		# If the server explicitly says whether or not to retry, obey.
-		if should_retry_header == 'true':
-			log.debug('Retrying as header `x-should-retry` is set to `true`')
-			return True
-		if should_retry_header == 'false':
-			log.debug('Not retrying as header `x-should-retry` is set to `false`')
-			return False
-
-		# Retry on request timeouts.
-		if response.status_code == 408:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry on lock timeouts.
-		if response.status_code == 409:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry on rate limits.
-		if response.status_code == 429:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		# Retry internal errors.
-		if response.status_code >= 500:
-			log.debug('Retrying due to status code %i', response.status_code)
-			return True
-
-		log.debug('Not retrying')
-		return False
+	def _should_retry_exception(self, err: BaseException, options: FinalRequestOptions) -> bool:
+		return self.retry_policy.should_retry_exception(err, options.url)
 
 	def is_closed(self) -> bool:
 		return self._client.is_closed
 
-	def close(self):
-		try:
-			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
-				self._client.close()
-		except Exception:
-			# Ignore any exceptions during cleanup to avoid masking the original error
-			pass
-
-	def __enter__(self):
-		return self
-
-	def __exit__(self, exc_type, exc_val, exc_tb):
-		self.close()
-
-	def request(
-		self,
-		cast_type: Type[ResponseT],
-		options: FinalRequestOptions,
-		remaining_retries: Optional[int] = None,
-		*,
-		stream: bool = False,
-		stream_cls: Type[StreamResponse] | None = None,
-	) -> ResponseT | StreamResponse:
-		return self._request(
-			cast_type=cast_type,
-			options=options,
-			stream=stream,
-			stream_cls=stream_cls,
-			remaining_retries=remaining_retries,
-		)
-
-	def _request(
-		self,
-		*,
-		cast_type: Type[ResponseT],
-		options: FinalRequestOptions,
-		remaining_retries: int | None,
-		stream: bool,
-		stream_cls: Type[StreamResponse] | None,
-	) -> ResponseT | StreamResponse:
-		retries = self._remaining_retries(remaining_retries, options)
-		request = self._build_request(options)
-
-		kwargs: HttpxSendArgs = {}
-		if self.custom_auth is not None:
-			kwargs['auth'] = self.custom_auth
-		try:
-			response = self._client.send(
-				request,
-				stream=stream or self._should_stream_response_body(request=request),
-				**kwargs,
-			)
-		except httpx.TimeoutException as err:
-			log.debug('Encountered httpx.TimeoutException', exc_info=True)
-
-			if retries > 0:
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					stream=stream,
-					stream_cls=stream_cls,
-					response_headers=None,
-				)
-
-			log.debug('Raising timeout error')
-			raise APITimeoutError(request=request) from err
-		except Exception as err:
-			log.debug('Encountered Exception', exc_info=True)
-
-			if retries > 0:
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					stream=stream,
-					stream_cls=stream_cls,
-					response_headers=None,
-				)
-
-			log.debug('Raising connection error')
-			raise APIConnectionError(request=request) from err
-
-		log.debug(
-			'HTTP Request: %s %s "%i %s"',
-			request.method,
-			request.url,
-			response.status_code,
-			response.reason_phrase,
-		)
-
-		try:
-			response.raise_for_status()
-		except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-			log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
-
-			if retries > 0 and self._should_retry(err.response):
-				err.response.close()
-				return self._retry_request(
-					options,
-					cast_type,
-					retries,
-					err.response.headers,
-					stream=stream,
-					stream_cls=stream_cls,
-				)
-
-			# If the response is streamed then we need to explicitly read the response
-			# to completion before attempting to access the response text.
-			if not err.response.is_closed:
-				err.response.read()
-
-			log.debug('Re-raising status error')
-			raise self._make_status_error(err.response) from None
-
-		# return self._parse_response(
-		#     cast_type=cast_type,
-		#     options=options,
-		#     response=response,
-		#     stream=stream,
-		#     stream_cls=stream_cls,
-		# )
-		return self._process_response(
-			cast_type=cast_type,
-			options=options,
-			response=response,
-			stream=stream,
-			stream_cls=stream_cls,
-		)
-
-	def _retry_request(
-		self,
-		options: FinalRequestOptions,
-		cast_type: Type[ResponseT],
-		remaining_retries: int,
-		response_headers: httpx.Headers | None,
-		*,
-		stream: bool,
-		stream_cls: Type[StreamResponse] | None,
-	) -> ResponseT | StreamResponse:
-		remaining = remaining_retries - 1
-		if remaining == 1:
-			log.debug('1 retry left')
-		else:
-			log.debug('%i retries left', remaining)
-
-		timeout = self._calculate_retry_timeout(remaining, options, response_headers)
-		log.info('Retrying request to %s in %f seconds', options.url, timeout)
-
-		# In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
-		# different thread if necessary.
-		time.sleep(timeout)
-
-		return self._request(
-			options=options,
-			cast_type=cast_type,
-			remaining_retries=remaining,
-			stream=stream,
-			stream_cls=stream_cls,
-		)
-
 	def _process_response(
 		self,
 		*,
@@ -670,7 +674,7 @@ class HttpClient:
 		options: FinalRequestOptions,
 		response: httpx.Response,
 		stream: bool,
-		stream_cls: Type[StreamResponse] | None,
+		stream_cls: Type[StreamResponse] | Type[AsyncStreamResponse] | None,
 	) -> ResponseT:
 		# _legacy_response with raw_response_header to paser method
 		if response.request.headers.get(RAW_RESPONSE_HEADER) == 'true':
@@ -721,6 +725,305 @@ class HttpClient:
 
 		return api_response.parse()
 
+	def _make_status_error(self, response) -> APIStatusError:
+		response_text = response.text.strip()
+		status_code = response.status_code
+		error_msg = f'Error code: {status_code}, with error text {response_text}'
+
+		if status_code == 400:
+			return _errors.APIRequestFailedError(message=error_msg, response=response)
+		elif status_code == 401:
+			return _errors.APIAuthenticationError(message=error_msg, response=response)
+		elif status_code == 429:
+			return _errors.APIReachLimitError(message=error_msg, response=response)
+		elif status_code == 500:
+			return _errors.APIInternalError(message=error_msg, response=response)
+		elif status_code == 503:
+			return _errors.APIServerFlowExceedError(message=error_msg, response=response)
+		return APIStatusError(message=error_msg, response=response)
+
+
+class HttpClient(BaseHttpClient[httpx.Client]):
+	_client: httpx.Client
+	_default_stream_cls: Type[StreamResponse[Any]] | None = None
+
+	def __init__(
+		self,
+		*,
+		version: str,
+		base_url: URL,
+		_strict_response_validation: bool,
+		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+		timeout: Union[float, Timeout, None],
+		limits: httpx.Limits | None = None,
+		custom_httpx_client: httpx.Client | None = None,
+		custom_headers: Mapping[str, str] | None = None,
+		stream_metrics_callback: StreamMetricsCallback | None = None,
+		rate_limiter: RateLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		deadline: float | None = None,
+		hedge_policy: HedgePolicy | None = None,
+		coalescer: RequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
+	) -> None:
+		super().__init__(
+			version=version,
+			base_url=base_url,
+			_strict_response_validation=_strict_response_validation,
+			max_retries=max_retries,
+			timeout=timeout,
+			limits=limits,
+			custom_httpx_client=custom_httpx_client,
+			custom_headers=custom_headers,
+			stream_metrics_callback=stream_metrics_callback,
+			rate_limiter=rate_limiter,
+			retry_policy=retry_policy,
+			deadline=deadline,
+			hedge_policy=hedge_policy,
+			coalescer=coalescer,
+			response_cache=response_cache,
+		)
+		self._client = custom_httpx_client or httpx.Client(
+			base_url=base_url,
+			timeout=self.timeout,
+			limits=self._limits,
+		)
+
+	def close(self):
+		try:
+			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
+				self._client.close()
+		except Exception:
+			# Ignore any exceptions during cleanup to avoid masking the original error
+			pass
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+
+	def request(
+		self,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: Optional[int] = None,
+		*,
+		stream: bool = False,
+		stream_cls: Type[StreamResponse] | None = None,
+	) -> ResponseT | StreamResponse:
+		key = self._coalescing_key(cast_type, options, stream)
+		if key is not None:
+			return self.coalescer.do(
+				key,
+				lambda: self._request(
+					cast_type=cast_type,
+					options=options,
+					stream=stream,
+					stream_cls=stream_cls,
+					remaining_retries=remaining_retries,
+				),
+			)
+		return self._request(
+			cast_type=cast_type,
+			options=options,
+			stream=stream,
+			stream_cls=stream_cls,
+			remaining_retries=remaining_retries,
+		)
+
+	def _send_hedged(
+		self,
+		request: httpx.Request,
+		delay: float,
+		kwargs: HttpxSendArgs,
+		options: FinalRequestOptions,
+		deadline_at: Optional[float],
+	) -> httpx.Response:
+		"""
+		Send `request` and, if it is not answered within `delay` seconds, an identical second one.
+
+		Each send runs on a thread of its own, so no send waits behind other calls before the hedge
+		delay starts. The hedge is charged to the rate limiter like any other attempt and skipped when
+		its wait would outlast the deadline. The first response wins; blocking sends cannot be
+		interrupted, so the losing response is closed as soon as it arrives.
+		"""
+		results: queue.Queue[tuple[httpx.Response | None, BaseException | None]] = queue.Queue()
+		lock = threading.Lock()
+		answered = [False]
+
+		def send(attempt_request: httpx.Request) -> None:
+			try:
+				response = self._client.send(attempt_request, **kwargs)
+			except BaseException as err:
+				results.put((None, err))
+				return
+			with lock:
+				if not answered[0]:
+					results.put((response, None))
+					return
+			response.close()
+
+		def start(attempt_request: httpx.Request) -> None:
+			threading.Thread(target=send, args=(attempt_request,), name='zai-hedge', daemon=True).start()
+
+		def wait(timeout: Optional[float]) -> tuple[httpx.Response | None, BaseException | None] | None:
+			try:
+				return results.get(timeout=timeout)
+			except queue.Empty:
+				return None
+
+		start(request)
+		sent = 1
+		result = wait(delay)
+		if result is None and self.hedge_policy is not None and self.hedge_policy.acquire_hedge():
+			limited = self._reserve_attempt(options, deadline_at)
+			if limited is None:
+				log.debug('Not hedging as the rate limit wait would outlast the deadline')
+			else:
+				if limited > 0:
+					log.debug('Rate limited, waiting %.3f seconds before hedging', limited)
+					result = wait(limited)
+				if result is None:
+					log.debug('Hedging request to %s after %.3f seconds', request.url, delay)
+					start(copy_request(request))
+					sent = 2
+
+		error: BaseException | None = None
+		while sent:
+			response, attempt_error = result if result is not None else results.get()
+			result = None
+			sent -= 1
+			if response is None:
+				error = error or attempt_error
+				continue
+			with lock:
+				answered[0] = True
+			if sent and not results.empty():
+				# the other send answered before `answered` was set
+				late, _ = results.get_nowait()
+				if late is not None:
+					late.close()
+			return response
+		assert error is not None
+		raise error
+
+	def _request(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: int | None,
+		stream: bool,
+		stream_cls: Type[StreamResponse] | None,
+	) -> ResponseT | StreamResponse:
+		retries = self._remaining_retries(remaining_retries, options)
+		deadline_at = self._deadline_at(options)
+		request = self._build_request(options)
+		timeout = dict(request.extensions.get('timeout') or {})
+
+		cache_key, cache_ttl = self._response_cache_key(options, stream)
+		if cache_key is not None:
+			cached = self.response_cache.lookup(cache_key)
+			if cached is not None:
+				log.debug('Response cache hit for %s', options.url)
+				return self._process_response(
+					cast_type=cast_type,
+					options=options,
+					response=cached.to_response(request),
+					stream=stream,
+					stream_cls=stream_cls,
+				)
+
+		self.retry_policy.record_request()
+
+		kwargs: HttpxSendArgs = {}
+		if self.custom_auth is not None:
+			kwargs['auth'] = self.custom_auth
+
+		retry_delay: float | None = None
+		while True:
+			delay = self._reserve_attempt(options, deadline_at)
+			if delay is None:
+				log.debug('Raising timeout error as the rate limit wait would outlast the deadline')
+				raise APITimeoutError(request=request)
+			if delay > 0:
+				log.debug('Rate limited, waiting %.3f seconds before sending', delay)
+				time.sleep(delay)
+
+			if not self._limit_attempt_timeout(request, timeout, deadline_at):
+				log.debug('Raising timeout error as the deadline has passed')
+				raise APITimeoutError(request=request)
+
+			stream_body = stream or self._should_stream_response_body(request=request)
+			hedge_delay = self._hedge_delay(options, stream_body)
+			sent_at, sent_perf = time.time(), time.perf_counter()
+			try:
+				if hedge_delay is None:
+					response = self._client.send(request, stream=stream_body, **kwargs)
+				else:
+					response = self._send_hedged(request, hedge_delay, kwargs, options, deadline_at)
+			except httpx.TimeoutException as err:
+				log.debug('Encountered httpx.TimeoutException', exc_info=True)
+
+				retry_delay = self._next_retry_delay(options, retries, retry_delay, deadline_at, error=err)
+				if retry_delay is None:
+					log.debug('Raising timeout error')
+					raise APITimeoutError(request=request) from err
+			except Exception as err:
+				log.debug('Encountered Exception', exc_info=True)
+
+				retry_delay = self._next_retry_delay(options, retries, retry_delay, deadline_at, error=err)
+				if retry_delay is None:
+					log.debug('Raising connection error')
+					raise APIConnectionError(request=request) from err
+			else:
+				log.debug(
+					'HTTP Request: %s %s "%i %s"',
+					request.method,
+					request.url,
+					response.status_code,
+					response.reason_phrase,
+				)
+				record_request_timing(response, sent_at, sent_perf)
+				if deadline_at is not None:
+					response.extensions[DEADLINE_AT_EXTENSION] = deadline_at
+				self._record_latency(options, stream_body, sent_perf)
+
+				try:
+					response.raise_for_status()
+				except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+					log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
+
+					retry_delay = self._next_retry_delay(
+						options, retries, retry_delay, deadline_at, response=err.response
+					)
+					if retry_delay is None:
+						# If the response is streamed then we need to explicitly read the response
+						# to completion before attempting to access the response text.
+						if not err.response.is_closed:
+							err.response.read()
+
+						log.debug('Re-raising status error')
+						raise self._make_status_error(err.response) from None
+					err.response.close()
+				else:
+					if cache_key is not None:
+						self._store_response(cache_key, cache_ttl, response, stream_body)
+					return self._process_response(
+						cast_type=cast_type,
+						options=options,
+						response=response,
+						stream=stream,
+						stream_cls=stream_cls,
+					)
+
+			retries -= 1
+			# In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
+			# different thread if necessary.
+			time.sleep(retry_delay)
+
 	def _request_api_list(
 		self,
 		model: Type[object],
@@ -913,22 +1216,389 @@ class HttpClient:
 		opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
 		return self._request_api_list(model, page, opts)
 
-	def _make_status_error(self, response) -> APIStatusError:
-		response_text = response.text.strip()
-		status_code = response.status_code
-		error_msg = f'Error code: {status_code}, with error text {response_text}'
 
-		if status_code == 400:
-			return _errors.APIRequestFailedError(message=error_msg, response=response)
-		elif status_code == 401:
-			return _errors.APIAuthenticationError(message=error_msg, response=response)
-		elif status_code == 429:
-			return _errors.APIReachLimitError(message=error_msg, response=response)
-		elif status_code == 500:
-			return _errors.APIInternalError(message=error_msg, response=response)
-		elif status_code == 503:
-			return _errors.APIServerFlowExceedError(message=error_msg, response=response)
-		return APIStatusError(message=error_msg, response=response)
+class AsyncHttpClient(BaseHttpClient[httpx.AsyncClient]):
+	"""
+	asyncio counterpart of `HttpClient` built on `httpx.AsyncClient`.
+
+	Every request method is a coroutine and retry backoff is awaited instead of blocking
+	the event loop, so a single client can drive many concurrent requests and streams.
+	"""
+
+	_client: httpx.AsyncClient
+	_default_stream_cls: Type[AsyncStreamResponse[Any]] | None = None
+
+	def __init__(
+		self,
+		*,
+		version: str,
+		base_url: URL,
+		_strict_response_validation: bool,
+		max_retries: int = ZAI_DEFAULT_MAX_RETRIES,
+		timeout: Union[float, Timeout, None],
+		limits: httpx.Limits | None = None,
+		custom_httpx_client: httpx.AsyncClient | None = None,
+		custom_headers: Mapping[str, str] | None = None,
+		stream_metrics_callback: StreamMetricsCallback | None = None,
+		rate_limiter: RateLimiter | None = None,
+		retry_policy: RetryPolicy | None = None,
+		deadline: float | None = None,
+		hedge_policy: HedgePolicy | None = None,
+		coalescer: RequestCoalescer | None = None,
+		response_cache: ResponseCache | None = None,
+	) -> None:
+		super().__init__(
+			version=version,
+			base_url=base_url,
+			_strict_response_validation=_strict_response_validation,
+			max_retries=max_retries,
+			timeout=timeout,
+			limits=limits,
+			custom_httpx_client=custom_httpx_client,
+			custom_headers=custom_headers,
+			stream_metrics_callback=stream_metrics_callback,
+			rate_limiter=rate_limiter,
+			retry_policy=retry_policy,
+			deadline=deadline,
+			hedge_policy=hedge_policy,
+			coalescer=coalescer,
+			response_cache=response_cache,
+		)
+		self._client = custom_httpx_client or httpx.AsyncClient(
+			base_url=base_url,
+			timeout=self.timeout,
+			limits=self._limits,
+		)
+
+	async def close(self) -> None:
+		try:
+			if hasattr(self, '_client') and self._client is not None and not self._client.is_closed:
+				await self._client.aclose()
+		except Exception:
+			# Ignore any exceptions during cleanup to avoid masking the original error
+			pass
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	async def request(
+		self,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: Optional[int] = None,
+		*,
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		key = self._coalescing_key(cast_type, options, stream)
+		if key is not None:
+			return await self.coalescer.ado(
+				key,
+				lambda: self._request(
+					cast_type=cast_type,
+					options=options,
+					stream=stream,
+					stream_cls=stream_cls,
+					remaining_retries=remaining_retries,
+				),
+			)
+		return await self._request(
+			cast_type=cast_type,
+			options=options,
+			stream=stream,
+			stream_cls=stream_cls,
+			remaining_retries=remaining_retries,
+		)
+
+	async def _send_hedged(
+		self,
+		request: httpx.Request,
+		delay: float,
+		kwargs: HttpxSendArgs,
+		options: FinalRequestOptions,
+		deadline_at: Optional[float],
+	) -> httpx.Response:
+		"""
+		Send `request` and, if it is not answered within `delay` seconds, an identical second one.
+
+		The hedge is charged to the rate limiter and skipped when its wait would outlast the deadline.
+		The first response wins and the other request is cancelled.
+		"""
+		responses: list[httpx.Response] = []
+		errors: list[BaseException] = []
+		started = [1]
+		finished = anyio.Event()
+
+		async with anyio.create_task_group() as tg:
+
+			async def attempt(attempt_request: httpx.Request) -> None:
+				try:
+					response = await self._client.send(attempt_request, **kwargs)
+				except Exception as err:
+					errors.append(err)
+					if len(errors) == started[0]:
+						finished.set()
+					return
+				if responses:
+					await response.aclose()
+					return
+				responses.append(response)
+				finished.set()
+
+			tg.start_soon(attempt, request)
+			with anyio.move_on_after(delay):
+				await finished.wait()
+			if not finished.is_set() and self.hedge_policy is not None and self.hedge_policy.acquire_hedge():
+				limited = self._reserve_attempt(options, deadline_at)
+				if limited is None:
+					log.debug('Not hedging as the rate limit wait would outlast the deadline')
+				else:
+					if limited > 0:
+						log.debug('Rate limited, waiting %.3f seconds before hedging', limited)
+						with anyio.move_on_after(limited):
+							await finished.wait()
+					if not finished.is_set():
+						log.debug('Hedging request to %s after %.3f seconds', request.url, delay)
+						started[0] = 2
+						tg.start_soon(attempt, copy_request(request))
+			await finished.wait()
+			tg.cancel_scope.cancel()
+
+		if responses:
+			return responses[0]
+		raise errors[0]
+
+	async def _request(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		options: FinalRequestOptions,
+		remaining_retries: int | None,
+		stream: bool,
+		stream_cls: Type[AsyncStreamResponse] | None,
+	) -> ResponseT | AsyncStreamResponse:
+		retries = self._remaining_retries(remaining_retries, options)
+		deadline_at = self._deadline_at(options)
+		request = self._build_request(options)
+		timeout = dict(request.extensions.get('timeout') or {})
+
+		cache_key, cache_ttl = self._response_cache_key(options, stream)
+		if cache_key is not None:
+			cached = self.response_cache.lookup(cache_key)
+			if cached is not None:
+				log.debug('Response cache hit for %s', options.url)
+				return self._process_response(
+					cast_type=cast_type,
+					options=options,
+					response=cached.to_response(request),
+					stream=stream,
+					stream_cls=stream_cls,
+				)
+
+		self.retry_policy.record_request()
+
+		kwargs: HttpxSendArgs = {}
+		if self.custom_auth is not None:
+			kwargs['auth'] = self.custom_auth
+
+		retry_delay: float | None = None
+		while True:
+			delay = self._reserve_attempt(options, deadline_at)
+			if delay is None:
+				log.debug('Raising timeout error as the rate limit wait would outlast the deadline')
+				raise APITimeoutError(request=request)
+			if delay > 0:
+				log.debug('Rate limited, waiting %.3f seconds before sending', delay)
+				await anyio.sleep(delay)
+
+			if not self._limit_attempt_timeout(request, timeout, deadline_at):
+				log.debug('Raising timeout error as the deadline has passed')
+				raise APITimeoutError(request=request)
+
+			stream_body = stream or self._should_stream_response_body(request=request)
+			hedge_delay = self._hedge_delay(options, stream_body)
+			sent_at, sent_perf = time.time(), time.perf_counter()
+			try:
+				if hedge_delay is None:
+					response = await self._client.send(request, stream=stream_body, **kwargs)
+				else:
+					response = await self._send_hedged(request, hedge_delay, kwargs, options, deadline_at)
+			except httpx.TimeoutException as err:
+				log.debug('Encountered httpx.TimeoutException', exc_info=True)
+
+				retry_delay = self._next_retry_delay(options, retries, retry_delay, deadline_at, error=err)
+				if retry_delay is None:
+					log.debug('Raising timeout error')
+					raise APITimeoutError(request=request) from err
+			except Exception as err:
+				log.debug('Encountered Exception', exc_info=True)
+
+				retry_delay = self._next_retry_delay(options, retries, retry_delay, deadline_at, error=err)
+				if retry_delay is None:
+					log.debug('Raising connection error')
+					raise APIConnectionError(request=request) from err
+			else:
+				log.debug(
+					'HTTP Request: %s %s "%i %s"',
+					request.method,
+					request.url,
+					response.status_code,
+					response.reason_phrase,
+				)
+				record_request_timing(response, sent_at, sent_perf)
+				if deadline_at is not None:
+					response.extensions[DEADLINE_AT_EXTENSION] = deadline_at
+				self._record_latency(options, stream_body, sent_perf)
+
+				try:
+					response.raise_for_status()
+				except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
+					log.debug('Encountered httpx.HTTPStatusError', exc_info=True)
+
+					retry_delay = self._next_retry_delay(
+						options, retries, retry_delay, deadline_at, response=err.response
+					)
+					if retry_delay is None:
+						# If the response is streamed then we need to explicitly read the response
+						# to completion before attempting to access the response text.
+						if not err.response.is_closed:
+							await err.response.aread()
+
+						log.debug('Re-raising status error')
+						raise self._make_status_error(err.response) from None
+					await err.response.aclose()
+				else:
+					if cache_key is not None:
+						self._store_response(cache_key, cache_ttl, response, stream_body)
+					return self._process_response(
+						cast_type=cast_type,
+						options=options,
+						response=response,
+						stream=stream,
+						stream_cls=stream_cls,
+					)
+
+			retries -= 1
+			await anyio.sleep(retry_delay)
+
+	async def _request_api_list(
+		self,
+		model: Type[object],
+		page: Type[AsyncPageT],
+		options: FinalRequestOptions,
+	) -> AsyncPageT:
+		def _parser(resp: AsyncPageT) -> AsyncPageT:
+			resp._set_private_attributes(
+				client=self,
+				model=model,
+				options=options,
+			)
+			return resp
+
+		options.post_parser = _parser
+
+		return await self.request(page, options, stream=False)
+
+	async def get(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		options: UserRequestInput = {},
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse] | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(method='get', url=path, **options)
+		return await self.request(cast_type, opts, stream=stream, stream_cls=stream_cls)
+
+	async def post(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+		stream: bool = False,
+		stream_cls: Type[AsyncStreamResponse[Any]] | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(
+			method='post',
+			url=path,
+			json_data=body,
+			files=to_httpx_files(files),
+			**options,
+		)
+
+		return await self.request(cast_type, opts, stream=stream, stream_cls=stream_cls)
+
+	async def patch(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+	) -> ResponseT:
+		opts = FinalRequestOptions.construct(method='patch', url=path, json_data=body, **options)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def put(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		files: RequestFiles | None = None,
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(
+			method='put',
+			url=path,
+			json_data=body,
+			files=to_httpx_files(files),
+			**options,
+		)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def delete(
+		self,
+		path: str,
+		*,
+		cast_type: Type[ResponseT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+	) -> ResponseT | AsyncStreamResponse:
+		opts = FinalRequestOptions.construct(method='delete', url=path, json_data=body, **options)
+
+		return await self.request(
+			cast_type=cast_type,
+			options=opts,
+		)
+
+	async def get_api_list(
+		self,
+		path: str,
+		*,
+		model: Type[object],
+		page: Type[AsyncPageT],
+		body: Body | None = None,
+		options: UserRequestInput = {},
+		method: str = 'get',
+	) -> AsyncPageT:
+		opts = FinalRequestOptions.construct(method=method, url=path, json_data=body, **options)
+		return await self._request_api_list(model, page, opts)
 
 
 def make_request_options(
@@ -938,6 +1608,7 @@ def make_request_options(
 	extra_query: Query | None = None,
 	extra_body: Body | None = None,
 	timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+	deadline: float | None | NotGiven = NOT_GIVEN,
 	post_parser: PostParser | NotGiven = NOT_GIVEN,
 ) -> UserRequestInput:
 	"""Create a dict of type RequestOptions without keys of NotGiven values."""
@@ -957,6 +1628,9 @@ def make_request_options(
 	if not isinstance(timeout, NotGiven):
 		options['timeout'] = timeout
 
+	if not isinstance(deadline, NotGiven):
+		options['deadline'] = deadline
+
 	if is_given(post_parser):
 		# internal
 		options['post_parser'] = post_parser  # type: ignore
@@ -974,3 +1648,4 @@ def _merge_mappings(
 	"""
 	merged = {**obj1, **obj2}
 	return {key: value for key, value in merged.items() if not isinstance(value, Omit)}
+
@@ -1,10 +1,15 @@
 """JSON encoding utilities for BaseModel objects."""
 
 import json
-from typing import Any
+from typing import Any, Union
 
 from ._base_models import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 
 class ZAIJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles BaseModel objects."""
@@ -30,15 +35,23 @@ def json_dumps(obj: Any, **kwargs) -> str:
     return json.dumps(obj, cls=ZAIJSONEncoder, **kwargs)
 
 
-def json_loads(s: str, **kwargs) -> Any:
+def json_loads(s: Union[str, bytes], **kwargs) -> Any:
     """
     JSON loads with consistent interface.
-    
+
+    Uses orjson when it is installed and no custom decoding arguments are given, falling back
+    to the standard library for documents orjson rejects (e.g. NaN or Infinity).
+
     Args:
-        s: JSON string to deserialize
+        s: JSON string or UTF-8 encoded bytes to deserialize
         **kwargs: Additional arguments to pass to json.loads()
-        
+
     Returns:
         Deserialized object
     """
+    if orjson is not None and not kwargs:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
     return json.loads(s, **kwargs)
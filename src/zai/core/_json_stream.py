@@ -0,0 +1,306 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import inspect
+import re
+from typing import Any, List, Tuple, Union
+
+from ._base_models import validate_type
+from ._json_encoder import json_loads
+
+_STRING_STOP = re.compile(r'["\\]')
+_TOKEN_END = re.compile(r'[\s,\]}]')
+_WHITESPACE = ' \t\r\n'
+
+# parser states
+_START = 0
+_VALUE = 1
+_VALUE_OR_END = 2
+_KEY = 3
+_KEY_OR_END = 4
+_COLON = 5
+_AFTER_VALUE = 6
+_STRING = 7
+_TOKEN = 8
+_DONE = 9
+
+JSONPath = Tuple[Union[str, int], ...]
+
+
+class JSONEvent:
+	"""
+	A value that has been completely received.
+
+	Attributes:
+		path (Tuple[Union[str, int], ...]): Keys and list indexes leading to the value, `()` for the document itself
+		value (Any): The decoded value; containers are the same objects as in `IncrementalJSONParser.value`
+	"""
+
+	__slots__ = ('path', 'value')
+
+	def __init__(self, path: JSONPath, value: Any) -> None:
+		self.path = path
+		self.value = value
+
+	def __eq__(self, other: object) -> bool:
+		return isinstance(other, JSONEvent) and self.path == other.path and self.value == other.value
+
+	def __repr__(self) -> str:
+		return f'JSONEvent(path={self.path!r}, value={self.value!r})'
+
+
+def validate_json(value: Any, schema: Any) -> Any:
+	"""
+	Check a decoded document against `schema`.
+
+	`schema` is either a type (e.g. a pydantic model) the document is validated into, or a
+	precompiled validator with a `validate(instance)` method such as a `jsonschema` validator.
+	"""
+	if inspect.isclass(schema) or not hasattr(schema, 'validate'):
+		return validate_type(type_=schema, value=value)
+	schema.validate(value)
+	return value
+
+
+class IncrementalJSONParser:
+	"""
+	Parses a JSON document that arrives in text fragments, in time linear in its total size.
+
+	Each call to `feed()` returns the values completed by that fragment as `JSONEvent`s, and
+	`value` gives the partially built document at any point. Anything before the first `{` or `[`
+	(such as a Markdown code fence) and anything after the document is closed is ignored.
+
+	Arguments:
+		schema (Any): Optional type or precompiled validator the finished document is checked against,
+			see `validate_json`; the event for the document then carries the validated value
+	"""
+
+	def __init__(self, *, schema: Any = None) -> None:
+		self._schema = schema
+		self._state = _START
+		# one [container, key] frame per open object/array; for arrays the key is the index being filled
+		self._stack: List[List[Any]] = []
+		self._root: Any = None
+		self._result: Any = None
+		# fragments of the open string received since `_string_value` was last brought up to date
+		self._string_parts: List[str] = []
+		self._string_value = ''
+		# the raw end of an escaped string that could not be decoded yet, such as a cut off `\u00`
+		self._string_pending = ''
+		self._string_is_key = False
+		self._string_escaped = False
+		self._escape = False
+		self._partial_inserted = False
+		self._token: List[str] = []
+		self._offset = 0
+
+	@property
+	def done(self) -> bool:
+		"""Whether the whole document has been received."""
+		return self._state == _DONE
+
+	@property
+	def result(self) -> Any:
+		"""The finished (and, with a schema, validated) document, `None` until `done`."""
+		return self._result
+
+	@property
+	def value(self) -> Any:
+		"""
+		The document received so far, including the string value currently being received.
+
+		This is the live object the parser keeps filling in, not a copy.
+		"""
+		if self._state == _STRING and not self._string_is_key and (self._string_parts or self._string_value):
+			self._store_partial_string()
+		return self._root
+
+	def feed(self, text: str) -> List[JSONEvent]:
+		"""Parse the next fragment and return the values it completed."""
+		events: List[JSONEvent] = []
+		i, n = 0, len(text)
+		while i < n:
+			state = self._state
+			if state == _STRING:
+				i = self._feed_string(text, i, events)
+				continue
+			if state == _TOKEN:
+				match = _TOKEN_END.search(text, i)
+				if match is None:
+					self._token.append(text[i:])
+					break
+				self._token.append(text[i : match.start()])
+				self._finish_token(events)
+				i = match.start()
+				continue
+
+			char = text[i]
+			i += 1
+			if char in _WHITESPACE or state == _DONE:
+				continue
+
+			if state == _START:
+				if char == '{' or char == '[':
+					self._open(char, events)
+			elif state == _VALUE or state == _VALUE_OR_END:
+				if char == ']' and state == _VALUE_OR_END:
+					self._close(list, events)
+				else:
+					self._begin_value(char, events, i)
+			elif state == _KEY or state == _KEY_OR_END:
+				if char == '"':
+					self._begin_string(is_key=True)
+				elif char == '}' and state == _KEY_OR_END:
+					self._close(dict, events)
+				else:
+					self._error('expected an object key', i)
+			elif state == _COLON:
+				if char != ':':
+					self._error("expected ':'", i)
+				self._state = _VALUE
+			elif state == _AFTER_VALUE:
+				container = self._stack[-1][0]
+				if char == ',':
+					self._state = _KEY if isinstance(container, dict) else _VALUE
+				elif char == '}':
+					self._close(dict, events)
+				elif char == ']':
+					self._close(list, events)
+				else:
+					self._error("expected ',' or the end of a container", i)
+		self._offset += n
+		return events
+
+	def close(self) -> None:
+		"""Signal the end of the input; raises `ValueError` if the document is incomplete."""
+		if self._state != _DONE:
+			self._error('incomplete JSON document', 0)
+
+	def _error(self, message: str, i: int) -> None:
+		raise ValueError(f'{message} at position {self._offset + i - 1}')
+
+	def _path(self) -> JSONPath:
+		return tuple(frame[1] for frame in self._stack)
+
+	def _begin_value(self, char: str, events: List[JSONEvent], i: int) -> None:
+		frame = self._stack[-1]
+		if isinstance(frame[0], list):
+			frame[1] = len(frame[0])
+		if char == '{' or char == '[':
+			self._open(char, events)
+		elif char == '"':
+			self._begin_string(is_key=False)
+		elif char == '-' or char.isdigit() or char in 'tfn':
+			self._token = [char]
+			self._state = _TOKEN
+		else:
+			self._error('expected a value', i)
+
+	def _open(self, char: str, events: List[JSONEvent]) -> None:
+		container: Any = {} if char == '{' else []
+		if self._stack:
+			self._insert(container)
+		else:
+			self._root = container
+		self._stack.append([container, None])
+		self._state = _KEY_OR_END if char == '{' else _VALUE_OR_END
+
+	def _close(self, kind: type, events: List[JSONEvent]) -> None:
+		container = self._stack[-1][0]
+		if not isinstance(container, kind):
+			self._error('mismatched closing bracket', 0)
+		self._stack.pop()
+		if self._stack:
+			events.append(JSONEvent(self._path(), container))
+			self._state = _AFTER_VALUE
+			return
+		self._state = _DONE
+		self._result = container if self._schema is None else validate_json(container, self._schema)
+		events.append(JSONEvent((), self._result))
+
+	def _insert(self, value: Any) -> None:
+		container, key = self._stack[-1]
+		if isinstance(container, dict) or self._partial_inserted:
+			container[key] = value
+		else:
+			container.append(value)
+
+	def _complete(self, value: Any, events: List[JSONEvent]) -> None:
+		self._insert(value)
+		self._partial_inserted = False
+		events.append(JSONEvent(self._path(), value))
+		self._state = _AFTER_VALUE
+
+	def _begin_string(self, *, is_key: bool) -> None:
+		self._string_parts = []
+		self._string_value = self._string_pending = ''
+		self._string_is_key = is_key
+		self._string_escaped = False
+		self._escape = False
+		self._state = _STRING
+
+	def _feed_string(self, text: str, i: int, events: List[JSONEvent]) -> int:
+		parts = self._string_parts
+		if self._escape:
+			# the character following a backslash can never end the string
+			parts.append(text[i])
+			self._escape = False
+			return i + 1
+		match = _STRING_STOP.search(text, i)
+		if match is None:
+			parts.append(text[i:])
+			return len(text)
+		j = match.start()
+		if j > i:
+			parts.append(text[i:j])
+		if text[j] == '\\':
+			parts.append('\\')
+			self._string_escaped = self._escape = True
+			return j + 1
+
+		raw = ''.join(parts)
+		if self._string_escaped:
+			value = self._string_value + json_loads(f'"{self._string_pending}{raw}"')
+		else:
+			value = self._string_value + raw
+		if self._string_is_key:
+			self._stack[-1][1] = value
+			self._state = _COLON
+		else:
+			self._complete(value, events)
+		return j + 1
+
+	def _store_partial_string(self) -> None:
+		# only the fragments received since the last call are joined and decoded
+		parts = self._string_parts
+		if parts:
+			raw = ''.join(parts)
+			parts.clear()
+			self._string_value += self._decode_partial_string(raw) if self._string_escaped else raw
+		self._insert(self._string_value)
+		self._partial_inserted = True
+
+	def _decode_partial_string(self, raw: str) -> str:
+		pending = self._string_pending + raw
+		# drop a trailing escape sequence that has not been fully received yet
+		for candidate in (pending, pending[: pending.rfind('\\')]):
+			try:
+				decoded = json_loads(f'"{candidate}"')
+			except ValueError:
+				continue
+			if decoded and '\ud800' <= decoded[-1] <= '\udbff':
+				# keep a high surrogate back until the escape of its low half has arrived
+				candidate, decoded = candidate[:-6], decoded[:-1]
+			self._string_pending = pending[len(candidate) :]
+			return decoded
+		self._string_pending = pending
+		return ''
+
+	def _finish_token(self, events: List[JSONEvent]) -> None:
+		token = ''.join(self._token)
+		try:
+			value = json_loads(token)
+		except ValueError:
+			self._error(f'invalid literal {token!r}', 0)
+		self._complete(value, events)
+
@@ -0,0 +1,186 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from ._utils import is_list, is_mapping
+
+# Request body fields whose text is sent to the model
+_PROMPT_FIELDS = ('messages', 'input', 'prompt', 'query', 'content', 'text')
+# Completion budget fields that count towards tokens/minute as well
+_COMPLETION_FIELDS = ('max_tokens',)
+
+TokenEstimator = Callable[[Any], int]
+RateLimitKey = Union[str, Tuple[str, str]]
+
+
+def _count_text_bytes(value: object) -> int:
+	if isinstance(value, str):
+		return len(value.encode('utf-8'))
+	if is_mapping(value):
+		return sum(_count_text_bytes(item) for item in value.values())
+	if is_list(value):
+		return sum(_count_text_bytes(item) for item in value)
+	return 0
+
+
+def estimate_tokens(body: Any) -> int:
+	"""
+	Roughly estimate the tokens a request consumes from its JSON body.
+
+	Counts about one token per 4 bytes of UTF-8 prompt text, plus the requested `max_tokens`.
+	"""
+	if not is_mapping(body):
+		return 0
+	size = sum(_count_text_bytes(body.get(field)) for field in _PROMPT_FIELDS)
+	tokens = math.ceil(size / 4)
+	for field in _COMPLETION_FIELDS:
+		value = body.get(field)
+		if isinstance(value, int):
+			tokens += value
+	return tokens
+
+
+class RateLimit:
+	"""
+	Requests/minute and tokens/minute allowed for one model on one endpoint.
+
+	Attributes:
+		requests_per_minute (Optional[float]): Maximum requests per minute, unlimited if None
+		tokens_per_minute (Optional[float]): Maximum estimated tokens per minute, unlimited if None
+	"""
+
+	def __init__(
+		self,
+		*,
+		requests_per_minute: Optional[float] = None,
+		tokens_per_minute: Optional[float] = None,
+	) -> None:
+		self.requests_per_minute = requests_per_minute
+		self.tokens_per_minute = tokens_per_minute
+
+	def __repr__(self) -> str:
+		return f'RateLimit(requests_per_minute={self.requests_per_minute}, tokens_per_minute={self.tokens_per_minute})'
+
+
+class TokenBucket:
+	"""
+	Token bucket refilled continuously up to `capacity`.
+
+	`reserve()` takes the requested amount right away, letting the level go negative, and returns
+	how long the caller has to wait before its share is actually available. Waiting outside the
+	lock keeps concurrent callers queued in arrival order for both threads and coroutines.
+	"""
+
+	def __init__(self, capacity: float, per_second: float) -> None:
+		self.capacity = capacity
+		self.per_second = per_second
+		self._level = capacity
+		self._updated = time.monotonic()
+		self._lock = threading.Lock()
+
+	def reserve(self, amount: float = 1) -> float:
+		with self._lock:
+			now = time.monotonic()
+			self._level = min(self.capacity, self._level + (now - self._updated) * self.per_second)
+			self._updated = now
+			self._level -= amount
+			if self._level >= 0:
+				return 0.0
+			return -self._level / self.per_second
+
+	def release(self, amount: float = 1) -> None:
+		"""Give back an amount taken by `reserve()` that is not going to be used."""
+		with self._lock:
+			self._level = min(self.capacity, self._level + amount)
+
+
+class RateLimiter:
+	"""
+	Client-side rate limiter applied before every request attempt.
+
+	Buckets are kept per model and endpoint path. The limits for a request are looked up in
+	`limits` by `(model, path)`, then `model`, then `path`, falling back to `default`; the
+	path is the API path such as `/chat/completions`.
+
+	Arguments:
+		limits (Mapping[Union[str, Tuple[str, str]], RateLimit]): Limits by `(model, path)`, model or path
+		default (Optional[RateLimit]): Limits for requests that match no key
+		token_estimator (Callable[[Any], int]): Estimates the tokens of a JSON request body
+	"""
+
+	def __init__(
+		self,
+		limits: Optional[Mapping[RateLimitKey, RateLimit]] = None,
+		*,
+		default: Optional[RateLimit] = None,
+		token_estimator: TokenEstimator = estimate_tokens,
+	) -> None:
+		self._limits = {self._normalize_key(key): limit for key, limit in (limits or {}).items()}
+		self._default = default
+		self._token_estimator = token_estimator
+		self._buckets: Dict[Tuple[str, str], Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+		self._lock = threading.Lock()
+
+	@staticmethod
+	def _normalize_path(path: str) -> str:
+		return '/' + path.lstrip('/')
+
+	@classmethod
+	def _normalize_key(cls, key: RateLimitKey) -> RateLimitKey:
+		if isinstance(key, tuple):
+			return key[0], cls._normalize_path(key[1])
+		return cls._normalize_path(key) if key.startswith('/') else key
+
+	def _find_limit(self, model: str, path: str) -> Optional[RateLimit]:
+		for key in ((model, path), model, path):
+			limit = self._limits.get(key)
+			if limit is not None:
+				return limit
+		return self._default
+
+	def _get_buckets(self, model: str, path: str) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+		key = (model, path)
+		buckets = self._buckets.get(key)
+		if buckets is None:
+			with self._lock:
+				buckets = self._buckets.get(key)
+				if buckets is None:
+					limit = self._find_limit(model, path)
+					rpm = limit.requests_per_minute if limit else None
+					tpm = limit.tokens_per_minute if limit else None
+					buckets = self._buckets[key] = (
+						TokenBucket(rpm, rpm / 60) if rpm else None,
+						TokenBucket(tpm, tpm / 60) if tpm else None,
+					)
+		return buckets
+
+	def reserve(self, path: str, body: Any, max_wait: Optional[float] = None) -> float:
+		"""
+		Take one request and the estimated tokens of `body` from the matching buckets.
+
+		Arguments:
+			path (str): API path of the request
+			body (Any): JSON request body
+			max_wait (Optional[float]): When the wait would be longer, nothing is taken
+
+		Returns:
+			The number of seconds to wait before sending the request
+		"""
+		model = body.get('model') if is_mapping(body) else None
+		requests, tokens = self._get_buckets(model if isinstance(model, str) else '', self._normalize_path(path))
+		delay = 0.0
+		if requests is not None:
+			delay = requests.reserve(1)
+		if tokens is not None:
+			amount = min(self._token_estimator(body), tokens.capacity)
+			delay = max(delay, tokens.reserve(amount))
+		if max_wait is not None and delay > max_wait:
+			if requests is not None:
+				requests.release(1)
+			if tokens is not None:
+				tokens.release(amount)
+		return delay
@@ -16,6 +16,7 @@ class UserRequestInput(TypedDict, total=False):
 	headers: Headers
 	max_retries: int
 	timeout: float | Timeout | None
+	deadline: float | None
 	params: Query
 	extra_json: AnyMapping
 
@@ -27,6 +28,7 @@ class FinalRequestOptionsInput(TypedDict, total=False):
 	headers: Headers
 	max_retries: int
 	timeout: float | Timeout | None
+	deadline: float | None
 	files: HttpxRequestFiles | None
 	json_data: Body
 	extra_json: AnyMapping
@@ -40,6 +42,8 @@ class FinalRequestOptions(pydantic.BaseModel):
 	headers: Union[Headers, NotGiven] = NotGiven()
 	max_retries: Union[int, NotGiven] = NotGiven()
 	timeout: Union[float, Timeout, None, NotGiven] = NotGiven()
+	# total seconds allowed across all attempts and backoff sleeps
+	deadline: Union[float, None, NotGiven] = NotGiven()
 	files: Union[HttpxRequestFiles, None] = None
 	idempotency_key: Union[str, None] = None
 	post_parser: Union[Callable[[Any], Any], NotGiven] = NotGiven()
@@ -61,6 +65,11 @@ class FinalRequestOptions(pydantic.BaseModel):
 			return max_retries
 		return self.max_retries
 
+	def get_deadline(self, deadline: float | None) -> float | None:
+		if isinstance(self.deadline, NotGiven):
+			return deadline
+		return self.deadline
+
 	def _strip_raw_response_header(self) -> None:
 		if not is_given(self.headers):
 			return
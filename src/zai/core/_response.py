@@ -12,7 +12,7 @@ from typing_extensions import ParamSpec, get_origin, override
 from ._base_models import BaseModel, is_basemodel
 from ._base_type import NoneType
 from ._errors import APIResponseValidationError, ZaiError
-from ._streaming import StreamResponse, extract_stream_chunk_type, is_stream_class_type
+from ._streaming import AsyncStreamResponse, StreamResponse, extract_stream_chunk_type, is_stream_class_type
 from ._utils import (
 	extract_type_arg,
 	extract_type_var_from_base,
@@ -36,7 +36,7 @@ class BaseAPIResponse(Generic[R]):
 	_client: 'HttpClient'
 	_parsed_by_type: dict[type[Any], Any]
 	_is_sse_stream: bool
-	_stream_cls: type[StreamResponse[Any]]
+	_stream_cls: type[StreamResponse[Any]] | type[AsyncStreamResponse[Any]] | None
 	_options: FinalRequestOptions
 	http_response: httpx.Response
 
@@ -47,7 +47,7 @@ class BaseAPIResponse(Generic[R]):
 		cast_type: type[R],
 		client: 'HttpClient',
 		stream: bool,
-		stream_cls: type[StreamResponse[Any]] | None = None,
+		stream_cls: type[StreamResponse[Any]] | type[AsyncStreamResponse[Any]] | None = None,
 		options: FinalRequestOptions,
 	) -> None:
 		self._cast_type = cast_type
@@ -0,0 +1,287 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import email.utils
+import logging
+import re
+import threading
+import time
+from collections import deque
+from random import random, uniform
+from typing import Collection, Deque, List, Mapping, Optional, Tuple, Type
+
+import httpx
+from typing_extensions import Literal
+
+from ._constants import INITIAL_RETRY_DELAY, MAX_RETRY_DELAY
+from ._errors import APIConnectionError, APIStatusError
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_STATUSES = frozenset([408, 409, 429, *range(500, 600)])
+
+JitterMode = Literal['proportional', 'full', 'decorrelated']
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+# Values above this are treated as unix timestamps rather than a number of seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_duration(value: str) -> Optional[float]:
+	"""Parse `"1.5"`, `"20ms"`, `"6m0s"` or a unix timestamp into seconds from now."""
+	value = value.strip()
+	try:
+		seconds = float(value)
+	except ValueError:
+		parts = _DURATION_PART.findall(value)
+		if not parts or ''.join(number + unit for number, unit in parts) != value:
+			return None
+		return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+	if seconds > _EPOCH_THRESHOLD:
+		return seconds - time.time()
+	return seconds
+
+
+def parse_retry_after(headers: Optional[httpx.Headers]) -> Optional[float]:
+	"""
+	Work out how long the server asked us to wait, in seconds.
+
+	Reads `retry-after-ms`, `Retry-After` (seconds or an HTTP date) and, for exhausted rate
+	limits, the matching `x-ratelimit-reset-*` header.
+	"""
+	if headers is None:
+		return None
+
+	retry_ms = headers.get('retry-after-ms')
+	if retry_ms is not None:
+		try:
+			return float(retry_ms) / 1000
+		except ValueError:
+			pass
+
+	retry_after = headers.get('retry-after')
+	if retry_after is not None:
+		seconds = _parse_duration(retry_after)
+		if seconds is not None:
+			return seconds
+		date = email.utils.parsedate_tz(retry_after)
+		if date is not None:
+			return email.utils.mktime_tz(date) - time.time()
+
+	delays: List[float] = []
+	for kind in ('requests', 'tokens'):
+		if headers.get(f'x-ratelimit-remaining-{kind}', '').strip() == '0':
+			reset = headers.get(f'x-ratelimit-reset-{kind}')
+			seconds = _parse_duration(reset) if reset is not None else None
+			if seconds is not None:
+				delays.append(seconds)
+	if not delays and headers.get('x-ratelimit-remaining', '').strip() == '0':
+		reset = headers.get('x-ratelimit-reset')
+		seconds = _parse_duration(reset) if reset is not None else None
+		if seconds is not None:
+			delays.append(seconds)
+	return max(delays) if delays else None
+
+
+class RetryBudget:
+	"""
+	Client-wide cap on retries as a fraction of recent traffic.
+
+	Over a sliding window of `window` seconds, retries are allowed while their number stays
+	below `min_retries + ratio * requests`, so a burst of failures cannot multiply the load on
+	the API by `max_retries`.
+
+	Arguments:
+		ratio (float): Retries allowed per original request
+		min_retries (int): Retries always allowed per window, so that low traffic can still retry
+		window (float): Length of the sliding window in seconds
+	"""
+
+	def __init__(self, *, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0) -> None:
+		self.ratio = ratio
+		self.min_retries = min_retries
+		self.window = window
+		# one [second, requests, retries] slot per second of the window
+		self._slots: Deque[List[int]] = deque()
+		self._lock = threading.Lock()
+
+	def _slot(self) -> List[int]:
+		second = int(time.monotonic())
+		slots = self._slots
+		while slots and slots[0][0] <= second - self.window:
+			slots.popleft()
+		if not slots or slots[-1][0] != second:
+			slots.append([second, 0, 0])
+		return slots[-1]
+
+	def record_request(self) -> None:
+		"""Count an original (non-retry) request."""
+		with self._lock:
+			self._slot()[1] += 1
+
+	def try_acquire(self) -> bool:
+		"""Take a retry from the budget; returns `False` if it is exhausted."""
+		with self._lock:
+			slot = self._slot()
+			requests = sum(s[1] for s in self._slots)
+			retries = sum(s[2] for s in self._slots)
+			if retries >= self.min_retries + self.ratio * requests:
+				return False
+			slot[2] += 1
+			return True
+
+
+class EndpointRetryRule:
+	"""
+	Retry settings that override the `RetryPolicy` defaults for one endpoint.
+
+	Attributes:
+		retry_statuses (Optional[Collection[int]]): Status codes to retry
+		retry_exceptions (Optional[Tuple[Type[BaseException], ...]]): Exceptions raised while sending to retry
+	"""
+
+	def __init__(
+		self,
+		*,
+		retry_statuses: Optional[Collection[int]] = None,
+		retry_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
+	) -> None:
+		self.retry_statuses = retry_statuses
+		self.retry_exceptions = retry_exceptions
+
+
+class RetryPolicy:
+	"""
+	Decides whether and when a failed request is retried.
+
+	Arguments:
+		retry_statuses (Collection[int]): Status codes to retry, by default 408, 409, 429 and 5xx
+		retry_exceptions (Tuple[Type[BaseException], ...]): Exceptions raised while sending to retry
+		endpoint_rules (Mapping[str, EndpointRetryRule]): Overrides by API path such as `/chat/completions`;
+			the longest matching path prefix wins
+		jitter (str): `proportional` (up to 25% below the exponential delay), `full` (uniform between 0
+			and the exponential delay) or `decorrelated` (uniform between the initial delay and three
+			times the previous one)
+		initial_delay (float): Delay before the first retry
+		max_delay (float): Upper bound of the computed delay
+		respect_retry_after (bool): Whether to wait as long as the `Retry-After` / `x-ratelimit-*` headers ask
+		max_retry_after (float): Server requested delays longer than this are ignored
+		budget (Optional[RetryBudget]): Client-wide retry budget
+	"""
+
+	def __init__(
+		self,
+		*,
+		retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+		retry_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+		endpoint_rules: Optional[Mapping[str, EndpointRetryRule]] = None,
+		jitter: JitterMode = 'proportional',
+		initial_delay: float = INITIAL_RETRY_DELAY,
+		max_delay: float = MAX_RETRY_DELAY,
+		respect_retry_after: bool = True,
+		max_retry_after: float = 60.0,
+		budget: Optional[RetryBudget] = None,
+	) -> None:
+		self.retry_statuses = retry_statuses
+		self.retry_exceptions = retry_exceptions
+		self.endpoint_rules = {'/' + path.lstrip('/'): rule for path, rule in (endpoint_rules or {}).items()}
+		self.jitter = jitter
+		self.initial_delay = initial_delay
+		self.max_delay = max_delay
+		self.respect_retry_after = respect_retry_after
+		self.max_retry_after = max_retry_after
+		self.budget = budget
+
+	def _rule(self, path: Optional[str]) -> Optional[EndpointRetryRule]:
+		if path is None or not self.endpoint_rules:
+			return None
+		path = '/' + path.lstrip('/')
+		matches = [prefix for prefix in self.endpoint_rules if path.startswith(prefix)]
+		return self.endpoint_rules[max(matches, key=len)] if matches else None
+
+	def should_retry_response(self, response: httpx.Response, path: Optional[str] = None) -> bool:
+		# Note: this is not a standard header
+		should_retry_header = response.headers.get('x-should-retry')
+
+		# If the server explicitly says whether or not to retry, obey.
+		if should_retry_header == 'true':
+			log.debug('Retrying as header `x-should-retry` is set to `true`')
+			return True
+		if should_retry_header == 'false':
+			log.debug('Not retrying as header `x-should-retry` is set to `false`')
+			return False
+
+		rule = self._rule(path)
+		statuses = rule.retry_statuses if rule is not None and rule.retry_statuses is not None else self.retry_statuses
+		if response.status_code in statuses:
+			log.debug('Retrying due to status code %i', response.status_code)
+			return True
+
+		log.debug('Not retrying')
+		return False
+
+	def should_retry_exception(self, err: BaseException, path: Optional[str] = None) -> bool:
+		rule = self._rule(path)
+		exceptions = (
+			rule.retry_exceptions if rule is not None and rule.retry_exceptions is not None else self.retry_exceptions
+		)
+		return isinstance(err, exceptions)
+
+	def acquire_retry(self) -> bool:
+		"""Check the retry budget; returns `False` if this retry must not happen."""
+		if self.budget is None or self.budget.try_acquire():
+			return True
+		log.debug('Not retrying as the retry budget is exhausted')
+		return False
+
+	def record_request(self) -> None:
+		if self.budget is not None:
+			self.budget.record_request()
+
+	def compute_delay(
+		self,
+		retry_number: int,
+		response_headers: Optional[httpx.Headers] = None,
+		previous_delay: Optional[float] = None,
+	) -> float:
+		"""
+		Seconds to wait before retry number `retry_number` (starting at 0).
+
+		Arguments:
+			retry_number (int): How many retries have already been made
+			response_headers (Optional[httpx.Headers]): Headers of the failed response, if any
+			previous_delay (Optional[float]): Delay before the previous retry, used by decorrelated jitter
+		"""
+		# If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
+		if self.respect_retry_after:
+			retry_after = parse_retry_after(response_headers)
+			if retry_after is not None and 0 < retry_after <= self.max_retry_after:
+				return retry_after
+
+		if self.jitter == 'decorrelated':
+			upper = max(self.initial_delay, (previous_delay or self.initial_delay) * 3)
+			return min(self.max_delay, uniform(self.initial_delay, upper))
+
+		# Apply exponential backoff, but not more than the max.
+		sleep_seconds = min(self.initial_delay * pow(2.0, retry_number), self.max_delay)
+		if self.jitter == 'full':
+			return uniform(0, sleep_seconds)
+
+		# Apply some jitter, up to a quarter of the delay.
+		timeout = sleep_seconds * (1 - 0.25 * random())
+		return timeout if timeout >= 0 else 0
+
+	def delay_after_error(self, err: BaseException, retry_number: int, path: Optional[str] = None) -> Optional[float]:
+		"""
+		Seconds to wait before repeating work that failed with `err`, or `None` if it is not worth a retry.
+
+		Bulk helpers use this to retry one batch or file on its own after the client's retries gave up.
+		"""
+		if isinstance(err, APIStatusError):
+			if not self.should_retry_response(err.response, path):
+				return None
+			return self.compute_delay(retry_number, err.response.headers)
+		if isinstance(err, APIConnectionError):
+			return self.compute_delay(retry_number)
+		return None
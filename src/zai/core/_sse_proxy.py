@@ -0,0 +1,113 @@
+# -*- coding:utf-8 -*-
+"""
+Helpers for re-emitting an upstream stream from a WSGI or ASGI gateway.
+
+The adapters forward the original `data:` payload bytes of every event as they arrive, without
+decoding, parsing or re-serializing them. The stream is terminated with `data: [DONE]`, and an
+upstream error event is forwarded as a final `data: {"error": ...}` event.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from ._errors import APIResponseError
+from ._json_encoder import json_dumps
+from ._streaming import AsyncStreamResponse, StreamResponse
+
+_DONE_FRAME = b'data: [DONE]\n\n'
+
+SSE_RESPONSE_HEADERS: List[Tuple[str, str]] = [
+	('Content-Type', 'text/event-stream'),
+	('Cache-Control', 'no-cache'),
+	('X-Accel-Buffering', 'no'),
+]
+
+WSGIApp = Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+ASGIApp = Callable[[Dict[str, Any], Callable[[], Awaitable[Any]], Callable[[Dict[str, Any]], Awaitable[None]]], Awaitable[None]]
+
+
+def _error_frame(err: APIResponseError) -> bytes:
+	return b'data: ' + json_dumps({'error': err.json_data}, ensure_ascii=False).encode('utf-8') + b'\n\n'
+
+
+def iter_sse_frames(stream: StreamResponse[Any]) -> Iterator[bytes]:
+	"""
+	Re-frame the raw events of `stream` as server-sent events, one `bytes` object per event.
+
+	Arguments:
+		stream (StreamResponse): The upstream stream, which must not have been iterated yet
+	"""
+	try:
+		for payload in stream.iter_raw_events():
+			yield b'data: ' + payload + b'\n\n'
+	except APIResponseError as err:
+		yield _error_frame(err)
+		return
+	finally:
+		stream.close()
+	yield _DONE_FRAME
+
+
+async def aiter_sse_frames(stream: AsyncStreamResponse[Any]) -> AsyncIterator[bytes]:
+	"""
+	Re-frame the raw events of `stream` as server-sent events, one `bytes` object per event.
+
+	Arguments:
+		stream (AsyncStreamResponse): The upstream stream, which must not have been iterated yet
+	"""
+	try:
+		async for payload in stream.aiter_raw_events():
+			yield b'data: ' + payload + b'\n\n'
+	except APIResponseError as err:
+		yield _error_frame(err)
+		return
+	finally:
+		await stream.aclose()
+	yield _DONE_FRAME
+
+
+def sse_wsgi_app(stream: StreamResponse[Any]) -> WSGIApp:
+	"""
+	Build a WSGI application that forwards `stream` to the client.
+
+	The upstream response is released when the WSGI server closes the returned iterable,
+	including when the client disconnects early.
+
+	Arguments:
+		stream (StreamResponse): The upstream stream, which must not have been iterated yet
+	"""
+
+	def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+		start_response('200 OK', list(SSE_RESPONSE_HEADERS))
+		return iter_sse_frames(stream)
+
+	return app
+
+
+def sse_asgi_app(stream: AsyncStreamResponse[Any]) -> ASGIApp:
+	"""
+	Build an ASGI application that forwards `stream` to the client.
+
+	Frameworks that accept an async iterator for streaming bodies (e.g. Starlette's
+	`StreamingResponse`) can use `aiter_sse_frames` directly instead.
+
+	Arguments:
+		stream (AsyncStreamResponse): The upstream stream, which must not have been iterated yet
+	"""
+	headers = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in SSE_RESPONSE_HEADERS]
+
+	async def app(
+		scope: Dict[str, Any],
+		receive: Callable[[], Awaitable[Any]],
+		send: Callable[[Dict[str, Any]], Awaitable[None]],
+	) -> None:
+		try:
+			await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+			async for frame in aiter_sse_frames(stream):
+				await send({'type': 'http.response.body', 'body': frame, 'more_body': True})
+			await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+		finally:
+			await stream.aclose()
+
+	return app
@@ -0,0 +1,180 @@
+# -*- coding:utf-8 -*-
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+import httpx
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# `response.extensions` keys under which the http client records when a request was sent
+REQUEST_SENT_AT_EXTENSION = 'zai_request_sent_at'
+REQUEST_SENT_PERF_EXTENSION = 'zai_request_sent_perf'
+HEADERS_RECEIVED_PERF_EXTENSION = 'zai_headers_received_perf'
+
+DEFAULT_GAP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+StreamMetricsCallback = Callable[['StreamMetrics'], None]
+
+
+def record_request_timing(response: httpx.Response, sent_at: float, sent_perf: float) -> None:
+	"""Stash when the request was sent and when its headers arrived on `response`."""
+	response.extensions[REQUEST_SENT_AT_EXTENSION] = sent_at
+	response.extensions[REQUEST_SENT_PERF_EXTENSION] = sent_perf
+	response.extensions[HEADERS_RECEIVED_PERF_EXTENSION] = time.perf_counter()
+
+
+def _get(obj: Any, name: str) -> Any:
+	if isinstance(obj, dict):
+		return obj.get(name)
+	return getattr(obj, name, None)
+
+
+class StreamMetrics:
+	"""
+	Timing metrics of a single streamed response.
+
+	Durations are in seconds and measured from the moment the request was sent; they are
+	`None` until the corresponding event has happened.
+
+	Attributes:
+		url (str): URL of the streamed request
+		model (Optional[str]): Model reported by the stream chunks
+		request_sent_at (Optional[float]): Wall-clock timestamp at which the request was sent
+		time_to_headers (Optional[float]): Time until the response headers were received
+		time_to_first_chunk (Optional[float]): Time until the first event was received
+		time_to_first_token (Optional[float]): Time until the first non-empty `delta.content`
+		time_to_first_reasoning_token (Optional[float]): Time until the first non-empty `delta.reasoning_content`
+		total_duration (Optional[float]): Time until the stream was finished or closed
+		chunk_count (int): Number of events received
+		inter_chunk_gaps (List[float]): Time between consecutive events
+		usage (Optional[object]): `usage` reported by the last chunk that carried one
+		finished (bool): Whether the stream has been finished or closed
+	"""
+
+	def __init__(
+		self,
+		*,
+		url: str = '',
+		request_sent_at: Optional[float] = None,
+		sent_perf: Optional[float] = None,
+		headers_perf: Optional[float] = None,
+	) -> None:
+		self.url = url
+		self.model: Optional[str] = None
+		self.request_sent_at = request_sent_at
+		self._start = sent_perf if sent_perf is not None else time.perf_counter()
+		self.time_to_headers = headers_perf - self._start if headers_perf is not None else None
+		self.time_to_first_chunk: Optional[float] = None
+		self.time_to_first_token: Optional[float] = None
+		self.time_to_first_reasoning_token: Optional[float] = None
+		self.total_duration: Optional[float] = None
+		self.chunk_count = 0
+		self.inter_chunk_gaps: List[float] = []
+		self.usage: Optional[object] = None
+		self.finished = False
+		self._last_chunk: Optional[float] = None
+
+	@classmethod
+	def from_response(cls, response: httpx.Response) -> StreamMetrics:
+		extensions = response.extensions
+		try:
+			url = str(response.request.url)
+		except RuntimeError:
+			url = ''
+		return cls(
+			url=url,
+			request_sent_at=extensions.get(REQUEST_SENT_AT_EXTENSION),
+			sent_perf=extensions.get(REQUEST_SENT_PERF_EXTENSION),
+			headers_perf=extensions.get(HEADERS_RECEIVED_PERF_EXTENSION),
+		)
+
+	def on_event(self) -> None:
+		"""Record the arrival of an event."""
+		now = time.perf_counter()
+		if self._last_chunk is None:
+			self.time_to_first_chunk = now - self._start
+		else:
+			self.inter_chunk_gaps.append(now - self._last_chunk)
+		self._last_chunk = now
+		self.chunk_count += 1
+
+	def on_chunk(self, chunk: object) -> None:
+		"""Inspect a decoded chunk (model or dict) for content/reasoning deltas, model and usage."""
+		if self.model is None:
+			self.model = _get(chunk, 'model')
+		usage = _get(chunk, 'usage')
+		if usage is not None:
+			self.usage = usage
+		if self.time_to_first_token is not None and self.time_to_first_reasoning_token is not None:
+			return
+		choices = _get(chunk, 'choices')
+		if not choices:
+			return
+		delta = _get(choices[0], 'delta')
+		if delta is None:
+			return
+		elapsed = (self._last_chunk if self._last_chunk is not None else time.perf_counter()) - self._start
+		if self.time_to_first_token is None and _get(delta, 'content'):
+			self.time_to_first_token = elapsed
+		if self.time_to_first_reasoning_token is None and _get(delta, 'reasoning_content'):
+			self.time_to_first_reasoning_token = elapsed
+
+	def finish(self) -> bool:
+		"""Mark the stream as finished; returns `False` if it already was."""
+		if self.finished:
+			return False
+		self.finished = True
+		self.total_duration = time.perf_counter() - self._start
+		return True
+
+	@property
+	def completion_tokens(self) -> Optional[int]:
+		return _get(self.usage, 'completion_tokens') if self.usage is not None else None
+
+	@property
+	def tokens_per_second(self) -> Optional[float]:
+		"""Completion tokens per second of generation, measured from the first token to the end of the stream."""
+		tokens = self.completion_tokens
+		if not tokens or self.total_duration is None:
+			return None
+		firsts = [t for t in (self.time_to_first_token, self.time_to_first_reasoning_token) if t is not None]
+		first = min(firsts) if firsts else self.time_to_first_chunk or 0.0
+		duration = self.total_duration - first
+		return tokens / duration if duration > 0 else None
+
+	def gap_histogram(self, buckets: Sequence[float] = DEFAULT_GAP_BUCKETS) -> List[int]:
+		"""
+		Count inter-chunk gaps per bucket.
+
+		Arguments:
+			buckets (Sequence[float]): Ascending upper bounds in seconds
+
+		Returns:
+			One count per bucket (gaps `<=` its upper bound) plus a final overflow count
+		"""
+		counts = [0] * (len(buckets) + 1)
+		for gap in self.inter_chunk_gaps:
+			counts[bisect.bisect_left(buckets, gap)] += 1
+		return counts
+
+	def __repr__(self) -> str:
+		return (
+			f'StreamMetrics(url={self.url!r}, time_to_headers={self.time_to_headers}, '
+			f'time_to_first_token={self.time_to_first_token}, '
+			f'time_to_first_reasoning_token={self.time_to_first_reasoning_token}, '
+			f'total_duration={self.total_duration}, chunk_count={self.chunk_count})'
+		)
+
+
+def emit_stream_metrics(callback: Optional[StreamMetricsCallback], metrics: StreamMetrics) -> None:
+	"""Finish `metrics` and report them once; errors raised by the callback are logged, not propagated."""
+	if not metrics.finish() or callback is None:
+		return
+	try:
+		callback(metrics)
+	except Exception:
+		log.exception('stream metrics callback failed')
@@ -2,33 +2,42 @@
 from __future__ import annotations
 
 import inspect
-import json
-from typing import TYPE_CHECKING, Generic, Iterator, Mapping, Type, cast
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Generic, Iterator, Type, cast
 
 import httpx
 from typing_extensions import TypeGuard
 
 from . import get_origin
 from ._base_type import ResponseT
-from ._errors import APIResponseError
+from ._constants import DEADLINE_AT_EXTENSION
+from ._errors import APIResponseError, APITimeoutError
+from ._json_encoder import json_loads
+from ._stream_metrics import StreamMetrics, emit_stream_metrics
 from ._utils import extract_type_var_from_base, is_mapping
 
 _FIELD_SEPARATOR = ':'
+_MISSING = object()
 
 if TYPE_CHECKING:
-	from ._http_client import HttpClient
+	from ._http_client import AsyncHttpClient, HttpClient
 
 
 class StreamResponse(Generic[ResponseT]):
 	"""
 	Stream response class, used to stream response from server.
 
+	A `deadline` of the request also bounds reading the body: `APITimeoutError` is raised from
+	iteration once it has passed.
+
 	Attributes:
 		response: The response from server.
+		metrics: Timing metrics of the stream, filled in while it is consumed.
 		_cast_type: The type of response.
 	"""
 
 	response: httpx.Response
+	metrics: StreamMetrics
 	_cast_type: Type[ResponseT]
 
 	def __init__(
@@ -41,6 +50,9 @@ class StreamResponse(Generic[ResponseT]):
 		self.response = response
 		self._cast_type = cast_type
 		self._data_process_func = client._process_response_data
+		self.metrics = StreamMetrics.from_response(response)
+		self._metrics_callback = getattr(client, 'stream_metrics_callback', None)
+		self._deadline_at = response.extensions.get(DEADLINE_AT_EXTENSION)
 		self._stream_chunks = self.__stream__()
 
 	def __next__(self) -> ResponseT:
@@ -50,85 +62,229 @@ class StreamResponse(Generic[ResponseT]):
 		for item in self._stream_chunks:
 			yield item
 
-	def __stream__(self) -> Iterator[ResponseT]:
-		sse_line_parser = SSELineParser()
-		iterator = sse_line_parser.iter_lines(self.response.iter_lines())
+	def __enter__(self) -> StreamResponse[ResponseT]:
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.close()
+
+	def close(self) -> None:
+		"""
+		Close the response and release the connection back to the pool.
+
+		Automatically called once the stream has been consumed, so this only needs to be
+		called when iteration is abandoned early.
+		"""
+		# runs the `finally` of a started iteration now instead of when it is garbage collected
+		self._stream_chunks.close()
+		self.response.close()
+		emit_stream_metrics(self._metrics_callback, self.metrics)
+
+	def iter_raw_events(self) -> Iterator[bytes]:
+		"""
+		Iterate over the undecoded `data:` payload of every event without parsing it.
+
+		Iteration stops at `[DONE]` and error events still raise `APIResponseError`; a payload is
+		only JSON-parsed when it looks like an error. This consumes the same body as iterating the
+		stream itself, so use one or the other.
+		"""
+		try:
+			for sse in SSEDecoder().iter_bytes(self.response.iter_bytes()):
+				_check_deadline(self._deadline_at, self.response)
+				if sse.is_done():
+					break
+				self.metrics.on_event()
+				_raise_for_raw_stream_error(sse, self.response)
+				yield sse.raw_data
+		finally:
+			self.response.close()
+			emit_stream_metrics(self._metrics_callback, self.metrics)
 
-		for sse in iterator:
-			if sse.data.startswith('[DONE]'):
-				break
-			if sse.event is None:
-				data = sse.json_data()
-				if isinstance(data, Mapping) and data.get('agent_id'):
-					yield self._data_process_func(
-						data=data,
-						cast_type=self._cast_type,
-						response=self.response,
-					)
-					continue
-				if isinstance(data, Mapping) and data.get('error'):
-					raise APIResponseError(
-						message='An error occurred during streaming',
-						request=self.response.request,
-						json_data=data['error'],
-					)
-			if sse.event is None:
+	def __stream__(self) -> Iterator[ResponseT]:
+		iterator = SSEDecoder().iter_bytes(self.response.iter_bytes())
+
+		try:
+			for sse in iterator:
+				_check_deadline(self._deadline_at, self.response)
+				if sse.is_done():
+					break
+				self.metrics.on_event()
 				data = sse.json_data()
-				if is_mapping(data) and data.get('error'):
-					message = None
-					error = data.get('error')
-					if is_mapping(error):
-						message = error.get('message')
-					if not message or not isinstance(message, str):
-						message = 'An error occurred during streaming'
-
-					raise APIResponseError(
-						message=message,
-						request=self.response.request,
-						json_data=data['error'],
-					)
-				yield self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
-
-			else:
+				if not (sse.event is None and is_mapping(data) and data.get('agent_id')):
+					_raise_for_stream_error(sse, data, self.response)
+				chunk = self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
+				self.metrics.on_chunk(chunk)
+				yield chunk
+		finally:
+			# Nothing useful follows `[DONE]`, so hand the connection back right away
+			# instead of draining the rest of the body.
+			self.response.close()
+			emit_stream_metrics(self._metrics_callback, self.metrics)
+
+
+class AsyncStreamResponse(Generic[ResponseT]):
+	"""
+	Stream response class for the asyncio client, consumed with `async for`.
+
+	A `deadline` of the request also bounds reading the body: `APITimeoutError` is raised from
+	iteration once it has passed.
+
+	Attributes:
+		response: The response from server.
+		metrics: Timing metrics of the stream, filled in while it is consumed.
+		_cast_type: The type of response.
+	"""
+
+	response: httpx.Response
+	metrics: StreamMetrics
+	_cast_type: Type[ResponseT]
+
+	def __init__(
+		self,
+		*,
+		cast_type: Type[ResponseT],
+		response: httpx.Response,
+		client: AsyncHttpClient,
+	) -> None:
+		self.response = response
+		self._cast_type = cast_type
+		self._data_process_func = client._process_response_data
+		self.metrics = StreamMetrics.from_response(response)
+		self._metrics_callback = getattr(client, 'stream_metrics_callback', None)
+		self._deadline_at = response.extensions.get(DEADLINE_AT_EXTENSION)
+		self._stream_chunks = self.__stream__()
+
+	async def __anext__(self) -> ResponseT:
+		return await self._stream_chunks.__anext__()
+
+	async def __aiter__(self) -> AsyncIterator[ResponseT]:
+		async for item in self._stream_chunks:
+			yield item
+
+	async def __aenter__(self) -> AsyncStreamResponse[ResponseT]:
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+		await self.aclose()
+
+	async def aclose(self) -> None:
+		"""
+		Close the response and release the connection back to the pool.
+
+		Automatically called once the stream has been consumed, so this only needs to be
+		called when iteration is abandoned early.
+		"""
+		# runs the `finally` of a started iteration now instead of when it is garbage collected
+		await self._stream_chunks.aclose()
+		await self.response.aclose()
+		emit_stream_metrics(self._metrics_callback, self.metrics)
+
+	async def aiter_raw_events(self) -> AsyncIterator[bytes]:
+		"""
+		Iterate over the undecoded `data:` payload of every event without parsing it.
+
+		Iteration stops at `[DONE]` and error events still raise `APIResponseError`; a payload is
+		only JSON-parsed when it looks like an error. This consumes the same body as iterating the
+		stream itself, so use one or the other.
+		"""
+		try:
+			async for sse in SSEDecoder().aiter_bytes(self.response.aiter_bytes()):
+				_check_deadline(self._deadline_at, self.response)
+				if sse.is_done():
+					break
+				self.metrics.on_event()
+				_raise_for_raw_stream_error(sse, self.response)
+				yield sse.raw_data
+		finally:
+			await self.response.aclose()
+			emit_stream_metrics(self._metrics_callback, self.metrics)
+
+	async def __stream__(self) -> AsyncIterator[ResponseT]:
+		iterator = SSEDecoder().aiter_bytes(self.response.aiter_bytes())
+
+		try:
+			async for sse in iterator:
+				_check_deadline(self._deadline_at, self.response)
+				if sse.is_done():
+					break
+				self.metrics.on_event()
 				data = sse.json_data()
+				if not (sse.event is None and is_mapping(data) and data.get('agent_id')):
+					_raise_for_stream_error(sse, data, self.response)
+				chunk = self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
+				self.metrics.on_chunk(chunk)
+				yield chunk
+		finally:
+			# Nothing useful follows `[DONE]`, so hand the connection back right away
+			# instead of draining the rest of the body.
+			await self.response.aclose()
+			emit_stream_metrics(self._metrics_callback, self.metrics)
+
+
+def _check_deadline(deadline_at: float | None, response: httpx.Response) -> None:
+	if deadline_at is not None and time.monotonic() >= deadline_at:
+		raise APITimeoutError(request=response.request)
+
 
-				if sse.event == 'error' and is_mapping(data) and data.get('error'):
-					message = None
-					error = data.get('error')
-					if is_mapping(error):
-						message = error.get('message')
-					if not message or not isinstance(message, str):
-						message = 'An error occurred during streaming'
+def _raise_for_stream_error(sse: Event, data: object, response: httpx.Response) -> None:
+	if sse.event not in (None, 'error') or not is_mapping(data) or not data.get('error'):
+		return
+
+	message = None
+	error = data.get('error')
+	if is_mapping(error):
+		message = error.get('message')
+	if not message or not isinstance(message, str):
+		message = 'An error occurred during streaming'
+
+	raise APIResponseError(
+		message=message,
+		request=response.request,
+		json_data=data['error'],
+	)
 
-					raise APIResponseError(
-						message=message,
-						request=self.response.request,
-						json_data=data['error'],
-					)
-				yield self._data_process_func(data=data, cast_type=self._cast_type, response=self.response)
 
-		for sse in iterator:
-			pass
+def _raise_for_raw_stream_error(sse: Event, response: httpx.Response) -> None:
+	if b'"error"' not in sse.raw_data:
+		return
+	data = sse.json_data()
+	if sse.event is None and is_mapping(data) and data.get('agent_id'):
+		return
+	_raise_for_stream_error(sse, data, response)
 
 
 class Event(object):
+	"""
+	A single server-sent event.
+
+	`data` may be given as text or as the raw UTF-8 payload bytes; it is only decoded when
+	accessed, and `json_data()` parses the payload once and caches the result.
+	"""
+
+	__slots__ = ('_event', '_data', '_raw_data', '_id', '_retry', '_json')
+
 	def __init__(
 		self,
 		event: str | None = None,
-		data: str | None = None,
+		data: str | bytes | None = None,
 		id: str | None = None,
 		retry: int | None = None,
 	):
 		self._event = event
-		self._data = data
+		if isinstance(data, bytes):
+			self._data = None
+			self._raw_data = data
+		else:
+			self._data = data
+			self._raw_data = None
 		self._id = id
 		self._retry = retry
+		self._json = _MISSING
 
 	def __repr__(self):
-		data_len = len(self._data) if self._data else 0
-		return (
-			f'Event(event={self._event}, data={self._data} ,data_length={data_len}, id={self._id}, retry={self._retry})'
-		)
+		data = self.data
+		data_len = len(data) if data else 0
+		return f'Event(event={self._event}, data={data} ,data_length={data_len}, id={self._id}, retry={self._retry})'
 
 	@property
 	def event(self):
@@ -136,10 +292,27 @@ class Event(object):
 
 	@property
 	def data(self):
+		if self._data is None and self._raw_data is not None:
+			self._data = self._raw_data.decode('utf-8')
 		return self._data
 
+	@property
+	def raw_data(self) -> bytes:
+		"""The undecoded `data:` payload of the event."""
+		if self._raw_data is None:
+			self._raw_data = (self._data or '').encode('utf-8')
+		return self._raw_data
+
+	def is_done(self) -> bool:
+		"""Whether this is the `[DONE]` sentinel that terminates a stream."""
+		if self._raw_data is not None:
+			return self._raw_data.startswith(b'[DONE]')
+		return bool(self._data) and self._data.startswith('[DONE]')
+
 	def json_data(self):
-		return json.loads(self._data)
+		if self._json is _MISSING:
+			self._json = json_loads(self._raw_data if self._raw_data is not None else self._data)
+		return self._json
 
 	@property
 	def id(self):
@@ -202,10 +375,128 @@ class SSELineParser:
 		return
 
 
-def is_stream_class_type(typ: type) -> TypeGuard[type[StreamResponse[object]]]:
-	"""TypeGuard for determining whether or not the given type is a subclass of `Stream` / `AsyncStream`"""
+class SSEDecoder:
+	"""
+	Incremental server-sent events decoder that works directly on the raw byte chunks of a response.
+
+	Lines are split and interpreted as bytes, partial lines are carried over between network
+	reads, and only one `Event` is built per dispatched event with its payload left undecoded.
+	"""
+
+	_data: list[bytes]
+	_event: str | None
+	_retry: int | None
+	_last_event_id: str | None
+
+	def __init__(self) -> None:
+		self._event = None
+		self._data = []
+		self._last_event_id = None
+		self._retry = None
+
+	def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[Event]:
+		"""Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
+		pending = b''
+		for chunk in iterator:
+			lines, pending = self._split_lines(pending + chunk if pending else chunk)
+			for line in lines:
+				sse = self.decode(line)
+				if sse is not None:
+					yield sse
+		for sse in self._flush(pending):
+			yield sse
+
+	async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[Event]:
+		"""Given an async iterator that yields raw binary data, iterate over it & yield every event encountered"""
+		pending = b''
+		async for chunk in iterator:
+			lines, pending = self._split_lines(pending + chunk if pending else chunk)
+			for line in lines:
+				sse = self.decode(line)
+				if sse is not None:
+					yield sse
+		for sse in self._flush(pending):
+			yield sse
+
+	@staticmethod
+	def _split_lines(buffer: bytes) -> tuple[list[bytes], bytes]:
+		"""Split `buffer` into complete lines, returning the trailing partial line separately.
+
+		A trailing `\\r` is treated as partial too, because the matching `\\n` may arrive in the next read.
+		"""
+		lines = buffer.splitlines(keepends=True)
+		pending = b''
+		if lines and not lines[-1].endswith(b'\n'):
+			pending = lines.pop()
+		return [line.rstrip(b'\r\n') for line in lines], pending
+
+	def _flush(self, pending: bytes) -> list[Event]:
+		events = []
+		for line in (pending.rstrip(b'\r\n'), b''):
+			sse = self.decode(line)
+			if sse is not None:
+				events.append(sse)
+		return events
+
+	def decode(self, line: bytes) -> Event | None:
+		# See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+
+		if not line:
+			# `id` persists across events, so it alone does not make a block worth dispatching.
+			if not self._event and not self._data and self._retry is None:
+				return None
+
+			data = self._data
+			sse = Event(
+				event=self._event,
+				data=data[0] if len(data) == 1 else b'\n'.join(data),
+				id=self._last_event_id,
+				retry=self._retry,
+			)
+
+			# NOTE: as per the SSE spec, do not reset last_event_id.
+			self._event = None
+			self._data = []
+			self._retry = None
+
+			return sse
+
+		# `data:` lines are by far the most common, so check for them first.
+		if line.startswith(b'data:'):
+			value = line[5:]
+			self._data.append(value[1:] if value.startswith(b' ') else value)
+			return None
+
+		if line.startswith(b':'):
+			return None
+
+		fieldname, _, value = line.partition(b':')
+
+		if value.startswith(b' '):
+			value = value[1:]
+
+		if fieldname == b'event':
+			self._event = value.decode('utf-8')
+		elif fieldname == b'data':
+			self._data.append(value)
+		elif fieldname == b'id':
+			if b'\0' not in value:
+				self._last_event_id = value.decode('utf-8')
+		elif fieldname == b'retry':
+			try:
+				self._retry = int(value)
+			except (TypeError, ValueError):
+				pass
+
+		return None
+
+
+def is_stream_class_type(
+	typ: type,
+) -> TypeGuard[type[StreamResponse[object]] | type[AsyncStreamResponse[object]]]:
+	"""TypeGuard for determining whether or not the given type is a subclass of `StreamResponse` / `AsyncStreamResponse`"""
 	origin = get_origin(typ) or typ
-	return inspect.isclass(origin) and issubclass(origin, StreamResponse)
+	return inspect.isclass(origin) and issubclass(origin, (StreamResponse, AsyncStreamResponse))
 
 
 def extract_stream_chunk_type(
@@ -227,6 +518,6 @@ def extract_stream_chunk_type(
 	return extract_type_var_from_base(
 		stream_cls,
 		index=0,
-		generic_bases=cast('tuple[type, ...]', (StreamResponse,)),
+		generic_bases=cast('tuple[type, ...]', (StreamResponse, AsyncStreamResponse)),
 		failure_message=failure_message,
 	)
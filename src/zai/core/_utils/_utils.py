@@ -364,9 +364,9 @@ def removesuffix(string: str, suffix: str) -> str:
 
 
 def file_from_path(path: str) -> FileTypes:
-	contents = Path(path).read_bytes()
+	# the file is read in chunks when the request is sent
 	file_name = os.path.basename(path)
-	return (file_name, contents)
+	return (file_name, Path(path))
 
 
 def get_required_header(headers: HeadersLike, header: str) -> str:
@@ -3,6 +3,7 @@ from .batch_create_params import BatchCreateParams
 from .batch_error import BatchError
 from .batch_list_params import BatchListParams
 from .batch_request_counts import BatchRequestCounts
+from .batch_result import BatchResult
 
 __all__ = [
 	'Batch',
@@ -11,4 +12,5 @@ __all__ = [
 	'BatchError',
 	'BatchListParams',
 	'BatchRequestCounts',
+	'BatchResult',
 ]
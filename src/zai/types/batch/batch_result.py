@@ -0,0 +1,23 @@
+from typing import Optional, Union
+
+from zai.core import BaseModel
+from zai.types.batch.batch_error import BatchError
+from zai.types.chat.chat_completion import Completion
+from zai.types.embeddings import EmbeddingsResponded
+
+
+class BatchResult(BaseModel):
+	"""
+	Outcome of one request of a batch, joined from the output and error files by `custom_id`.
+
+	Attributes:
+		custom_id (str): Identifier of the request in the input file
+		status_code (Optional[int]): HTTP status the request was answered with
+		response (Optional[Union[Completion, EmbeddingsResponded]]): Parsed body of a successful request
+		error (Optional[BatchError]): Why the request failed, None if it succeeded
+	"""
+
+	custom_id: str
+	status_code: Optional[int] = None
+	response: Optional[Union[Completion, EmbeddingsResponded]] = None
+	error: Optional[BatchError] = None
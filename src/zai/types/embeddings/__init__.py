@@ -1,6 +1,11 @@
-from .embeddings import Embedding, EmbeddingsResponded
+from .embeddings import Embedding, EmbeddingsResponded, decode_embedding
+from .similarity import cosine_topk, dot, normalize
 
 __all__ = [
 	'Embedding',
 	'EmbeddingsResponded',
+	'decode_embedding',
+	'cosine_topk',
+	'dot',
+	'normalize',
 ]
@@ -1,10 +1,38 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import base64
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+
+from pydantic import PrivateAttr
 
 from zai.core import BaseModel
 from zai.types.chat.chat_completion import CompletionUsage
 
+from .similarity import _import_numpy, _require_numpy, cosine_topk, normalize
+
+if TYPE_CHECKING:
+	import numpy
+
+
+def decode_embedding(data: str) -> Union['numpy.ndarray', array]:
+	"""
+	Decode a base64 embedding of little-endian float32 values without building a list of floats.
+
+	Returns a float32 `numpy.ndarray` when numpy is installed and an `array('f')` otherwise.
+	"""
+	raw = base64.b64decode(data)
+	numpy = _import_numpy()
+	if numpy is not None:
+		# copy so the vector owns a writable buffer instead of viewing the decoded bytes
+		return numpy.frombuffer(raw, dtype='<f4').astype(numpy.float32)
+	vector = array('f')
+	vector.frombytes(raw)
+	if sys.byteorder == 'big':
+		vector.byteswap()
+	return vector
+
 
 class Embedding(BaseModel):
 	"""
@@ -13,12 +41,24 @@ class Embedding(BaseModel):
 	Attributes:
 		object (str): Object type identifier
 		index (Optional[int]): Index of the embedding in the list
-		embedding (List[float]): The embedding vector
+		embedding (Union[List[float], str]): The embedding vector, a base64 string with `encoding_format='base64'`
 	"""
 
 	object: str
 	index: Optional[int] = None
-	embedding: List[float]
+	embedding: Union[List[float], str]
+
+	_vector: Any = PrivateAttr(default=None)
+
+	@property
+	def vector(self) -> Union[List[float], 'numpy.ndarray', array]:
+		"""
+		The embedding vector; a base64 `embedding` is decoded once into a float32 `numpy.ndarray`,
+		or an `array('f')` if numpy is not installed.
+		"""
+		if self._vector is None:
+			self._vector = decode_embedding(self.embedding) if isinstance(self.embedding, str) else self.embedding
+		return self._vector
 
 
 class EmbeddingsResponded(BaseModel):
@@ -36,3 +76,42 @@ class EmbeddingsResponded(BaseModel):
 	data: List[Embedding]
 	model: str
 	usage: CompletionUsage
+
+	def decode_base64(self) -> None:
+		"""Decode base64 encoded embeddings into the float32 `vector` of each item; `embedding` is left as sent."""
+		for item in self.data:
+			if isinstance(item.embedding, str) and item._vector is None:
+				item._vector = decode_embedding(item.embedding)
+
+	def to_numpy(self) -> 'numpy.ndarray':
+		"""
+		Return the embeddings as a contiguous `(n, dim)` float32 matrix in index order.
+
+		Requires numpy.
+		"""
+		numpy = _require_numpy('EmbeddingsResponded.to_numpy()')
+		data = sorted(self.data, key=lambda item: item.index if item.index is not None else 0)
+		vectors = [item.vector for item in data]
+		if not vectors:
+			return numpy.empty((0, 0), dtype=numpy.float32)
+		matrix = numpy.empty((len(vectors), len(vectors[0])), dtype=numpy.float32)
+		for row, vector in enumerate(vectors):
+			matrix[row] = vector
+		return matrix
+
+	def normalized(self) -> 'numpy.ndarray':
+		"""Return the embeddings as a `(n, dim)` float32 matrix of unit-norm rows in index order."""
+		return normalize(self.to_numpy())
+
+	def cosine_topk(
+		self, query: Any, k: int = 10, *, chunk_size: Optional[int] = None
+	) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+		"""
+		Find the `k` embeddings most similar to `query` by cosine similarity, see `similarity.cosine_topk`.
+
+		Arguments:
+			query: A query vector, a `(m, dim)` matrix of queries or another `EmbeddingsResponded`
+			k (int): Number of results per query
+			chunk_size (Optional[int]): Embeddings scored at a time, all at once if None
+		"""
+		return cosine_topk(query, self.to_numpy(), k, chunk_size=chunk_size)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+	import numpy
+
+
+def _import_numpy() -> Any:
+	try:
+		import numpy
+	except ImportError:  # pragma: no cover - numpy is optional
+		return None
+	return numpy
+
+
+def _require_numpy(feature: str) -> Any:
+	numpy = _import_numpy()
+	if numpy is None:
+		raise ImportError(f'{feature} requires numpy, install it with `pip install numpy`')
+	return numpy
+
+
+def _as_matrix(numpy: Any, vectors: Any) -> 'numpy.ndarray':
+	to_numpy = getattr(vectors, 'to_numpy', None)
+	if to_numpy is not None:
+		return to_numpy()
+	matrix = numpy.asarray(vectors, dtype=numpy.float32)
+	return matrix.reshape(1, -1) if matrix.ndim == 1 else matrix
+
+
+def normalize(vectors: Any) -> 'numpy.ndarray':
+	"""
+	Scale every row of `vectors` to unit L2 norm; rows of zeros stay zero.
+
+	Arguments:
+		vectors: A `(n, dim)` matrix, a single vector or an `EmbeddingsResponded`
+	"""
+	numpy = _require_numpy('normalize()')
+	matrix = _as_matrix(numpy, vectors)
+	norms = numpy.linalg.norm(matrix, axis=1, keepdims=True)
+	return matrix / numpy.where(norms == 0, 1, norms).astype(matrix.dtype, copy=False)
+
+
+def _chunks(total: int, chunk_size: Optional[int]):
+	step = chunk_size if chunk_size else max(total, 1)
+	for start in range(0, total, step):
+		yield start, min(start + step, total)
+
+
+def dot(queries: Any, corpus: Any, *, chunk_size: Optional[int] = None) -> 'numpy.ndarray':
+	"""
+	Dot products of every query with every corpus row as a `(m, n)` float32 matrix.
+
+	Arguments:
+		queries: A `(m, dim)` matrix, a single vector or an `EmbeddingsResponded`
+		corpus: A `(n, dim)` matrix, e.g. a memory-mapped array, or an `EmbeddingsResponded`
+		chunk_size (Optional[int]): Corpus rows converted and multiplied at a time, all at once if None
+	"""
+	numpy = _require_numpy('dot()')
+	queries = _as_matrix(numpy, queries)
+	corpus = corpus.to_numpy() if hasattr(corpus, 'to_numpy') else corpus
+	scores = numpy.empty((queries.shape[0], len(corpus)), dtype=numpy.float32)
+	for start, end in _chunks(len(corpus), chunk_size):
+		scores[:, start:end] = queries @ numpy.asarray(corpus[start:end], dtype=numpy.float32).T
+	return scores
+
+
+def cosine_topk(
+	query: Any,
+	corpus: Any,
+	k: int = 10,
+	*,
+	chunk_size: Optional[int] = None,
+	normalized: bool = False,
+) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+	"""
+	Find the `k` corpus rows most similar to each query by cosine similarity.
+
+	The corpus is scored `chunk_size` rows at a time so only one chunk of scores is held in
+	memory. Returns `(indices, scores)`, best first, of shape `(k,)` for a single query vector and
+	`(m, k)` for a matrix of queries.
+
+	Arguments:
+		query: A query vector, a `(m, dim)` matrix of queries or an `EmbeddingsResponded`
+		corpus: A `(n, dim)` matrix or an `EmbeddingsResponded`
+		k (int): Number of results per query
+		chunk_size (Optional[int]): Corpus rows scored at a time, all at once if None
+		normalized (bool): Whether query and corpus rows already have unit norm, e.g. from `normalize`
+	"""
+	numpy = _require_numpy('cosine_topk()')
+	single = not hasattr(query, 'to_numpy') and numpy.ndim(query) == 1
+	queries = _as_matrix(numpy, query)
+	if not normalized:
+		queries = normalize(queries)
+	corpus = corpus.to_numpy() if hasattr(corpus, 'to_numpy') else corpus
+	k = min(k, len(corpus))
+
+	best_indices = numpy.empty((queries.shape[0], 0), dtype=numpy.int64)
+	best_scores = numpy.empty((queries.shape[0], 0), dtype=numpy.float32)
+	rows = numpy.arange(queries.shape[0])[:, None]
+	for start, end in _chunks(len(corpus), chunk_size):
+		chunk = numpy.asarray(corpus[start:end], dtype=numpy.float32)
+		if not normalized:
+			chunk = normalize(chunk)
+		scores = numpy.concatenate([best_scores, queries @ chunk.T], axis=1)
+		positions = numpy.broadcast_to(numpy.arange(start, end), (len(queries), end - start))
+		indices = numpy.concatenate([best_indices, positions], axis=1)
+		if scores.shape[1] > k:
+			keep = numpy.argpartition(-scores, k - 1, axis=1)[:, :k] if k else rows[:, :0]
+			scores, indices = scores[rows, keep], indices[rows, keep]
+		best_scores, best_indices = scores, indices
+
+	order = numpy.argsort(-best_scores, axis=1, kind='stable')
+	best_scores, best_indices = best_scores[rows, order], best_indices[rows, order]
+	if single:
+		return best_indices[0], best_scores[0]
+	return best_indices, best_scores
@@ -0,0 +1,52 @@
+"""
+Microbenchmark of `IncrementalJSONParser` on a long string value, as a streamed tool call argument.
+
+Each fragment is fed and then `value` is read, which is what `iter_partial_json` does per chunk.
+The time per character should stay flat as the string grows.
+
+Run with:
+
+	PYTHONPATH=src python tests/benchmarks/bench_json_stream.py [--lengths N ...] [--fragment N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import List, Optional
+
+from zai.core import IncrementalJSONParser
+
+
+def _fragments(length: int, size: int, escaped: bool) -> List[str]:
+	content = ('é "x" \\ ' if escaped else 'abcdefgh') * (length // 8)
+	text = json.dumps({'arguments': content})
+	return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _parse(fragments: List[str], read_value: bool) -> None:
+	parser = IncrementalJSONParser()
+	for fragment in fragments:
+		parser.feed(fragment)
+		if read_value:
+			parser.value
+	parser.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument('--lengths', type=int, nargs='+', default=[20000, 40000, 80000, 160000])
+	parser.add_argument('--fragment', type=int, default=4)
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args(argv)
+
+	for escaped in (False, True):
+		for length in args.lengths:
+			fragments = _fragments(length, args.fragment, escaped)
+			for read_value in (False, True):
+				best = min(timeit.repeat(lambda: _parse(fragments, read_value), number=1, repeat=args.repeat))
+				name = f'{"escaped" if escaped else "plain"} {length} chars{", reading value" if read_value else ""}'
+				print(f'{name:<38} {best * 1000:8.1f} ms  {best * 1e9 / length:8.0f} ns/char')
+
+
+if __name__ == '__main__':
+	main()
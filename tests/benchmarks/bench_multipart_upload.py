@@ -0,0 +1,72 @@
+"""
+Peak memory of a multipart file upload, whole-file bytes versus a streamed path.
+
+The legacy path mirrors what `_transform_file` used to do: read the file with `read_bytes()` and
+hand the bytes to httpx. The streaming path passes the `pathlib.Path`, which is read in 64 KiB
+chunks while the request body is sent. The transport discards the body as it is streamed, so
+the peak measured by `tracemalloc` is what the client itself holds.
+
+Run with:
+
+	PYTHONPATH=src python tests/benchmarks/bench_multipart_upload.py [--size-mb N]
+"""
+
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+import tracemalloc
+from typing import List, Optional
+
+import httpx
+
+from zai import ZaiClient
+
+_FILE_OBJECT = {'id': 'file-1', 'object': 'file', 'bytes': 0, 'created_at': 0, 'filename': 'x', 'purpose': 'batch'}
+
+
+class _DrainTransport(httpx.BaseTransport):
+	def __init__(self) -> None:
+		self.received = 0
+
+	def handle_request(self, request: httpx.Request) -> httpx.Response:
+		for chunk in request.stream:
+			self.received += len(chunk)
+		return httpx.Response(200, json=_FILE_OBJECT)
+
+
+def _upload(path: pathlib.Path, legacy: bool) -> tuple:
+	transport = _DrainTransport()
+	client = ZaiClient(
+		api_key='bench-key', base_url='https://api.test.com/v4', http_client=httpx.Client(transport=transport)
+	)
+
+	tracemalloc.start()
+	started = time.perf_counter()
+	client.files.create(file=(path.name, path.read_bytes()) if legacy else path, purpose='batch')
+	elapsed = time.perf_counter() - started
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return peak, elapsed, transport.received
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument('--size-mb', type=int, default=200)
+	args = parser.parse_args(argv)
+
+	with tempfile.TemporaryDirectory() as directory:
+		path = pathlib.Path(directory) / 'batch.jsonl'
+		with open(path, 'wb') as file:
+			for _ in range(args.size_mb):
+				file.write(os.urandom(1024 * 1024))
+
+		for name, legacy in (('read_bytes() (legacy)', True), ('streamed from path', False)):
+			peak, elapsed, received = _upload(path, legacy)
+			assert received >= args.size_mb * 1024 * 1024
+			print(f'{name:<24} peak {peak / 1024 / 1024:9.1f} MiB  {elapsed * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+	main()
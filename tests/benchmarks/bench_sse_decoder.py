@@ -0,0 +1,81 @@
+"""
+Microbenchmark comparing the legacy text-line SSE parsing path with `SSEDecoder`.
+
+The legacy path mirrors what `StreamResponse.__stream__` used to do: decode the body with
+`iter_lines`, run it through `SSELineParser` and call `json.loads` twice per event.
+
+Run with:
+
+	PYTHONPATH=src python tests/benchmarks/bench_sse_decoder.py [--events N] [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import List, Optional
+
+import httpx
+
+from zai.core._streaming import SSEDecoder, SSELineParser
+
+_CHUNK = {
+	'id': '20240510123456789',
+	'created': 1715329207,
+	'model': 'glm-4',
+	'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': '智能体在这里回复一段文本 token'}}],
+}
+
+
+def _make_body(events: int) -> bytes:
+	payload = json.dumps(_CHUNK, ensure_ascii=False)
+	return (f'data: {payload}\n\n' * events + 'data: [DONE]\n\n').encode('utf-8')
+
+
+def _chunks(body: bytes, size: int = 4096) -> List[bytes]:
+	return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def _legacy(chunks: List[bytes]) -> int:
+	response = httpx.Response(200, content=iter(chunks))
+	count = 0
+	for sse in SSELineParser().iter_lines(response.iter_lines()):
+		if sse.data.startswith('[DONE]'):
+			break
+		if sse.event is None:
+			data = json.loads(sse.data)
+			if isinstance(data, dict) and data.get('error'):
+				raise RuntimeError(data['error'])
+			json.loads(sse.data)
+			count += 1
+	return count
+
+
+def _decoder(chunks: List[bytes]) -> int:
+	response = httpx.Response(200, content=iter(chunks))
+	count = 0
+	for sse in SSEDecoder().iter_bytes(response.iter_bytes()):
+		if sse.is_done():
+			break
+		data = sse.json_data()
+		if isinstance(data, dict) and data.get('error'):
+			raise RuntimeError(data['error'])
+		count += 1
+	return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument('--events', type=int, default=20000)
+	parser.add_argument('--repeat', type=int, default=5)
+	args = parser.parse_args(argv)
+
+	chunks = _chunks(_make_body(args.events))
+	assert _legacy(chunks) == _decoder(chunks) == args.events
+
+	for name, func in (('SSELineParser + 2x json.loads', _legacy), ('SSEDecoder (bytes, parse once)', _decoder)):
+		best = min(timeit.repeat(lambda: func(chunks), number=1, repeat=args.repeat))
+		print(f'{name:<34} {best * 1000:8.1f} ms  {args.events / best:12,.0f} events/s')
+
+
+if __name__ == '__main__':
+	main()
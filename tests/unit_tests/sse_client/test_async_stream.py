@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from typing import AsyncIterator, List, cast
+
+import httpx
+import pytest
+
+from zai.core import AsyncStreamResponse, HttpClient, get_args
+from zai.core._errors import APIResponseError
+from zai.core._streaming import SSEDecoder
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+
+class MockClient:
+	_strict_response_validation: bool = False
+	_process_response_data = HttpClient._process_response_data
+
+
+class TrackingStream(httpx.AsyncByteStream):
+	def __init__(self, chunks: List[bytes]) -> None:
+		self.chunks = chunks
+		self.sent = 0
+		self.closed = False
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		for chunk in self.chunks:
+			self.sent += 1
+			yield chunk
+
+	async def aclose(self) -> None:
+		self.closed = True
+
+
+def _chunk(content: str) -> bytes:
+	return (
+		'data: {"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"role":"assistant","content":"%s"}}]}\n\n'
+		% content
+	).encode()
+
+
+def _make_stream(stream: httpx.AsyncByteStream) -> AsyncStreamResponse[ChatCompletionChunk]:
+	_stream_cls = AsyncStreamResponse[ChatCompletionChunk]
+	return _stream_cls(
+		cast_type=cast(type, get_args(_stream_cls)[0]),
+		response=httpx.Response(
+			status_code=200, stream=stream, request=httpx.Request('POST', 'https://api.test.com/chat/completions')
+		),
+		client=MockClient(),
+	)
+
+
+async def _aiter(chunks: List[bytes]) -> AsyncIterator[bytes]:
+	for chunk in chunks:
+		yield chunk
+
+
+async def test_decoder_reassembles_split_events() -> None:
+	chunks = [b'event: comp', b'letion\ndata: {"fo', b'o":true}\n', b'\ndata: {"bar":1}\r\n\r\n']
+	events = [sse async for sse in SSEDecoder().aiter_bytes(_aiter(chunks))]
+
+	assert len(events) == 2
+	assert events[0].event == 'completion'
+	assert events[0].json_data() == {'foo': True}
+	assert events[1].event is None
+	assert events[1].json_data() == {'bar': 1}
+
+
+async def test_decoder_multiline_data_and_comments() -> None:
+	chunks = [b': keep-alive\n\ndata: {"a":\ndata: 1}\nid: 7\n\n']
+	events = [sse async for sse in SSEDecoder().aiter_bytes(_aiter(chunks))]
+
+	assert len(events) == 1
+	assert events[0].json_data() == {'a': 1}
+	assert events[0].id == '7'
+
+
+async def test_async_for_yields_chunks() -> None:
+	stream = _make_stream(TrackingStream([_chunk('1'), _chunk('2'), b'data: [DONE]\n\n']))
+	contents = [chunk.choices[0].delta.content async for chunk in stream]
+
+	assert contents == ['1', '2']
+	assert stream.response.is_closed
+
+
+async def test_connection_released_on_done_without_draining() -> None:
+	body = TrackingStream([_chunk('1'), b'data: [DONE]\n\n', _chunk('late'), _chunk('later')])
+	stream = _make_stream(body)
+	contents = [chunk.choices[0].delta.content async for chunk in stream]
+
+	assert contents == ['1']
+	assert body.sent == 2
+	assert body.closed
+
+
+async def test_async_context_manager_closes_on_early_exit() -> None:
+	body = TrackingStream([_chunk('1'), _chunk('2'), b'data: [DONE]\n\n'])
+	async with _make_stream(body) as stream:
+		first = await stream.__anext__()
+		assert first.choices[0].delta.content == '1'
+
+	assert body.closed
+	assert stream.response.is_closed
+
+
+async def test_aclose() -> None:
+	body = TrackingStream([_chunk('1')])
+	stream = _make_stream(body)
+	await stream.aclose()
+
+	assert body.closed
+
+
+async def test_error_event_raises() -> None:
+	body = TrackingStream([b'data: {"error":{"message":"quota exceeded"}}\n\n'])
+	stream = _make_stream(body)
+
+	with pytest.raises(APIResponseError, match='quota exceeded'):
+		async for _ in stream:
+			pass
+	assert body.closed
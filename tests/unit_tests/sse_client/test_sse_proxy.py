@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+from typing import AsyncIterator, Iterator, List, cast
+
+import httpx
+import pytest
+
+from zai.core import (
+	AsyncStreamResponse,
+	HttpClient,
+	StreamResponse,
+	aiter_sse_frames,
+	get_args,
+	iter_sse_frames,
+	sse_asgi_app,
+	sse_wsgi_app,
+)
+from zai.core._errors import APIResponseError
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+_PAYLOAD = '{"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"content":"你好"}}]}'.encode()
+_REQUEST = httpx.Request('POST', 'https://api.test.com/chat/completions')
+
+
+class MockClient:
+	_strict_response_validation: bool = False
+	_process_response_data = HttpClient._process_response_data
+
+
+class TrackingStream(httpx.SyncByteStream):
+	def __init__(self, chunks: List[bytes]) -> None:
+		self.chunks = chunks
+		self.closed = False
+
+	def __iter__(self) -> Iterator[bytes]:
+		yield from self.chunks
+
+	def close(self) -> None:
+		self.closed = True
+
+
+class AsyncTrackingStream(httpx.AsyncByteStream):
+	def __init__(self, chunks: List[bytes]) -> None:
+		self.chunks = chunks
+		self.closed = False
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		for chunk in self.chunks:
+			yield chunk
+
+	async def aclose(self) -> None:
+		self.closed = True
+
+
+def _make_stream(body: TrackingStream) -> StreamResponse[ChatCompletionChunk]:
+	_stream_cls = StreamResponse[ChatCompletionChunk]
+	return _stream_cls(
+		cast_type=cast(type, get_args(_stream_cls)[0]),
+		response=httpx.Response(status_code=200, stream=body, request=_REQUEST),
+		client=MockClient(),
+	)
+
+
+def _make_async_stream(body: AsyncTrackingStream) -> AsyncStreamResponse[ChatCompletionChunk]:
+	_stream_cls = AsyncStreamResponse[ChatCompletionChunk]
+	return _stream_cls(
+		cast_type=cast(type, get_args(_stream_cls)[0]),
+		response=httpx.Response(status_code=200, stream=body, request=_REQUEST),
+		client=MockClient(),
+	)
+
+
+def test_iter_raw_events_yields_payload_bytes() -> None:
+	body = TrackingStream([b'data: ' + _PAYLOAD[:20], _PAYLOAD[20:] + b'\n\n', b'data: [DONE]\n\n', b'data: late\n\n'])
+	stream = _make_stream(body)
+
+	assert list(stream.iter_raw_events()) == [_PAYLOAD]
+	assert body.closed
+
+
+def test_iter_raw_events_raises_on_error() -> None:
+	stream = _make_stream(TrackingStream([b'data: {"error":{"message":"quota exceeded"}}\n\n']))
+
+	with pytest.raises(APIResponseError, match='quota exceeded'):
+		list(stream.iter_raw_events())
+
+
+def test_iter_sse_frames_reframes_and_terminates() -> None:
+	frames = list(iter_sse_frames(_make_stream(TrackingStream([b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n']))))
+
+	assert frames == [b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n']
+
+
+def test_iter_sse_frames_forwards_error() -> None:
+	body = TrackingStream([b'data: ' + _PAYLOAD + b'\n\n', b'data: {"error":{"code":"1301","message":"bad"}}\n\n'])
+	frames = list(iter_sse_frames(_make_stream(body)))
+
+	assert frames[-1] == b'data: {"error": {"code": "1301", "message": "bad"}}\n\n'
+	assert body.closed
+
+
+def test_sse_wsgi_app_releases_upstream_on_disconnect() -> None:
+	body = TrackingStream([b'data: ' + _PAYLOAD + b'\n\n'] * 3)
+	started = []
+	result = sse_wsgi_app(_make_stream(body))({}, lambda status, headers: started.append((status, headers)))
+
+	assert next(iter(result)) == b'data: ' + _PAYLOAD + b'\n\n'
+	result.close()
+
+	assert started[0][0] == '200 OK'
+	assert ('Content-Type', 'text/event-stream') in started[0][1]
+	assert body.closed
+
+
+async def test_aiter_sse_frames() -> None:
+	body = AsyncTrackingStream([b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n'])
+	frames = [frame async for frame in aiter_sse_frames(_make_async_stream(body))]
+
+	assert frames == [b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n']
+	assert body.closed
+
+
+async def test_sse_asgi_app() -> None:
+	body = AsyncTrackingStream([b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n'])
+	messages = []
+
+	async def send(message):
+		messages.append(message)
+
+	await sse_asgi_app(_make_async_stream(body))({'type': 'http'}, None, send)
+
+	assert messages[0]['type'] == 'http.response.start'
+	assert (b'content-type', b'text/event-stream') in messages[0]['headers']
+	assert [m['body'] for m in messages[1:]] == [b'data: ' + _PAYLOAD + b'\n\n', b'data: [DONE]\n\n', b'']
+	assert messages[-1]['more_body'] is False
+	assert body.closed
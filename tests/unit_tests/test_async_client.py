@@ -0,0 +1,157 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient
+from zai.core import APIReachLimitError, AsyncStreamResponse
+from zai.types.chat.chat_completion import Completion
+from zai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+_COMPLETION = {
+	'id': 'chatcmpl-1',
+	'model': 'glm-4',
+	'created': 1715329207,
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hello'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def _sse(*payloads: str) -> bytes:
+	return b''.join(f'data: {payload}\n\n'.encode() for payload in payloads)
+
+
+def _make_client(handler, **kwargs) -> AsyncZaiClient:
+	return AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		**kwargs,
+	)
+
+
+async def test_async_chat_completion():
+	seen = {}
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		seen['url'] = str(request.url)
+		seen['body'] = json.loads(request.content)
+		return httpx.Response(200, json=_COMPLETION)
+
+	async with _make_client(handler) as client:
+		completion = await client.chat.completions.create(
+			model='glm-4', messages=[{'role': 'user', 'content': 'hi'}]
+		)
+
+	assert isinstance(completion, Completion)
+	assert completion.choices[0].message.content == 'hello'
+	assert seen['url'] == 'https://api.test.com/v4/chat/completions'
+	assert seen['body']['model'] == 'glm-4'
+
+
+async def test_async_chat_completion_stream():
+	chunk = '{"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"role":"assistant","content":"%s"}}]}'
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(
+			200,
+			content=_sse(chunk % 'a', chunk % 'b', '[DONE]'),
+			headers={'content-type': 'text/event-stream'},
+		)
+
+	async with _make_client(handler) as client:
+		stream = await client.chat.completions.create(
+			model='glm-4', messages=[{'role': 'user', 'content': 'hi'}], stream=True
+		)
+		assert isinstance(stream, AsyncStreamResponse)
+		chunks = [chunk async for chunk in stream]
+
+	assert all(isinstance(c, ChatCompletionChunk) for c in chunks)
+	assert [c.choices[0].delta.content for c in chunks] == ['a', 'b']
+
+
+async def test_async_retry_does_not_block():
+	calls = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		calls.append(request)
+		if len(calls) < 3:
+			return httpx.Response(500, json={'error': 'boom'})
+		return httpx.Response(200, json=_COMPLETION)
+
+	async def fake_sleep(seconds):
+		fake_sleep.delays.append(seconds)
+
+	fake_sleep.delays = []
+	with patch('zai.core._http_client.anyio.sleep', fake_sleep), patch('time.sleep') as blocking_sleep:
+		async with _make_client(handler, max_retries=3) as client:
+			completion = await client.chat.completions.create(model='glm-4', messages=[])
+
+	assert completion.id == 'chatcmpl-1'
+	assert len(calls) == 3
+	assert len(fake_sleep.delays) == 2
+	blocking_sleep.assert_not_called()
+
+
+async def test_async_status_error():
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(429, json={'error': {'message': 'slow down'}})
+
+	async with _make_client(handler, max_retries=0) as client:
+		with pytest.raises(APIReachLimitError):
+			await client.embeddings.create(input='hi', model='embedding-3')
+
+
+async def test_async_close():
+	client = _make_client(lambda request: httpx.Response(200, json={}))
+	assert not client.is_closed()
+	await client.close()
+	assert client.is_closed()
+
+
+_MESSAGES = [{'role': 'user', 'content': 'hi'}]
+
+
+@pytest.mark.parametrize(
+	('call', 'method', 'path'),
+	[
+		(lambda c: c.chat.asyncCompletions.create(model='glm-4', messages=[]), 'POST', '/async/chat/completions'),
+		(lambda c: c.chat.asyncCompletions.retrieve_completion_result(id='task-1'), 'GET', '/async-result/task-1'),
+		(lambda c: c.assistant.conversation(assistant_id='a-1', messages=[]), 'POST', '/assistant'),
+		(lambda c: c.agents.invoke(agent_id='agent-1', messages=_MESSAGES), 'POST', '/v1/agents'),
+		(lambda c: c.embeddings.create(input='hi', model='embedding-3'), 'POST', '/embeddings'),
+		(lambda c: c.batches.create(endpoint='/v1/chat/completions', input_file_id='file-1'), 'POST', '/batches'),
+		(lambda c: c.batches.retrieve('batch-1'), 'GET', '/batches/batch-1'),
+		(lambda c: c.batches.cancel('batch-1'), 'POST', '/batches/batch-1/cancel'),
+		(lambda c: c.tools.web_search(model='web-search-pro', messages=_MESSAGES), 'POST', '/tools'),
+		(lambda c: c.web_search.web_search(search_query='zai'), 'POST', '/web_search'),
+		(lambda c: c.web_reader.web_reader(url='https://example.com'), 'POST', '/reader'),
+		(lambda c: c.files.create(file=b'hello', purpose='batch'), 'POST', '/files'),
+		(lambda c: c.files.list(), 'GET', '/files'),
+		(lambda c: c.files.delete('file-1'), 'DELETE', '/files/file-1'),
+		(lambda c: c.images.generations(prompt='a cat'), 'POST', '/images/generations'),
+		(lambda c: c.images.retrieve_images_result(id='task-1'), 'GET', '/async-result/task-1'),
+		(lambda c: c.audio.speech(model='cogtts', input='hi'), 'POST', '/audio/speech'),
+		(lambda c: c.audio.transcriptions.create(file=b'wav', model='glm-asr'), 'POST', '/audio/transcriptions'),
+		(lambda c: c.videos.generations(model='cogvideox', prompt='a cat'), 'POST', '/videos/generations'),
+		(lambda c: c.videos.retrieve_videos_result(id='task-1'), 'GET', '/async-result/task-1'),
+		(lambda c: c.moderations.create(model='moderation', input='hi'), 'POST', '/moderations'),
+		(lambda c: c.voice.list(), 'GET', '/voice/list'),
+		(lambda c: c.file_parser.create(file=b'pdf', tool_type='lite'), 'POST', '/files/parser/create'),
+		(lambda c: c.ocr.handwriting_ocr(file=b'png', tool_type='hand_write'), 'POST', '/files/ocr'),
+		(lambda c: c.layout_parsing.create(model='glm-ocr', file='https://a.cn/a.png'), 'POST', '/layout_parsing'),
+	],
+)
+async def test_async_resources_send_requests(call, method, path):
+	seen = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		seen.append((request.method, request.url.path))
+		return httpx.Response(200, json={'id': 'x', 'object': 'list', 'data': []})
+
+	async with _make_client(handler) as client:
+		result = await call(client)
+
+	assert result is not None
+	assert seen == [(method, '/v4' + path)]
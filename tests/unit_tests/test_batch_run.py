@@ -0,0 +1,208 @@
+import json
+import os
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import ZaiError
+from zai.types.chat.chat_completion import Completion
+from zai.types.embeddings import EmbeddingsResponded
+
+
+def _output_line(request):
+	if request['url'].endswith('/embeddings'):
+		body = {
+			'object': 'list',
+			'model': 'embedding-3',
+			'data': [{'object': 'embedding', 'index': 0, 'embedding': [float(len(request['body']['input']))]}],
+			'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+		}
+	else:
+		message = {'role': 'assistant', 'content': request['body']['messages'][0]['content'].upper()}
+		body = {
+			'id': 'chat-' + request['custom_id'],
+			'model': 'glm-4',
+			'choices': [{'index': 0, 'finish_reason': 'stop', 'message': message}],
+		}
+	return {'custom_id': request['custom_id'], 'response': {'status_code': 200, 'body': body}}
+
+
+class _Server:
+	"""Runs a batch over the uploaded input: `bad` requests fail, `lost` ones are dropped from the output."""
+
+	def __init__(self, statuses=('validating', 'in_progress', 'completed')):
+		self.statuses = list(statuses)
+		self.input = None
+		self.files = {}
+		self.polls = 0
+
+	def _batch(self):
+		status = self.statuses[min(self.polls, len(self.statuses) - 1)]
+		batch = {
+			'id': 'batch-1',
+			'object': 'batch',
+			'endpoint': '/v1/chat/completions',
+			'input_file_id': 'file-input',
+			'completion_window': '24h',
+			'created_at': 0,
+			'status': status,
+			'errors': {'data': [{'code': '1', 'message': 'invalid input'}]},
+		}
+		if status == 'completed':
+			batch.update(output_file_id='file-output', error_file_id='file-errors')
+		return batch
+
+	def __call__(self, request):
+		path = request.url.path
+		if path == '/v4/files':
+			body = request.read()
+			start = body.index(b'\r\n\r\n', body.index(b'filename=')) + 4
+			self.input = [json.loads(line) for line in body[start : body.index(b'\r\n--', start)].splitlines()]
+			failed = {'status_code': 400, 'body': {'error': {'code': '1214', 'message': 'bad'}}}
+			output, errors = [], []
+			for line in self.input:
+				body = json.dumps(line['body'])
+				if 'bad' in body:
+					errors.append({'custom_id': line['custom_id'], 'response': failed})
+				elif 'lost' not in body:
+					output.append(_output_line(line))
+			self.files['file-output'] = ''.join(json.dumps(line) + '\n' for line in output).encode()
+			self.files['file-errors'] = ''.join(json.dumps(line) + '\n' for line in errors).encode()
+			return httpx.Response(200, json={'id': 'file-input', 'object': 'file', 'purpose': 'batch'})
+		if path == '/v4/batches':
+			assert json.loads(request.content)['input_file_id'] == 'file-input'
+			return httpx.Response(200, json=self._batch())
+		if path == '/v4/batches/batch-1':
+			self.polls += 1
+			return httpx.Response(200, json=self._batch())
+		content = self.files[path.split('/')[3]]
+		return httpx.Response(200, headers={'content-length': str(len(content))}, stream=httpx.ByteStream(content))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+	calls = []
+	monkeypatch.setattr('zai.api_resource.batch.batches.time.sleep', calls.append)
+
+	async def sleep(seconds):
+		calls.append(seconds)
+
+	monkeypatch.setattr('zai.api_resource.batch.batches.anyio.sleep', sleep)
+	return calls
+
+
+def _client(server):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(server)),
+	)
+
+
+def _requests(count):
+	for number in range(count):
+		content = 'bad' if number == 1 else 'lost' if number == 2 else f'hello {number}'
+		yield {'model': 'glm-4', 'messages': [{'role': 'user', 'content': content}]}
+
+
+def test_run_joins_output_and_errors(sleeps):
+	server = _Server()
+
+	results = _client(server).batches.run(_requests(4), poll_interval=2, max_poll_interval=2.5)
+	directory = results._directory.name
+	by_id = {result.custom_id: result for result in results}
+
+	assert [line['custom_id'] for line in server.input] == ['request-0', 'request-1', 'request-2', 'request-3']
+	assert server.input[0]['url'] == '/v1/chat/completions'
+	assert sleeps == [2, 2.5]
+	assert results.batch.status == 'completed'
+
+	assert isinstance(by_id['request-0'].response, Completion)
+	assert by_id['request-3'].response.choices[0].message.content == 'HELLO 3'
+	assert by_id['request-1'].status_code == 400
+	assert (by_id['request-1'].error.code, by_id['request-1'].response) == ('1214', None)
+	assert by_id['request-2'].error.message == 'The request is in neither the output nor the error file'
+	assert not os.path.exists(directory)
+
+
+def test_embedding_results_and_custom_ids(sleeps):
+	server = _Server(statuses=('completed',))
+	requests = [
+		{'custom_id': 'doc-a', 'body': {'model': 'embedding-3', 'input': 'abc'}},
+		{'model': 'embedding-3', 'input': 'z'},
+	]
+
+	with _client(server).batches.run(requests, endpoint='/v1/embeddings') as results:
+		first = next(results)
+		assert isinstance(first.response, EmbeddingsResponded)
+		assert (first.custom_id, first.response.data[0].embedding) == ('doc-a', [3.0])
+	assert not os.path.exists(results._directory.name)
+	assert [line['custom_id'] for line in server.input] == ['doc-a', 'request-1']
+	assert sleeps == []
+
+	with pytest.raises(ValueError, match='Duplicate custom_id'):
+		_client(server).batches.run([requests[0], requests[0]])
+
+
+def test_deadline_is_applied_to_every_request(sleeps):
+	server = _Server()
+	reads = []
+
+	def handler(request):
+		reads.append(request.extensions['timeout']['read'])
+		return server(request)
+
+	with _client(handler).batches.run(_requests(2), deadline=2) as results:
+		list(results)
+
+	assert len(reads) >= 5
+	assert all(0 < read <= 2 for read in reads)
+
+
+def test_generated_custom_ids_skip_supplied_ones(sleeps):
+	server = _Server(statuses=('completed',))
+	body = {'model': 'embedding-3', 'input': 'abc'}
+	requests = [body, {'custom_id': 'request-2', 'body': body}, body, body]
+
+	with _client(server).batches.run(requests, endpoint='/v1/embeddings'):
+		pass
+	assert [line['custom_id'] for line in server.input] == ['request-0', 'request-2', 'request-3', 'request-4']
+
+	with pytest.raises(ValueError, match="'request-1' generated for an earlier request"):
+		_client(server).batches.run([body, body, {'custom_id': 'request-1', 'body': body}])
+
+
+def test_failed_batch_and_max_wait(sleeps):
+	with pytest.raises(ZaiError, match='Batch batch-1 failed: 1: invalid input'):
+		_client(_Server(statuses=('validating', 'failed'))).batches.run(_requests(1))
+	sleeps.clear()
+
+	with pytest.raises(ZaiError, match='still in_progress'):
+		_client(_Server(statuses=('in_progress',))).batches.run(_requests(1), poll_interval=10, max_wait=30)
+	assert sleeps == [10, 15, 22.5]
+
+
+async def test_async_run(sleeps):
+	server = _Server()
+
+	async def requests():
+		for request in _requests(4):
+			yield request
+
+	reads = []
+
+	def handler(request):
+		reads.append(request.extensions['timeout']['read'])
+		return server(request)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+	) as client:
+		results = await client.batches.run(requests(), deadline=2)
+
+	assert all(0 < read <= 2 for read in reads)
+	assert sorted(result.custom_id for result in results if result.error is None) == ['request-0', 'request-3']
+	assert len(sleeps) == 2
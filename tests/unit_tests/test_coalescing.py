@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import APIStatusError, RequestCoalescer, request_fingerprint
+from zai.core._request_opt import FinalRequestOptions
+
+_EMBEDDINGS = {
+	'object': 'list',
+	'model': 'embedding-3',
+	'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+}
+
+
+def _wait_for(predicate, timeout=2.0):
+	deadline = time.monotonic() + timeout
+	while not predicate() and time.monotonic() < deadline:
+		time.sleep(0.005)
+
+
+def test_fingerprint_is_canonical():
+	def options(**kwargs):
+		return FinalRequestOptions.construct(method='post', url='/embeddings', **kwargs)
+
+	first = request_fingerprint(options(json_data={'model': 'embedding-3', 'input': 'hi'}))
+	assert first == request_fingerprint(options(json_data={'input': 'hi', 'model': 'embedding-3'}))
+	assert first != request_fingerprint(options(json_data={'input': 'ho', 'model': 'embedding-3'}))
+	assert first != request_fingerprint(options(json_data={'input': 'hi', 'model': 'embedding-3'}), 'https://other/')
+	assert request_fingerprint(options(files=[('file', b'x')])) is None
+
+	assert first != request_fingerprint(options(json_data={'input': 'hi', 'model': 'embedding-3'}), identity='key-b')
+	with_language = request_fingerprint(
+		options(json_data={'input': 'hi', 'model': 'embedding-3'}), default_headers={'Accept-Language': 'en-US'}
+	)
+	assert first != with_language
+	assert with_language == request_fingerprint(
+		options(json_data={'input': 'hi', 'model': 'embedding-3'}),
+		default_headers={'Accept-Language': 'en-US', 'Authorization': 'Bearer token'},
+	)
+
+
+def test_clients_with_different_keys_do_not_share_calls():
+	coalescer = RequestCoalescer()
+	release = threading.Event()
+	keys = []
+
+	def handler(request):
+		keys.append(request.headers['authorization'])
+		release.wait(2)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	clients = [
+		ZaiClient(
+			api_key=api_key,
+			base_url='https://api.test.com/v4',
+			http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+			coalescer=coalescer,
+		)
+		for api_key in ('key-a', 'key-b')
+	]
+	with ThreadPoolExecutor(2) as pool:
+		futures = [pool.submit(client.embeddings.create, model='embedding-3', input='hi') for client in clients]
+		_wait_for(lambda: len(keys) == 2)
+		release.set()
+		[future.result() for future in futures]
+
+	assert sorted(keys) == ['Bearer key-a', 'Bearer key-b']
+
+
+def test_concurrent_identical_requests_share_one_call():
+	coalescer = RequestCoalescer()
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		_wait_for(lambda: coalescer.coalesced == 4)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		coalescer=coalescer,
+	)
+	with ThreadPoolExecutor(5) as pool:
+		results = list(pool.map(lambda _: client.embeddings.create(model='embedding-3', input='hi'), range(5)))
+
+	assert len(calls) == 1
+	assert all(result is results[0] for result in results)
+
+	client.embeddings.create(model='embedding-3', input='hi')
+	assert len(calls) == 2
+
+
+def test_errors_are_shared_and_different_requests_are_not_coalesced():
+	coalescer = RequestCoalescer()
+	calls = []
+	both_started = threading.Barrier(2, timeout=2)
+
+	def handler(request):
+		calls.append(request)
+		if b'"a"' in request.content or b'"b"' in request.content:
+			both_started.wait()
+			return httpx.Response(200, json=_EMBEDDINGS)
+		_wait_for(lambda: coalescer.coalesced == 1)
+		return httpx.Response(400, json={'error': {'code': '1214', 'message': 'bad input'}})
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		coalescer=coalescer,
+	)
+	with ThreadPoolExecutor(2) as pool:
+		list(pool.map(lambda text: client.embeddings.create(model='embedding-3', input=text), ['a', 'b']))
+	assert len(calls) == 2
+
+	def failing(_):
+		with pytest.raises(APIStatusError):
+			client.embeddings.create(model='embedding-3', input='bad')
+
+	with ThreadPoolExecutor(2) as pool:
+		list(pool.map(failing, range(2)))
+	assert len(calls) == 3
+
+
+def test_only_configured_endpoints_are_coalesced():
+	coalescer = RequestCoalescer(endpoints=('/moderations',))
+	assert coalescer.applies_to('/moderations')
+	assert not coalescer.applies_to('/embeddings')
+	assert RequestCoalescer(endpoints=None).applies_to('/chat/completions')
+
+
+async def test_async_identical_requests_share_one_call():
+	coalescer = RequestCoalescer()
+	calls = []
+
+	async def handler(request):
+		calls.append(request)
+		while coalescer.coalesced < 4:
+			await asyncio.sleep(0.005)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		coalescer=coalescer,
+	) as client:
+		results = await asyncio.wait_for(
+			asyncio.gather(*(client.embeddings.create(model='embedding-3', input='hi') for _ in range(5))),
+			timeout=2,
+		)
+
+	assert len(calls) == 1
+	assert all(result is results[0] for result in results)
@@ -0,0 +1,265 @@
+import functools
+import json
+import threading
+from typing import Any, Dict, List
+
+import httpx
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.api_resource.chat import ChatCompletionStream, ChatCompletionStreamAccumulator
+from zai.core import construct_type
+from zai.types.chat.chat_completion import Completion
+
+_USAGE = {'prompt_tokens': 10, 'completion_tokens': 6, 'total_tokens': 16}
+
+_NON_STREAMING = {
+	'id': 'chatcmpl-1',
+	'created': 1715329207,
+	'model': 'glm-4.5',
+	'choices': [
+		{
+			'index': 0,
+			'finish_reason': 'tool_calls',
+			'message': {
+				'role': 'assistant',
+				'content': 'Let me check.',
+				'reasoning_content': 'Need the weather.',
+				'tool_calls': [
+					{
+						'id': 'call_1',
+						'type': 'function',
+						'function': {'name': 'get_weather', 'arguments': '{"city": "Beijing"}'},
+					},
+					{
+						'id': 'call_2',
+						'type': 'function',
+						'function': {'name': 'get_time', 'arguments': '{}'},
+					},
+				],
+			},
+		}
+	],
+	'usage': _USAGE,
+}
+
+
+def _chunk(delta: Dict[str, Any], finish_reason: str = None, usage: Dict[str, int] = None) -> Dict[str, Any]:
+	chunk: Dict[str, Any] = {
+		'id': 'chatcmpl-1',
+		'created': 1715329207,
+		'model': 'glm-4.5',
+		'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+	}
+	if usage is not None:
+		chunk['usage'] = usage
+	return chunk
+
+
+def _tool_delta(index: int, **kwargs: Any) -> Dict[str, Any]:
+	return {'tool_calls': [dict(index=index, **kwargs)]}
+
+
+_CHUNKS: List[Dict[str, Any]] = [
+	_chunk({'role': 'assistant', 'reasoning_content': 'Need the '}),
+	_chunk({'reasoning_content': 'weather.'}),
+	_chunk({'content': 'Let me '}),
+	_chunk({'content': 'check.'}),
+	_chunk(_tool_delta(0, id='call_1', type='function', function={'name': 'get_weather', 'arguments': ''})),
+	_chunk(_tool_delta(0, function={'arguments': '{"city": '})),
+	_chunk(_tool_delta(1, id='call_2', type='function', function={'name': 'get_time', 'arguments': '{}'})),
+	_chunk(_tool_delta(0, function={'arguments': '"Beijing"}'})),
+	_chunk({}, finish_reason='tool_calls', usage=_USAGE),
+]
+
+
+def _sse() -> bytes:
+	return b''.join(f'data: {json.dumps(chunk)}\n\n'.encode() for chunk in _CHUNKS) + b'data: [DONE]\n\n'
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+	if json.loads(request.content).get('stream'):
+		return httpx.Response(200, content=_sse(), headers={'content-type': 'text/event-stream'})
+	return httpx.Response(200, json=_NON_STREAMING)
+
+
+def test_get_final_completion_matches_non_streaming():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+	)
+
+	expected = client.chat.completions.create(model='glm-4.5', messages=[])
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+
+	assert isinstance(stream, ChatCompletionStream)
+	first = next(stream)
+	assert first.choices[0].delta.reasoning_content == 'Need the '
+
+	completion = stream.get_final_completion()
+	assert isinstance(completion, Completion)
+	assert completion == expected
+	assert completion.choices[0].message.tool_calls[0].function.arguments == '{"city": "Beijing"}'
+	assert completion.usage.total_tokens == 16
+
+
+def test_get_final_completion_raw_mode():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+	)
+
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream='raw')
+
+	assert stream.get_final_completion() == construct_type(type_=Completion, value=_NON_STREAMING)
+
+
+def test_accumulator_multiple_choices_without_usage():
+	accumulator = ChatCompletionStreamAccumulator()
+	accumulator.add({'choices': [{'index': 1, 'delta': {'role': 'assistant', 'content': 'b'}}]})
+	accumulator.add({'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': 'a'}, 'finish_reason': 'stop'}]})
+	accumulator.add({'choices': [{'index': 1, 'delta': {'content': 'c'}, 'finish_reason': 'length'}]})
+
+	completion = accumulator.get_completion()
+
+	assert [choice.index for choice in completion.choices] == [0, 1]
+	assert [choice.message.content for choice in completion.choices] == ['a', 'bc']
+	assert [choice.finish_reason for choice in completion.choices] == ['stop', 'length']
+	assert completion.choices[0].message.tool_calls is None
+	assert completion.usage is None
+
+
+async def test_async_get_final_completion():
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+	) as client:
+		expected = await client.chat.completions.create(model='glm-4.5', messages=[])
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		completion = await stream.get_final_completion()
+
+	assert completion == expected
+
+
+def test_on_tool_call_fires_as_soon_as_arguments_complete():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+	)
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream=True, tool_stream=True)
+	seen = []
+	stream.on_tool_call(lambda call: seen.append((call.name, call.parsed_arguments, received[0])))
+
+	received = [0]
+	for _ in stream:
+		received[0] += 1
+
+	# get_time is complete in the 7th chunk, get_weather only in the 8th
+	assert seen == [('get_time', {}, 6), ('get_weather', {'city': 'Beijing'}, 7)]
+
+
+def test_tool_call_scan_handles_strings_and_escapes():
+	accumulator = ChatCompletionStreamAccumulator()
+	calls = []
+	accumulator.add_tool_call_listener(calls.append)
+
+	for fragment in ['{"q": "a}', ' \\"{b\\\\', '\\"", "n": [1, ', '{"x": 2}]', '}']:
+		accumulator.add({'choices': [{'index': 0, 'delta': {'tool_calls': [{'index': 0, 'function': {'arguments': fragment}}]}}]})
+		if fragment != '}':
+			assert calls == []
+
+	assert len(calls) == 1
+	assert calls[0].parsed_arguments == {'q': 'a} "{b\\"', 'n': [1, {'x': 2}]}
+
+
+def test_unfinished_tool_call_is_flushed_at_finish_reason():
+	accumulator = ChatCompletionStreamAccumulator()
+	calls = []
+	accumulator.add_tool_call_listener(calls.append)
+
+	accumulator.add({'choices': [{'index': 0, 'delta': {'tool_calls': [{'index': 0, 'id': 'c', 'function': {'name': 'f', 'arguments': '{"a": '}}]}}]})
+	assert calls == []
+	accumulator.add({'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'tool_calls'}]})
+
+	assert len(calls) == 1
+	assert calls[0].arguments == '{"a": '
+	assert calls[0].parsed_arguments is None
+	accumulator.finish()
+	assert len(calls) == 1
+
+
+def test_dispatch_tool_calls_to_executor():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+	)
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+	futures = stream.dispatch_tool_calls(lambda call: f'{call.name}:{call.id}')
+
+	stream.get_final_completion()
+
+	assert sorted(future.result(timeout=5) for future in futures) == ['get_time:call_2', 'get_weather:call_1']
+
+
+async def test_async_dispatch_tool_calls():
+	async def run_tool(call):
+		return call.parsed_arguments
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+	) as client:
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		tasks = stream.dispatch_tool_calls(run_tool)
+		threaded = stream.dispatch_tool_calls(lambda call: call.name)
+		async for _ in stream:
+			pass
+
+		assert [await task for task in tasks] == [{}, {'city': 'Beijing'}]
+		assert [await future for future in threaded] == ['get_time', 'get_weather']
+
+
+async def test_async_dispatch_tool_calls_awaits_any_async_handler():
+	class Tool:
+		async def __call__(self, call, prefix):
+			return f'{prefix}{call.name}'
+
+	async def run_tool(call, prefix):
+		return f'{prefix}{call.name}'
+
+	def decorated(func):
+		def wrapper(call):
+			return func(call, 'decorated:')
+
+		return wrapper
+
+	loop_thread = threading.get_ident()
+	threads = []
+
+	def sync_tool(call):
+		threads.append(threading.get_ident())
+		return call.name
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+	) as client:
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		partial = stream.dispatch_tool_calls(functools.partial(run_tool, prefix='partial:'))
+		instance = stream.dispatch_tool_calls(functools.partial(Tool(), prefix='call:'))
+		wrapped = stream.dispatch_tool_calls(decorated(run_tool))
+		threaded = stream.dispatch_tool_calls(sync_tool)
+		async for _ in stream:
+			pass
+
+		assert [await task for task in partial] == ['partial:get_time', 'partial:get_weather']
+		assert [await task for task in instance] == ['call:get_time', 'call:get_weather']
+		assert [await task for task in wrapped] == ['decorated:get_time', 'decorated:get_weather']
+		assert [await task for task in threaded] == ['get_time', 'get_weather']
+		assert loop_thread not in threads
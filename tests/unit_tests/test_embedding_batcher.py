@@ -0,0 +1,101 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import APIStatusError
+
+
+def _handler(calls):
+	lock = threading.Lock()
+
+	def handler(request):
+		body = json.loads(request.content)
+		with lock:
+			calls.append(body['input'])
+		if 'bad' in body['input']:
+			return httpx.Response(400, json={'error': {'code': '1214', 'message': 'bad input'}})
+		return httpx.Response(
+			200,
+			json={
+				'object': 'list',
+				'model': 'embedding-3',
+				'data': [
+					{'object': 'embedding', 'index': index, 'embedding': [float(text)]}
+					for index, text in reversed(list(enumerate(body['input'])))
+				],
+				'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+			},
+		)
+
+	return handler
+
+
+def _client(calls):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler(calls))),
+	)
+
+
+def test_concurrent_calls_are_merged_into_batches():
+	calls = []
+	batcher = _client(calls).embeddings.batcher(model='embedding-3', max_batch_size=4, max_wait_ms=200)
+
+	with ThreadPoolExecutor(8) as pool:
+		results = list(pool.map(lambda number: batcher.embed(str(number)), range(8)))
+
+	assert [result.embedding[0] for result in results] == list(range(8))
+	assert batcher.requests == len(calls) == 2
+	assert sorted(len(batch) for batch in calls) == [4, 4]
+
+
+def test_lone_call_is_sent_after_max_wait():
+	calls = []
+	batcher = _client(calls).embeddings.batcher(model='embedding-3', max_wait_ms=20)
+
+	started = time.monotonic()
+	assert batcher.embed('7').embedding == [7.0]
+	assert time.monotonic() - started >= 0.02
+	assert calls == [['7']]
+
+
+def test_errors_are_shared_by_the_batch():
+	calls = []
+	batcher = _client(calls).embeddings.batcher(model='embedding-3', max_batch_size=2, max_wait_ms=1000)
+
+	def embed(text):
+		with pytest.raises(APIStatusError):
+			batcher.embed(text)
+
+	with ThreadPoolExecutor(2) as pool:
+		list(pool.map(embed, ['1', 'bad']))
+	assert len(calls) == 1
+
+
+async def test_async_calls_are_merged_and_survive_cancellation():
+	calls = []
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(calls))),
+	) as client:
+		batcher = client.embeddings.batcher(model='embedding-3', max_batch_size=10, max_wait_ms=50)
+
+		results = await asyncio.gather(*(batcher.embed(str(number)) for number in range(5)))
+		assert [result.embedding[0] for result in results] == list(range(5))
+		assert calls == [['0', '1', '2', '3', '4']]
+
+		leader = asyncio.ensure_future(batcher.embed('8'))
+		await asyncio.sleep(0)
+		follower = asyncio.ensure_future(batcher.embed('9'))
+		await asyncio.sleep(0)
+		leader.cancel()
+		assert (await asyncio.wait_for(follower, timeout=1)).embedding == [9.0]
+		assert calls[-1] == ['9']
@@ -0,0 +1,139 @@
+import json
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.api_resource.embeddings import EmbeddingCache, MemoryEmbeddingCache, SQLiteEmbeddingCache
+from zai.api_resource.embeddings.embedding_cache import embedding_key, pack_vector, unpack_vector
+
+
+def _vector(text):
+	return [float(len(text)), 0.1]
+
+
+def _handler(calls):
+	def handler(request):
+		body = json.loads(request.content)
+		calls.append(body)
+		texts = body['input'] if isinstance(body['input'], list) else [body['input']]
+		return httpx.Response(
+			200,
+			json={
+				'object': 'list',
+				'model': body['model'],
+				'data': [
+					{'object': 'embedding', 'index': index, 'embedding': _vector(text)}
+					for index, text in reversed(list(enumerate(texts)))
+				],
+				'usage': {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)},
+			},
+		)
+
+	return handler
+
+
+def _client(calls, cache):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler(calls))),
+		embedding_cache=cache,
+	)
+
+
+def test_vectors_are_packed_as_float32():
+	blob = pack_vector([0.25, -1.0, 3.5])
+	assert len(blob) == 12
+	assert unpack_vector(blob).tolist() == [0.25, -1.0, 3.5]
+
+
+def test_keys_depend_on_model_and_dimensions():
+	assert embedding_key('embedding-3', None, 'hi') == embedding_key('embedding-3', None, 'hi')
+	assert embedding_key('embedding-3', None, 'hi') != embedding_key('embedding-3', 256, 'hi')
+	assert embedding_key('embedding-3', None, 'hi') != embedding_key('embedding-2', None, 'hi')
+
+
+def test_only_misses_are_sent_and_merged_in_order():
+	calls = []
+	cache = EmbeddingCache()
+	client = _client(calls, cache)
+
+	client.embeddings.create(model='embedding-3', input=['a', 'bbb'])
+	response = client.embeddings.create(model='embedding-3', input=['cc', 'a', 'dddd', 'cc', 'bbb'])
+
+	assert calls[1]['input'] == ['cc', 'dddd']
+	assert [item.index for item in response.data] == [0, 1, 2, 3, 4]
+	assert [item.embedding[0] for item in response.data] == [2, 1, 4, 2, 3]
+	# vectors fetched by this call are returned as sent, cache hits as float32
+	assert response.data[0].embedding == [2, 0.1] and response.data[3].embedding == [2, 0.1]
+	assert response.data[1].embedding == [1, pytest.approx(0.1)] and response.data[1].embedding[1] != 0.1
+	assert response.usage.total_tokens == 2
+	assert (cache.hits, cache.misses) == (2, 4)
+
+	response = client.embeddings.create(model='embedding-3', input='dddd')
+	assert len(calls) == 2
+	assert response.data[0].embedding == [4, pytest.approx(0.1)]
+	assert response.usage.total_tokens == 0
+
+	client.embeddings.create(model='embedding-3', input='dddd', dimensions=256)
+	client.embeddings.create(model='embedding-3', input=[[1, 2]])
+	assert len(calls) == 4
+
+
+def test_memory_cache_evicts_least_recently_used():
+	cache = MemoryEmbeddingCache(max_entries=2)
+	keys = [embedding_key('m', None, text) for text in 'abc']
+	cache.set_many([(keys[0], b'a'), (keys[1], b'b')])
+	cache.get_many([keys[0]])
+	cache.set_many([(keys[2], b'c')])
+	assert cache.get_many(keys) == [b'a', None, b'c']
+
+
+def test_sqlite_cache_persists_across_clients(tmp_path):
+	calls = []
+	path = tmp_path / 'embeddings.db'
+	_client(calls, EmbeddingCache(SQLiteEmbeddingCache(path))).embeddings.create(model='embedding-3', input=['a', 'b'])
+	response = _client(calls, EmbeddingCache(SQLiteEmbeddingCache(path))).embeddings.create(
+		model='embedding-3', input=['b', 'a']
+	)
+	assert len(calls) == 1
+	assert [item.embedding for item in response.data] == [[1, pytest.approx(0.1)], [1, pytest.approx(0.1)]]
+
+
+def test_mismatched_response_is_rejected():
+	def handler(request):
+		return httpx.Response(
+			200,
+			json={
+				'object': 'list',
+				'model': 'embedding-3',
+				'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1]}],
+				'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+			},
+		)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		embedding_cache=EmbeddingCache(),
+	)
+	with pytest.raises(ValueError):
+		client.embeddings.create(model='embedding-3', input=['a', 'b'])
+
+
+async def test_async_client_uses_the_cache():
+	calls = []
+	cache = EmbeddingCache()
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(calls))),
+		embedding_cache=cache,
+	) as client:
+		await client.embeddings.create(model='embedding-3', input='a')
+		response = await client.embeddings.create(model='embedding-3', input=['bb', 'a'])
+
+	assert calls[1]['input'] == ['bb']
+	assert [item.embedding[0] for item in response.data] == [2, 1]
@@ -0,0 +1,71 @@
+import pytest
+
+from zai.types.embeddings import EmbeddingsResponded, cosine_topk, dot, normalize
+
+np = pytest.importorskip('numpy')
+
+
+def _response(vectors):
+	return EmbeddingsResponded(
+		object='list',
+		model='embedding-3',
+		data=[{'object': 'embedding', 'index': index, 'embedding': vector} for index, vector in enumerate(vectors)],
+		usage={'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+	)
+
+
+def _brute_force_topk(queries, corpus, k):
+	scores = normalize(queries) @ normalize(corpus).T
+	order = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+	return order, np.take_along_axis(scores, order, axis=1)
+
+
+def test_normalize_keeps_zero_rows():
+	matrix = normalize([[3.0, 4.0], [0.0, 0.0]])
+	assert matrix.dtype == np.float32
+	assert matrix.tolist() == [[0.6000000238418579, 0.800000011920929], [0.0, 0.0]]
+
+
+def test_chunked_dot_matches_full_product():
+	rng = np.random.default_rng(0)
+	queries, corpus = rng.standard_normal((3, 8)), rng.standard_normal((50, 8))
+	expected = (queries @ corpus.T).astype(np.float32)
+
+	assert np.allclose(dot(queries, corpus), expected, atol=1e-5)
+	assert np.allclose(dot(queries, corpus, chunk_size=7), expected, atol=1e-5)
+
+
+@pytest.mark.parametrize('chunk_size', [None, 1, 7, 1000])
+def test_cosine_topk_matches_brute_force(chunk_size):
+	rng = np.random.default_rng(1)
+	queries, corpus = rng.standard_normal((4, 16)).astype(np.float32), rng.standard_normal((100, 16)).astype(np.float32)
+
+	indices, scores = cosine_topk(queries, corpus, 5, chunk_size=chunk_size)
+	expected_indices, expected_scores = _brute_force_topk(queries, corpus, 5)
+
+	assert indices.shape == (4, 5)
+	assert np.array_equal(indices, expected_indices)
+	assert np.allclose(scores, expected_scores, atol=1e-5)
+
+
+def test_single_query_and_small_corpus():
+	corpus = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+	indices, scores = cosine_topk([2.0, 0.1], corpus, k=10)
+	assert indices.tolist() == [0, 2, 1]
+	assert scores.shape == (3,)
+
+	normalized = normalize(corpus)
+	indices, _ = cosine_topk(normalize([0.0, 1.0])[0], normalized, k=1, normalized=True)
+	assert indices.tolist() == [1]
+
+
+def test_helpers_on_embeddings_responded():
+	response = _response([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]])
+
+	assert np.allclose(np.linalg.norm(response.normalized(), axis=1), 1)
+	indices, scores = response.cosine_topk([0.0, 1.0], k=2)
+	assert indices.tolist() == [1, 2]
+	assert scores[0] == pytest.approx(1.0)
+
+	indices, _ = response.cosine_topk(_response([[1.0, 0.1]]), k=1)
+	assert indices.tolist() == [[0]]
@@ -0,0 +1,99 @@
+import base64
+import json
+from array import array
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.types.embeddings import EmbeddingsResponded, decode_embedding
+
+np = pytest.importorskip('numpy')
+
+_VECTORS = [[0.5, -1.25, 3.0], [1.0, 2.0, -0.75]]
+
+
+def _encode(vector):
+	return base64.b64encode(np.asarray(vector, dtype='<f4').tobytes()).decode()
+
+
+def _handler(calls):
+	def handler(request):
+		body = json.loads(request.content)
+		calls.append(body)
+		return httpx.Response(
+			200,
+			json={
+				'object': 'list',
+				'model': 'embedding-3',
+				'data': [
+					{'object': 'embedding', 'index': index, 'embedding': _encode(vector)}
+					for index, vector in reversed(list(enumerate(_VECTORS)))
+				],
+				'usage': {'prompt_tokens': 2, 'completion_tokens': 0, 'total_tokens': 2},
+			},
+		)
+
+	return handler
+
+
+def test_decode_embedding():
+	vector = decode_embedding(_encode(_VECTORS[0]))
+	assert vector.dtype == np.float32
+	assert vector.tolist() == _VECTORS[0]
+	vector /= 2
+	assert vector.tolist() == [value / 2 for value in _VECTORS[0]]
+
+	with patch('zai.types.embeddings.embeddings._import_numpy', return_value=None):
+		fallback = decode_embedding(_encode(_VECTORS[0]))
+	assert isinstance(fallback, array) and fallback.typecode == 'f'
+	assert fallback.tolist() == _VECTORS[0]
+
+
+def test_base64_embeddings_are_decoded():
+	calls = []
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler(calls))),
+	)
+
+	response = client.embeddings.create(model='embedding-3', input=['a', 'b'], encoding_format='base64')
+
+	assert calls[0]['encoding_format'] == 'base64'
+	assert isinstance(response.data[0].vector, np.ndarray)
+	assert response.data[0].vector.flags['WRITEABLE']
+	assert json.loads(response.to_json())['data'][0]['embedding'] == _encode(_VECTORS[1])
+	matrix = response.to_numpy()
+	assert matrix.shape == (2, 3) and matrix.dtype == np.float32
+	assert matrix.flags['C_CONTIGUOUS']
+	assert matrix.tolist() == _VECTORS
+
+
+def test_to_numpy_accepts_float_lists_and_empty_responses():
+	usage = {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1}
+	response = EmbeddingsResponded(
+		object='list',
+		model='embedding-3',
+		data=[
+			{'object': 'embedding', 'index': 1, 'embedding': _VECTORS[1]},
+			{'object': 'embedding', 'index': 0, 'embedding': _encode(_VECTORS[0])},
+		],
+		usage=usage,
+	)
+	assert response.to_numpy().tolist() == _VECTORS
+
+	empty = EmbeddingsResponded(object='list', model='embedding-3', data=[], usage=usage)
+	assert empty.to_numpy().shape == (0, 0)
+
+
+async def test_async_base64_embeddings_are_decoded():
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler([]))),
+	) as client:
+		response = await client.embeddings.create_many(inputs=['a', 'b'], model='embedding-3', encoding_format='base64')
+
+	assert response.to_numpy().tolist() == _VECTORS
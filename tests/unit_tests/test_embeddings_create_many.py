@@ -0,0 +1,140 @@
+import json
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.api_resource.embeddings.embeddings import _split_batches
+from zai.core import APIStatusError
+
+
+def _handler(calls, fail_first=()):
+	lock = threading.Lock()
+	failed = set()
+
+	def handler(request):
+		body = json.loads(request.content)
+		with lock:
+			calls.append(body['input'])
+			first = body['input'][0]
+			if first in fail_first and first not in failed:
+				failed.add(first)
+				return httpx.Response(503, json={'error': {'code': '500', 'message': 'busy'}})
+		texts = body['input']
+		return httpx.Response(
+			200,
+			json={
+				'object': 'list',
+				'model': 'embedding-3',
+				'data': [
+					{'object': 'embedding', 'index': index, 'embedding': [float(text)]}
+					for index, text in reversed(list(enumerate(texts)))
+				],
+				'usage': {'prompt_tokens': len(texts), 'completion_tokens': 0, 'total_tokens': len(texts)},
+			},
+		)
+
+	return handler
+
+
+def test_inputs_are_split_by_count_and_tokens():
+	assert _split_batches(['a'] * 5, batch_size=2, max_batch_tokens=100) == [['a', 'a'], ['a', 'a'], ['a']]
+	assert _split_batches(['x' * 40, 'y' * 40, 'z'], batch_size=10, max_batch_tokens=15) == [
+		['x' * 40],
+		['y' * 40, 'z'],
+	]
+	assert _split_batches([[1, 2, 3], [4, 5]], batch_size=10, max_batch_tokens=4) == [[[1, 2, 3]], [[4, 5]]]
+	assert _split_batches([], batch_size=10, max_batch_tokens=10) == []
+
+
+def test_create_many_preserves_order_and_sums_usage():
+	calls = []
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler(calls))),
+	)
+	inputs = [str(number) for number in range(25)]
+
+	response = client.embeddings.create_many(inputs=inputs, model='embedding-3', batch_size=4, max_concurrency=3)
+
+	assert len(calls) == 7
+	assert [item.embedding[0] for item in response.data] == list(range(25))
+	assert [item.index for item in response.data] == list(range(25))
+	assert response.usage.total_tokens == 25
+
+
+def test_missing_usage_is_counted_as_zero():
+	def handler(request):
+		texts = json.loads(request.content)['input']
+		body = {
+			'object': 'list',
+			'model': 'embedding-3',
+			'data': [{'object': 'embedding', 'index': index, 'embedding': [1.0]} for index in range(len(texts))],
+		}
+		if texts[0] == 'b':
+			body['usage'] = {'prompt_tokens': 2, 'total_tokens': 2}
+		return httpx.Response(200, json=body)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+	)
+	response = client.embeddings.create_many(inputs=['a', 'b', 'c'], model='embedding-3', batch_size=1)
+
+	assert len(response.data) == 3
+	assert (response.usage.prompt_tokens, response.usage.completion_tokens, response.usage.total_tokens) == (2, 0, 2)
+
+
+def test_failed_batches_are_retried_on_their_own():
+	calls = []
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		max_retries=0,
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler(calls, fail_first={'4'}))),
+	)
+	with patch('zai.api_resource.embeddings.embeddings.time.sleep') as sleep:
+		response = client.embeddings.create_many(
+			inputs=[str(number) for number in range(8)], model='embedding-3', batch_size=4
+		)
+
+	assert sleep.call_count == 1
+	assert [batch[0] for batch in calls].count('0') == 1
+	assert [batch[0] for batch in calls].count('4') == 2
+	assert [item.embedding[0] for item in response.data] == list(range(8))
+
+
+def test_non_retryable_errors_are_raised():
+	def handler(request):
+		return httpx.Response(400, json={'error': {'code': '1214', 'message': 'bad input'}})
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+	)
+	with pytest.raises(APIStatusError):
+		client.embeddings.create_many(inputs=['1', '2', '3'], model='embedding-3', batch_size=1)
+
+
+async def test_async_create_many():
+	calls = []
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		max_retries=0,
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(calls, fail_first={'6'}))),
+	) as client:
+		with patch('zai.api_resource.embeddings.embeddings.anyio.sleep') as sleep:
+			response = await client.embeddings.create_many(
+				inputs=[str(number) for number in range(10)], model='embedding-3', batch_size=3, max_concurrency=2
+			)
+
+	assert sleep.await_count == 1
+	assert len(calls) == 5
+	assert [item.embedding[0] for item in response.data] == list(range(10))
+	assert response.usage.prompt_tokens == 10
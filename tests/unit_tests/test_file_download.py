@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import ZaiError
+from zai.core._download import download_to_path
+
+_CONTENT = os.urandom(300 * 1024)
+
+
+class _Body(httpx.SyncByteStream, httpx.AsyncByteStream):
+	def __init__(self, data, fail_after=None):
+		self.data = data
+		self.fail_after = fail_after
+
+	def _chunks(self):
+		for start in range(0, len(self.data), 16 * 1024):
+			if self.fail_after is not None and start >= self.fail_after:
+				raise httpx.ReadError('connection reset')
+			yield self.data[start : start + 16 * 1024]
+
+	def __iter__(self):
+		yield from self._chunks()
+
+	async def __aiter__(self):
+		for chunk in self._chunks():
+			yield chunk
+
+
+class _Server:
+	"""Serves `_CONTENT` with Range support; `interrupt` drops the connection of the first response."""
+
+	def __init__(self, ranges=True, interrupt=None, etag='"v1"'):
+		self.ranges = ranges
+		self.interrupt = interrupt
+		self.etag = etag
+		self.requested = []
+		self._lock = threading.Lock()
+
+	def __call__(self, request):
+		with self._lock:
+			self.requested.append(request.headers.get('range'))
+			fail_after, self.interrupt = self.interrupt, None
+		assert request.url.path == '/v4/files/file-1/content'
+		match = re.fullmatch(r'bytes=(\d+)-(\d*)', request.headers.get('range', ''))
+		if_range = request.headers.get('if-range')
+		if not self.ranges or match is None or (if_range is not None and if_range != self.etag):
+			return httpx.Response(200, headers={'content-length': str(len(_CONTENT))}, stream=_Body(_CONTENT))
+		start = int(match.group(1))
+		end = int(match.group(2)) if match.group(2) else len(_CONTENT) - 1
+		if start >= len(_CONTENT):
+			return httpx.Response(416, headers={'content-range': f'bytes */{len(_CONTENT)}'})
+		end = min(end, len(_CONTENT) - 1)
+		return httpx.Response(
+			206,
+			headers={
+				'content-range': f'bytes {start}-{end}/{len(_CONTENT)}',
+				**({'etag': self.etag} if self.etag else {}),
+			},
+			stream=_Body(_CONTENT[start : end + 1], fail_after),
+		)
+
+
+def _client(server):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(server)),
+	)
+
+
+def test_interrupted_download_is_resumed(tmp_path):
+	server = _Server(interrupt=96 * 1024)
+	target = tmp_path / 'output.jsonl'
+
+	path = _client(server).files.stream_content_to_path('file-1', target)
+
+	assert path == target
+	assert target.read_bytes() == _CONTENT
+	assert not (tmp_path / 'output.jsonl.part').exists()
+	assert server.requested == ['bytes=0-', f'bytes={96 * 1024}-']
+
+
+def _leave_part(path, content, validator='"v1"'):
+	path.with_name(path.name + '.part').write_bytes(content)
+	if validator is not None:
+		state = {'validator': validator, 'total': len(_CONTENT)}
+		path.with_name(path.name + '.part.json').write_text(json.dumps(state))
+
+
+def test_left_over_part_file_is_resumed(tmp_path):
+	server = _Server()
+	_leave_part(tmp_path / 'output.jsonl', _CONTENT[:1000])
+
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'output.jsonl')
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+	assert server.requested == ['bytes=1000-']
+	assert not (tmp_path / 'output.jsonl.part.json').exists()
+
+	_leave_part(tmp_path / 'again.jsonl', _CONTENT)
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'again.jsonl')
+	assert (tmp_path / 'again.jsonl').read_bytes() == _CONTENT
+
+
+def test_changed_or_unvalidated_part_file_restarts(tmp_path):
+	changed = _Server(etag='"v2"')
+	_leave_part(tmp_path / 'changed.jsonl', b'old prefix')
+	_client(changed).files.stream_content_to_path('file-1', tmp_path / 'changed.jsonl')
+	assert (tmp_path / 'changed.jsonl').read_bytes() == _CONTENT
+	assert changed.requested == ['bytes=10-']
+
+	server = _Server()
+	_leave_part(tmp_path / 'unknown.jsonl', b'old prefix', validator=None)
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'unknown.jsonl')
+	assert (tmp_path / 'unknown.jsonl').read_bytes() == _CONTENT
+	assert server.requested == ['bytes=0-']
+
+
+def test_interruption_without_validator_restarts(tmp_path):
+	server = _Server(interrupt=96 * 1024, etag=None)
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'output.jsonl')
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+	assert server.requested == ['bytes=0-', 'bytes=0-']
+
+
+def test_interrupted_download_leaves_validator_for_the_next_call(tmp_path):
+	server = _Server(interrupt=96 * 1024)
+	target = tmp_path / 'output.jsonl'
+	client = _client(server)
+	with pytest.raises(httpx.TransportError):
+		download_to_path(client, '/files/file-1/content', target, options={}, resume_attempts=0)
+	state = json.loads((tmp_path / 'output.jsonl.part.json').read_text())
+	assert state == {'validator': '"v1"', 'total': len(_CONTENT)}
+
+	client.files.stream_content_to_path('file-1', target)
+	assert target.read_bytes() == _CONTENT
+	assert server.requested == ['bytes=0-', f'bytes={96 * 1024}-']
+
+
+def test_server_without_range_support_restarts(tmp_path):
+	server = _Server(ranges=False)
+	_leave_part(tmp_path / 'output.jsonl', b'stale')
+
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'output.jsonl', parallel=4)
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+
+
+def test_checksum_is_verified(tmp_path):
+	client = _client(_Server())
+	digest = hashlib.sha256(_CONTENT).hexdigest()
+
+	client.files.stream_content_to_path('file-1', tmp_path / 'ok.jsonl', checksum=digest)
+	assert (tmp_path / 'ok.jsonl').read_bytes() == _CONTENT
+
+	with pytest.raises(ZaiError, match='checksum'):
+		client.files.stream_content_to_path('file-1', tmp_path / 'bad.jsonl', checksum='0' * 64)
+	assert not (tmp_path / 'bad.jsonl').exists()
+	assert not (tmp_path / 'bad.jsonl.part').exists()
+
+
+def test_parallel_ranges(tmp_path):
+	server = _Server(interrupt=None)
+	part_size = 64 * 1024
+
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'output.jsonl', parallel=3, part_size=part_size)
+
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+	assert server.requested[0] == f'bytes=0-{part_size - 1}'
+	starts = range(part_size, len(_CONTENT), part_size)
+	expected = [f'bytes={start}-{min(start + part_size, len(_CONTENT)) - 1}' for start in starts]
+	assert sorted(server.requested[1:]) == sorted(expected)
+
+
+def test_parallel_download_of_a_file_smaller_than_a_part(tmp_path):
+	server = _Server()
+
+	_client(server).files.stream_content_to_path('file-1', tmp_path / 'output.jsonl', parallel=4)
+
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+	assert server.requested == [f'bytes=0-{16 * 1024 * 1024 - 1}']
+
+
+async def test_async_parallel_download_of_a_file_smaller_than_a_part(tmp_path):
+	server = _Server()
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+	) as client:
+		await client.files.stream_content_to_path('file-1', tmp_path / 'output.jsonl', parallel=4)
+
+	assert (tmp_path / 'output.jsonl').read_bytes() == _CONTENT
+	assert server.requested == [f'bytes=0-{16 * 1024 * 1024 - 1}']
+
+
+async def test_async_download(tmp_path):
+	server = _Server(interrupt=48 * 1024)
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+	) as client:
+		await client.files.stream_content_to_path('file-1', tmp_path / 'sequential.jsonl')
+		await client.files.stream_content_to_path(
+			'file-1', tmp_path / 'parallel.jsonl', parallel=4, part_size=40 * 1024
+		)
+
+	assert (tmp_path / 'sequential.jsonl').read_bytes() == _CONTENT
+	assert (tmp_path / 'parallel.jsonl').read_bytes() == _CONTENT
+	assert server.requested[:2] == ['bytes=0-', f'bytes={48 * 1024}-']
@@ -0,0 +1,115 @@
+import threading
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import APIStatusError
+from zai.core._retry import RetryPolicy
+
+
+class _Server:
+	"""Accepts uploads, answering 503 to the first `failures[name]` attempts of a file."""
+
+	def __init__(self, failures=None):
+		self.failures = dict(failures or {})
+		self.attempts = []
+		self._lock = threading.Lock()
+
+	def __call__(self, request):
+		body = request.read()
+		name = next(part for part in (b'a.txt', b'b.txt', b'c.txt', b'd.txt') if part in body).decode()
+		with self._lock:
+			self.attempts.append(name)
+			failing = self.failures.get(name, 0)
+			self.failures[name] = failing - 1
+		if failing > 0:
+			return httpx.Response(503, json={'error': {'message': 'busy'}})
+		file = {'id': f'file-{name}', 'object': 'file', 'bytes': 1, 'created_at': 0, 'filename': name}
+		return httpx.Response(200, json={**file, 'purpose': 'retrieval'})
+
+
+def _paths(tmp_path):
+	paths = []
+	for name in ('a.txt', 'b.txt', 'c.txt', 'd.txt'):
+		(tmp_path / name).write_text(name)
+		paths.append(tmp_path / name)
+	return paths
+
+
+def _client(server, **kwargs):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(server)),
+		max_retries=0,
+		**kwargs,
+	)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+	monkeypatch.setattr('zai.api_resource.files.files.time.sleep', lambda _: None)
+
+	async def sleep(_):
+		return None
+
+	monkeypatch.setattr('zai.api_resource.files.files.anyio.sleep', sleep)
+
+
+def test_results_in_input_order_with_progress(tmp_path):
+	server = _Server(failures={'b.txt': 1})
+	progress = []
+
+	results = _client(server).files.upload_many(
+		_paths(tmp_path),
+		purpose='retrieval',
+		max_concurrency=3,
+		on_progress=lambda done, total: progress.append((done, total)),
+	)
+
+	assert [result.id for result in results] == ['file-a.txt', 'file-b.txt', 'file-c.txt', 'file-d.txt']
+	assert server.attempts.count('b.txt') == 2
+	assert sorted(progress) == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_failed_file_raises_or_is_returned(tmp_path):
+	paths = _paths(tmp_path)
+
+	with pytest.raises(APIStatusError):
+		_client(_Server(failures={'c.txt': 5})).files.upload_many(paths, purpose='retrieval', file_retries=1)
+
+	results = _client(_Server(failures={'c.txt': 5})).files.upload_many(
+		paths, purpose='retrieval', file_retries=1, return_exceptions=True
+	)
+	assert isinstance(results[2], APIStatusError)
+	assert [result.id for result in results[:2] + results[3:]] == ['file-a.txt', 'file-b.txt', 'file-d.txt']
+
+
+def test_non_retryable_status_is_not_retried(tmp_path):
+	server = _Server(failures={'a.txt': 1})
+	client = _client(server, retry_policy=RetryPolicy(retry_statuses={429}))
+
+	results = client.files.upload_many(_paths(tmp_path)[:1], purpose='retrieval', return_exceptions=True)
+	assert isinstance(results[0], APIStatusError)
+	assert server.attempts == ['a.txt']
+
+
+async def test_async_upload_many(tmp_path):
+	server = _Server(failures={'d.txt': 2})
+	progress = []
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+		max_retries=0,
+	) as client:
+		results = await client.files.upload_many(
+			_paths(tmp_path), purpose='retrieval', max_concurrency=2, on_progress=lambda done, _: progress.append(done)
+		)
+		assert [result.id for result in results] == ['file-a.txt', 'file-b.txt', 'file-c.txt', 'file-d.txt']
+		assert progress == [1, 2, 3, 4]
+
+		server.failures['a.txt'] = 9
+		with pytest.raises(APIStatusError):
+			await client.files.upload_many(_paths(tmp_path), purpose='retrieval', file_retries=0)
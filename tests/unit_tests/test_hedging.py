@@ -0,0 +1,214 @@
+import threading
+import time
+from unittest.mock import patch
+
+import anyio
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import HedgePolicy, RateLimit, RateLimiter
+
+_EMBEDDINGS = {
+	'object': 'list',
+	'model': 'embedding-3',
+	'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+}
+
+
+def test_learned_delay_uses_the_latency_percentile():
+	policy = HedgePolicy(initial_delay=2.0, min_samples=10)
+
+	assert policy.hedge_delay('/chat/completions') is None
+	assert policy.hedge_delay('/embeddings') == 2.0
+
+	for i in range(1, 101):
+		policy.record_latency('/embeddings', i / 100)
+	assert policy.hedge_delay('embeddings') == pytest.approx(0.95)
+
+	# polling different task ids shares the same latency statistics
+	for i in range(10):
+		policy.record_latency(f'/async-result/task-{i}', 0.5)
+	assert policy.hedge_delay('/async-result/task-x') == 0.5
+	assert HedgePolicy(delay=0.3).hedge_delay('/moderations') == 0.3
+
+
+def test_hedges_are_capped_to_a_fraction_of_traffic():
+	policy = HedgePolicy(delay=0.1, max_hedge_ratio=0.5)
+	for _ in range(4):
+		policy.hedge_delay('/embeddings')
+
+	assert policy.acquire_hedge()
+	assert policy.acquire_hedge()
+	assert not policy.acquire_hedge()
+
+
+def test_slow_request_is_hedged_and_the_faster_answer_wins():
+	release = threading.Event()
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		if len(calls) == 1:
+			release.wait(5)
+			return httpx.Response(200, json={**_EMBEDDINGS, 'model': 'slow'})
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(delay=0.05, max_hedge_ratio=1),
+	)
+	try:
+		started = time.monotonic()
+		response = client.embeddings.create(model='embedding-3', input='hello')
+
+		assert time.monotonic() - started < 2
+		assert response.model == 'embedding-3'
+		assert len(calls) == 2
+		assert calls[0].content == calls[1].content
+	finally:
+		release.set()
+		client.close()
+
+
+class _CountingLimiter:
+	def __init__(self):
+		self.reserved = []
+
+	def reserve(self, path, body):
+		self.reserved.append(path)
+		return 0.0
+
+
+def test_hedge_is_charged_to_the_rate_limiter():
+	release = threading.Event()
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		if len(calls) == 1:
+			release.wait(5)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	limiter = _CountingLimiter()
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(delay=0.05, max_hedge_ratio=1),
+		rate_limiter=limiter,
+	)
+	try:
+		client.embeddings.create(model='embedding-3', input='hello')
+		assert len(calls) == 2
+		assert limiter.reserved == ['/embeddings', '/embeddings']
+	finally:
+		release.set()
+		client.close()
+
+
+def test_no_hedge_when_its_rate_limit_wait_outlasts_the_deadline():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		if len(calls) == 1:
+			time.sleep(0.3)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(delay=0.05, max_hedge_ratio=1),
+		rate_limiter=RateLimiter(default=RateLimit(requests_per_minute=1)),
+		deadline=5,
+	)
+	with client:
+		started = time.monotonic()
+		client.embeddings.create(model='embedding-3', input='hello')
+		assert time.monotonic() - started < 2
+		assert len(calls) == 1
+		# the skipped hedge was not charged, so the next call only waits for the first one's share
+		with patch('zai.core._http_client.time.sleep') as sleep:
+			client.embeddings.create(model='embedding-3', input='hello', deadline=None)
+		assert sleep.call_args[0][0] == pytest.approx(60, abs=1)
+		assert len(calls) == 2
+
+
+def test_concurrent_calls_do_not_queue_into_spurious_hedges():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		time.sleep(0.05)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(delay=0.5, max_hedge_ratio=1),
+	)
+	threads = [
+		threading.Thread(target=client.embeddings.create, kwargs={'model': 'embedding-3', 'input': 'hello'})
+		for _ in range(64)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	client.close()
+
+	assert len(calls) == 64
+
+
+def test_other_endpoints_are_not_hedged():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		time.sleep(0.1)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(endpoints=('/moderations',), delay=0.01, max_hedge_ratio=1),
+	)
+	client.embeddings.create(model='embedding-3', input='hello')
+
+	assert len(calls) == 1
+
+
+async def test_async_hedge_cancels_the_slower_request():
+	calls = []
+	cancelled = []
+
+	async def handler(request):
+		calls.append(request)
+		if len(calls) == 1:
+			try:
+				await anyio.sleep(10)
+			except anyio.get_cancelled_exc_class():
+				cancelled.append(request)
+				raise
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		hedge_policy=HedgePolicy(delay=0.05, max_hedge_ratio=1),
+	) as client:
+		started = time.monotonic()
+		response = await client.embeddings.create(model='embedding-3', input='hello')
+
+	assert time.monotonic() - started < 2
+	assert response.model == 'embedding-3'
+	assert len(calls) == 2
+	assert cancelled == [calls[0]]
@@ -0,0 +1,165 @@
+import json
+import random
+from typing import List
+
+import httpx
+import pydantic
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import IncrementalJSONParser, JSONEvent
+
+_DOC = {
+	'title': 'A "quoted" \\ title \U0001f600',
+	'tags': ['a', 'b\nc'],
+	'score': -12.5e1,
+	'flags': [True, False, None],
+	'nested': {'empty': {}, 'list': [[], {'x': 1}]},
+}
+
+
+class Answer(pydantic.BaseModel):
+	title: str
+	score: float
+
+
+def _split(text: str, rng: random.Random) -> List[str]:
+	fragments, i = [], 0
+	while i < len(text):
+		size = rng.randint(1, 6)
+		fragments.append(text[i : i + size])
+		i += size
+	return fragments
+
+
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+def test_parses_randomly_split_documents(ensure_ascii: bool):
+	text = '```json\n' + json.dumps(_DOC, ensure_ascii=ensure_ascii) + '\n```'
+	rng = random.Random(0)
+	for _ in range(50):
+		parser = IncrementalJSONParser()
+		for fragment in _split(text, rng):
+			parser.feed(fragment)
+			parser.value
+		parser.close()
+		assert parser.done
+		assert parser.result == _DOC
+
+
+def test_events_are_emitted_as_values_complete():
+	parser = IncrementalJSONParser()
+
+	assert parser.feed('{"a": 1') == []
+	assert parser.feed(', "b": [tr') == [JSONEvent(('a',), 1)]
+	assert parser.feed('ue, "x"], "c": {"d": null}') == [
+		JSONEvent(('b', 0), True),
+		JSONEvent(('b', 1), 'x'),
+		JSONEvent(('b',), [True, 'x']),
+		JSONEvent(('c', 'd'), None),
+		JSONEvent(('c',), {'d': None}),
+	]
+	assert parser.feed('}') == [JSONEvent((), {'a': 1, 'b': [True, 'x'], 'c': {'d': None}})]
+
+
+def test_partial_value_includes_string_in_progress():
+	parser = IncrementalJSONParser()
+	parser.feed('{"items": ["fir')
+	assert parser.value == {'items': ['fir']}
+	parser.feed('st", "sec\\u00')
+	assert parser.value == {'items': ['first', 'sec']}
+	parser.feed('e9')
+	assert parser.value == {'items': ['first', 'secé']}
+	parser.feed('"]}')
+	assert parser.result == {'items': ['first', 'secé']}
+
+
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+def test_partial_string_grows_by_prefixes(ensure_ascii: bool):
+	content = 'tool "args" \\ é \U0001f600 line\n' * 50
+	text = json.dumps({'arguments': content}, ensure_ascii=ensure_ascii)
+	rng = random.Random(1)
+	parser = IncrementalJSONParser()
+	previous = ''
+	for fragment in _split(text, rng):
+		parser.feed(fragment)
+		partial = (parser.value or {}).get('arguments', '')
+		assert content.startswith(partial)
+		assert len(partial) >= len(previous)
+		previous = partial
+	assert parser.result == {'arguments': content}
+
+
+def test_incomplete_and_invalid_documents_raise():
+	parser = IncrementalJSONParser()
+	parser.feed('{"a": [1, 2')
+	with pytest.raises(ValueError, match='incomplete'):
+		parser.close()
+
+	with pytest.raises(ValueError, match='expected'):
+		IncrementalJSONParser().feed('{"a" 1}')
+	with pytest.raises(ValueError, match='mismatched'):
+		IncrementalJSONParser().feed('{"a": [1}')
+
+
+def test_schema_validation():
+	parser = IncrementalJSONParser(schema=Answer)
+	events = parser.feed('{"title": "t", "score": 1}')
+
+	assert events[-1].path == ()
+	assert events[-1].value == Answer(title='t', score=1.0)
+	assert parser.result == Answer(title='t', score=1.0)
+
+	with pytest.raises(pydantic.ValidationError):
+		IncrementalJSONParser(schema=Answer).feed('{"title": "t"}')
+
+
+def test_precompiled_validator():
+	class Validator:
+		def validate(self, instance):
+			if 'score' not in instance:
+				raise ValueError('score is required')
+
+	assert IncrementalJSONParser(schema=Validator()).feed('{"score": 1}')[-1].value == {'score': 1}
+	with pytest.raises(ValueError, match='score is required'):
+		IncrementalJSONParser(schema=Validator()).feed('{}')
+
+
+def _content_sse(text: str) -> bytes:
+	chunks = []
+	for fragment in _split(text, random.Random(1)):
+		chunk = {'id': '1', 'choices': [{'index': 0, 'delta': {'content': fragment}}]}
+		chunks.append(f'data: {json.dumps(chunk)}\n\n'.encode())
+	return b''.join(chunks) + b'data: [DONE]\n\n'
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+	return httpx.Response(200, content=_content_sse(json.dumps({'title': 'hello world', 'score': 0.5})))
+
+
+def test_stream_iter_json_events():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+	)
+	stream = client.chat.completions.create(
+		model='glm-4.5', messages=[], stream=True, response_format={'type': 'json_object'}
+	)
+
+	events = list(stream.iter_json_events(schema=Answer))
+
+	assert [event.path for event in events] == [('title',), ('score',), ()]
+	assert events[-1].value == Answer(title='hello world', score=0.5)
+
+
+async def test_async_stream_iter_partial_json():
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+	) as client:
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		snapshots = [dict(value) async for value in stream.iter_partial_json()]
+
+	assert snapshots[-1] == {'title': 'hello world', 'score': 0.5}
+	assert any(snapshot.get('title', '').startswith('hello') and 'score' not in snapshot for snapshot in snapshots)
@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import RateLimit, RateLimiter, TokenBucket, estimate_tokens
+
+_COMPLETION = {
+	'id': 'chatcmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+class FakeClock:
+	def __init__(self) -> None:
+		self.now = 100.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+def test_token_bucket_reserves_in_arrival_order():
+	clock = FakeClock()
+	with patch('zai.core._rate_limit.time.monotonic', clock):
+		bucket = TokenBucket(capacity=2, per_second=1)
+
+		assert bucket.reserve() == 0
+		assert bucket.reserve() == 0
+		assert bucket.reserve() == pytest.approx(1.0)
+		assert bucket.reserve() == pytest.approx(2.0)
+
+		clock.now += 10
+		assert bucket.reserve() == 0
+
+
+def test_estimate_tokens():
+	body = {'model': 'glm-4', 'messages': [{'role': 'user', 'content': 'a' * 39}], 'max_tokens': 100}
+
+	# 'user' + 39 characters = 43 bytes -> 11 tokens, plus the completion budget
+	assert estimate_tokens(body) == 111
+	assert estimate_tokens({'input': ['你好']}) == 2
+	assert estimate_tokens(None) == 0
+
+
+def test_limits_are_resolved_per_model_and_path():
+	limiter = RateLimiter(
+		{
+			('glm-4', '/chat/completions'): RateLimit(requests_per_minute=1),
+			'embedding-3': RateLimit(requests_per_minute=2),
+			'/files': RateLimit(requests_per_minute=3),
+		},
+		default=RateLimit(requests_per_minute=4),
+	)
+
+	def capacity(model, path):
+		return limiter._get_buckets(model, path)[0].capacity
+
+	assert capacity('glm-4', '/chat/completions') == 1
+	assert capacity('embedding-3', '/embeddings') == 2
+	assert capacity('', '/files') == 3
+	assert capacity('glm-4', '/embeddings') == 4
+	assert RateLimiter()._get_buckets('glm-4', '/chat/completions') == (None, None)
+
+
+def test_tokens_per_minute_limit():
+	clock = FakeClock()
+	with patch('zai.core._rate_limit.time.monotonic', clock):
+		limiter = RateLimiter(default=RateLimit(tokens_per_minute=600), token_estimator=lambda body: 300)
+
+		assert limiter.reserve('chat/completions', {'model': 'glm-4'}) == 0
+		assert limiter.reserve('chat/completions', {'model': 'glm-4'}) == 0
+		assert limiter.reserve('chat/completions', {'model': 'glm-4'}) == pytest.approx(30.0)
+		# other models have their own buckets
+		assert limiter.reserve('chat/completions', {'model': 'glm-4.5'}) == 0
+
+
+def test_client_waits_before_sending():
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_COMPLETION))),
+		rate_limiter=RateLimiter(default=RateLimit(requests_per_minute=1)),
+	)
+
+	with patch('zai.core._http_client.time.sleep') as sleep:
+		client.chat.completions.create(model='glm-4', messages=[])
+		sleep.assert_not_called()
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert sleep.call_count == 1
+	assert sleep.call_args[0][0] == pytest.approx(60, abs=1)
+
+
+async def test_async_client_awaits_before_sending():
+	delays = []
+
+	async def fake_sleep(seconds):
+		delays.append(seconds)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_COMPLETION))),
+		rate_limiter=RateLimiter({'/chat/completions': RateLimit(requests_per_minute=2)}),
+	) as client:
+		with patch('zai.core._http_client.anyio.sleep', fake_sleep), patch('time.sleep') as blocking_sleep:
+			for _ in range(3):
+				await client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(delays) == 1
+	assert delays[0] == pytest.approx(30, abs=1)
+	blocking_sleep.assert_not_called()
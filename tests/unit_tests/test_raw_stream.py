@@ -0,0 +1,83 @@
+import json
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import StreamResponse
+
+_CHUNK = '{"id":"1","model":"glm-4","choices":[{"index":0,"delta":{"role":"assistant","content":"%s"}}]}'
+
+
+def _sse_handler(seen: dict, *payloads: str):
+	def handler(request: httpx.Request) -> httpx.Response:
+		seen['path'] = request.url.path
+		seen['body'] = json.loads(request.content)
+		return httpx.Response(
+			200,
+			content=b''.join(f'data: {payload}\n\n'.encode() for payload in payloads),
+			headers={'content-type': 'text/event-stream'},
+		)
+
+	return handler
+
+
+def _make_client(handler) -> ZaiClient:
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+	)
+
+
+def test_chat_raw_stream_yields_dicts():
+	seen = {}
+	client = _make_client(_sse_handler(seen, _CHUNK % 'a', _CHUNK % 'b', '[DONE]'))
+
+	stream = client.chat.completions.create(model='glm-4', messages=[], stream='raw')
+	chunks = list(stream)
+
+	assert isinstance(stream, StreamResponse)
+	assert seen['body']['stream'] is True
+	assert all(type(chunk) is dict for chunk in chunks)
+	assert [chunk['choices'][0]['delta']['content'] for chunk in chunks] == ['a', 'b']
+
+
+def test_chat_raw_stream_still_raises_errors():
+	from zai.core._errors import APIResponseError
+
+	client = _make_client(_sse_handler({}, '{"error":{"message":"bad"}}'))
+
+	with pytest.raises(APIResponseError, match='bad'):
+		list(client.chat.completions.create(model='glm-4', messages=[], stream='raw'))
+
+
+def test_agents_and_web_search_raw_stream():
+	seen = {}
+	client = _make_client(_sse_handler(seen, '{"agent_id":"a1","choices":[]}', '[DONE]'))
+
+	chunks = list(client.agents.invoke(agent_id='a1', messages=[], stream='raw'))
+	assert chunks == [{'agent_id': 'a1', 'choices': []}]
+	assert seen['path'] == '/v4/v1/agents'
+	assert seen['body']['stream'] is True
+
+	client = _make_client(_sse_handler(seen, '{"id":"s1","choices":[]}', '[DONE]'))
+	chunks = list(client.tools.web_search(model='web-search-pro', messages=[], stream='raw'))
+	assert chunks == [{'id': 's1', 'choices': []}]
+	assert seen['body']['stream'] is True
+
+
+async def test_async_chat_raw_stream_yields_dicts():
+	seen = {}
+	client = AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_sse_handler(seen, _CHUNK % 'a', '[DONE]'))),
+	)
+
+	async with client:
+		stream = await client.chat.completions.create(model='glm-4', messages=[], stream='raw')
+		chunks = [chunk async for chunk in stream]
+
+	assert chunks == [json.loads(_CHUNK % 'a')]
+	assert seen['body']['stream'] is True
@@ -0,0 +1,187 @@
+import inspect
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import APIStatusError, APITimeoutError, RateLimit, RateLimiter, RetryPolicy
+
+_COMPLETION = {
+	'id': 'chatcmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def _client(handler, **kwargs):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		**kwargs,
+	)
+
+
+def test_attempt_timeout_shrinks_to_the_deadline():
+	timeouts = []
+	responses = iter([httpx.Response(503), httpx.Response(200, json=_COMPLETION)])
+
+	def handler(request):
+		timeouts.append(request.extensions['timeout'])
+		return next(responses)
+
+	client = _client(handler, timeout=300, deadline=10)
+	with patch('zai.core._http_client.time.sleep'):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(timeouts) == 2
+	for timeout in timeouts:
+		assert set(timeout) == {'connect', 'read', 'write', 'pool'}
+		assert all(0 < value <= 10 for value in timeout.values())
+
+
+def test_request_deadline_overrides_client_default():
+	timeouts = []
+
+	def handler(request):
+		timeouts.append(request.extensions['timeout']['read'])
+		return httpx.Response(200, json=_COMPLETION)
+
+	client = _client(handler, timeout=300, deadline=10)
+	client.chat.completions.create(model='glm-4', messages=[], deadline=2)
+	client.chat.completions.create(model='glm-4', messages=[], deadline=None)
+
+	assert 0 < timeouts[0] <= 2
+	assert timeouts[1] == 300
+
+
+def test_no_retry_when_backoff_would_pass_the_deadline():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(429, headers={'retry-after': '5'})
+
+	client = _client(handler, deadline=3)
+	with patch('zai.core._http_client.time.sleep') as sleep, pytest.raises(APIStatusError):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(calls) == 1
+	sleep.assert_not_called()
+
+
+def test_deadline_caps_total_time_across_attempts():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		threading.Event().wait(0.02)
+		return httpx.Response(503)
+
+	client = _client(handler, max_retries=50, retry_policy=RetryPolicy(initial_delay=0.001, max_delay=0.001))
+	with pytest.raises(APIStatusError):
+		client.chat.completions.create(model='glm-4', messages=[], deadline=0.1)
+
+	assert 2 <= len(calls) <= 6
+
+
+def test_retries_do_not_grow_the_stack():
+	depths = []
+
+	def handler(request):
+		depths.append(len(inspect.stack(0)))
+		return httpx.Response(503) if len(depths) < 20 else httpx.Response(200, json=_COMPLETION)
+
+	client = _client(handler, max_retries=20)
+	with patch('zai.core._http_client.time.sleep'):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(depths) == 20
+	assert len(set(depths)) == 1
+
+
+async def test_async_attempt_timeout_shrinks_to_the_deadline():
+	timeouts = []
+	responses = iter([httpx.Response(500), httpx.Response(200, json=_COMPLETION)])
+
+	def handler(request):
+		timeouts.append(request.extensions['timeout']['read'])
+		return next(responses)
+
+	async def fake_sleep(seconds):
+		pass
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		timeout=300,
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+	) as client:
+		with patch('zai.core._http_client.anyio.sleep', fake_sleep):
+			await client.chat.completions.create(model='glm-4', messages=[], deadline=5)
+
+	assert len(timeouts) == 2
+	assert all(0 < timeout <= 5 for timeout in timeouts)
+
+
+def test_rate_limit_wait_past_the_deadline_fails_fast():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(200, json=_COMPLETION)
+
+	client = _client(handler, rate_limiter=RateLimiter(default=RateLimit(requests_per_minute=1)))
+	with patch('zai.core._http_client.time.sleep') as sleep:
+		client.chat.completions.create(model='glm-4', messages=[])
+		with pytest.raises(APITimeoutError):
+			client.chat.completions.create(model='glm-4', messages=[], deadline=5)
+		sleep.assert_not_called()
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(calls) == 2
+	assert sleep.call_args[0][0] == pytest.approx(60, abs=1)
+
+
+async def test_async_rate_limit_wait_past_the_deadline_fails_fast():
+	delays = []
+
+	def handler(request):
+		return httpx.Response(200, json=_COMPLETION)
+
+	async def fake_sleep(seconds):
+		delays.append(seconds)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		rate_limiter=RateLimiter(default=RateLimit(requests_per_minute=1)),
+	) as client:
+		with patch('zai.core._http_client.anyio.sleep', fake_sleep):
+			await client.chat.completions.create(model='glm-4', messages=[])
+			with pytest.raises(APITimeoutError):
+				await client.chat.completions.create(model='glm-4', messages=[], deadline=5)
+
+	assert delays == []
+
+
+def test_deadline_bounds_reading_a_stream():
+	chunk = b'data: {"id":"1","choices":[{"index":0,"delta":{"content":"a"}}]}\n\n'
+
+	def body():
+		for _ in range(20):
+			threading.Event().wait(0.02)
+			yield chunk
+
+	client = _client(lambda request: httpx.Response(200, content=body()))
+	stream = client.chat.completions.create(model='glm-4', messages=[], stream=True, deadline=0.1)
+	received = []
+	with pytest.raises(APITimeoutError):
+		for item in stream:
+			received.append(item)
+
+	assert 1 <= len(received) < 20
+	assert stream.response.is_closed
@@ -0,0 +1,235 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import CachedResponse, MemoryCache, ResponseCache, SQLiteCache
+from zai.core._cache import record_stream
+from zai.core._request_opt import FinalRequestOptions
+
+_EMBEDDINGS = {
+	'object': 'list',
+	'model': 'embedding-3',
+	'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 0, 'total_tokens': 1},
+}
+
+
+class FakeClock:
+	def __init__(self) -> None:
+		self.now = 1000.0
+
+	def __call__(self) -> float:
+		return self.now
+
+
+def _entry(size: int) -> CachedResponse:
+	return CachedResponse(b'x' * size, 'application/json')
+
+
+def test_memory_cache_evicts_least_recently_used_by_size():
+	cache = MemoryCache(max_bytes=10)
+	cache.set('a', _entry(4), ttl=60)
+	cache.set('b', _entry(4), ttl=60)
+	assert cache.get('a') is not None
+
+	cache.set('c', _entry(4), ttl=60)
+
+	assert cache.get('b') is None
+	assert cache.get('a') is not None and cache.get('c') is not None
+	assert cache.size == 8 and cache.evictions == 1
+	cache.set('huge', _entry(11), ttl=60)
+	assert cache.get('huge') is None
+
+
+def test_memory_cache_expires_entries():
+	clock = FakeClock()
+	with patch('zai.core._cache.time.time', clock):
+		cache = MemoryCache()
+		cache.set('a', _entry(1), ttl=10)
+		clock.now += 9
+		assert cache.get('a') is not None
+		clock.now += 2
+		assert cache.get('a') is None
+		assert len(cache) == 0
+
+
+def test_sqlite_cache_is_shared_and_evicts(tmp_path):
+	path = tmp_path / 'responses.db'
+	writer = SQLiteCache(path, max_bytes=10)
+	writer.set('a', _entry(4), ttl=60)
+	writer.set('b', _entry(4), ttl=60)
+
+	reader = SQLiteCache(path)
+	assert reader.get('a').content == b'xxxx'
+
+	writer.set('c', _entry(4), ttl=60)
+	assert reader.get('b') is None
+	assert reader.get('c') is not None
+	assert writer.evictions == 1
+
+	writer.set('d', _entry(1), ttl=-1)
+	assert reader.get('d') is None
+	writer.close()
+	reader.close()
+
+
+def test_only_deterministic_requests_are_cacheable():
+	cache = ResponseCache()
+
+	def ttl(url, stream=False, **body):
+		return cache.ttl_for(FinalRequestOptions.construct(method='post', url=url, json_data=body), stream)
+
+	assert ttl('/embeddings', input='hi') == 24 * 3600
+	assert ttl('/chat/completions', temperature=0.9) is None
+	assert ttl('/chat/completions') is None
+	assert ttl('/chat/completions', do_sample=False) == 3600
+	assert ttl('/chat/completions', temperature=0) == 3600
+	assert ttl('/chat/completions', stream=True, temperature=0) is None
+	assert ResponseCache(cache_streams=True).ttl_for(
+		FinalRequestOptions.construct(method='post', url='/chat/completions', json_data={'temperature': 0}), True
+	) == 3600
+	assert ttl('/files') is None
+
+
+def test_client_serves_repeated_requests_from_the_cache():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	cache = ResponseCache()
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		response_cache=cache,
+	)
+
+	first = client.embeddings.create(model='embedding-3', input='hi')
+	second = client.embeddings.create(model='embedding-3', input='hi')
+	client.embeddings.create(model='embedding-3', input='other')
+
+	assert len(calls) == 2
+	assert second.data[0].embedding == first.data[0].embedding
+	assert (cache.hits, cache.misses, cache.stores) == (1, 2, 2)
+	assert cache.hit_rate == pytest.approx(1 / 3)
+
+
+def test_streams_are_replayed_when_enabled():
+	calls = []
+	events = [
+		{'id': '1', 'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': 'Hel'}}]},
+		{'id': '1', 'choices': [{'index': 0, 'delta': {'content': 'lo'}, 'finish_reason': 'stop'}]},
+	]
+	body = b''.join(f'data: {json.dumps(event)}\n\n'.encode() for event in events) + b'data: [DONE]\n\n'
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(200, content=body, headers={'content-type': 'text/event-stream'})
+
+	cache = ResponseCache(cache_streams=True)
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		response_cache=cache,
+	)
+
+	def run():
+		stream = client.chat.completions.create(model='glm-4', messages=[], stream=True, temperature=0)
+		return [chunk.choices[0].delta.content for chunk in stream]
+
+	assert run() == ['Hel', 'lo']
+	assert run() == ['Hel', 'lo']
+	assert len(calls) == 1
+	assert cache.hits == 1
+
+
+class _Chunks(httpx.SyncByteStream):
+	def __init__(self, parts):
+		self.parts = parts
+		self.closed = False
+
+	def __iter__(self):
+		yield from self.parts
+
+	def close(self):
+		self.closed = True
+
+
+def test_recorded_stream_is_stored_when_closed_after_done():
+	recorded = []
+	parts = [b'data: {"a": 1}\n\n', b'data: [DONE]\n\n', b': trailing comment\n\n']
+	stream = _Chunks(parts)
+	response = httpx.Response(200, stream=stream, request=httpx.Request('POST', 'https://api.test.com/v4/x'))
+	record_stream(response, recorded.append, is_async=False)
+
+	for part in response.iter_raw():
+		if b'[DONE]' in part:
+			break
+	response.close()
+
+	assert recorded == [b''.join(parts[:2])]
+	assert stream.closed
+
+	recorded.clear()
+	abandoned = httpx.Response(200, stream=_Chunks(parts), request=httpx.Request('POST', 'https://api.test.com/v4/x'))
+	record_stream(abandoned, recorded.append, is_async=False)
+	next(abandoned.iter_raw())
+	abandoned.close()
+	assert recorded == []
+
+
+async def test_async_client_uses_the_sqlite_cache(tmp_path):
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	for _ in range(2):
+		async with AsyncZaiClient(
+			api_key='test-key',
+			base_url='https://api.test.com/v4',
+			http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+			response_cache=ResponseCache(SQLiteCache(tmp_path / 'responses.db')),
+		) as client:
+			response = await client.embeddings.create(model='embedding-3', input='hi')
+			assert response.model == 'embedding-3'
+
+	assert len(calls) == 1
+
+
+def test_cache_is_keyed_by_credentials():
+	cache = ResponseCache()
+	keys = []
+
+	def handler(request):
+		keys.append(request.headers['authorization'])
+		return httpx.Response(200, json=_EMBEDDINGS)
+
+	def client(api_key, **kwargs):
+		return ZaiClient(
+			api_key=api_key,
+			base_url='https://api.test.com/v4',
+			http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+			response_cache=cache,
+			**kwargs,
+		)
+
+	client('key-a').embeddings.create(model='embedding-3', input='hi')
+	client('key-b').embeddings.create(model='embedding-3', input='hi')
+	client('key-a').embeddings.create(model='embedding-3', input='hi')
+	client('key-a', custom_headers={'Accept-Language': 'zh-CN'}).embeddings.create(model='embedding-3', input='hi')
+
+	assert keys == ['Bearer key-a', 'Bearer key-b', 'Bearer key-a']
+
+	# a regenerated JWT for the same key still hits the cache
+	jwt_client = client('id.' + 's' * 32, disable_token_cache=False)
+	jwt_client.embeddings.create(model='embedding-3', input='hi')
+	jwt_client.embeddings.create(model='embedding-3', input='hi')
+	assert len(keys) == 4
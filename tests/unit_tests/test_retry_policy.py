@@ -0,0 +1,153 @@
+import email.utils
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import APIStatusError, EndpointRetryRule, RetryBudget, RetryPolicy, parse_retry_after
+
+_COMPLETION = {
+	'id': 'chatcmpl-1',
+	'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': 'hi'}}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+def _response(status_code, headers=None):
+	return httpx.Response(status_code, headers=headers, request=httpx.Request('POST', 'https://api.test.com/v4/x'))
+
+
+def test_parse_retry_after_headers():
+	assert parse_retry_after(None) is None
+	assert parse_retry_after(httpx.Headers({})) is None
+	assert parse_retry_after(httpx.Headers({'retry-after': '3'})) == 3
+	assert parse_retry_after(httpx.Headers({'retry-after-ms': '250', 'retry-after': '3'})) == 0.25
+
+	date = email.utils.formatdate(time.time() + 30, usegmt=True)
+	assert parse_retry_after(httpx.Headers({'retry-after': date})) == pytest.approx(30, abs=2)
+
+	headers = httpx.Headers(
+		{
+			'x-ratelimit-remaining-requests': '0',
+			'x-ratelimit-reset-requests': '1m30s',
+			'x-ratelimit-remaining-tokens': '10',
+			'x-ratelimit-reset-tokens': '500ms',
+		}
+	)
+	assert parse_retry_after(headers) == 90
+	# the reset time only matters once the limit is exhausted
+	assert parse_retry_after(httpx.Headers({'x-ratelimit-reset-requests': '2s'})) is None
+	epoch = str(int(time.time()) + 20)
+	assert parse_retry_after(
+		httpx.Headers({'x-ratelimit-remaining': '0', 'x-ratelimit-reset': epoch})
+	) == pytest.approx(20, abs=2)
+
+
+def test_retry_after_takes_precedence_over_backoff():
+	policy = RetryPolicy()
+
+	assert policy.compute_delay(0, httpx.Headers({'retry-after': '5'})) == 5
+	# unreasonable values fall back to the computed backoff
+	assert policy.compute_delay(0, httpx.Headers({'retry-after': '3600'})) <= policy.max_delay
+	assert RetryPolicy(respect_retry_after=False).compute_delay(0, httpx.Headers({'retry-after': '5'})) <= 0.5
+
+
+def test_jitter_modes():
+	full = RetryPolicy(jitter='full', initial_delay=1, max_delay=4)
+	decorrelated = RetryPolicy(jitter='decorrelated', initial_delay=1, max_delay=4)
+
+	for _ in range(100):
+		assert 0 <= full.compute_delay(5) <= 4
+		assert 1 <= decorrelated.compute_delay(0) <= 3
+		assert 1 <= decorrelated.compute_delay(3, previous_delay=3.5) <= 4
+
+
+def test_endpoint_rules_override_defaults():
+	policy = RetryPolicy(
+		endpoint_rules={
+			'/files': EndpointRetryRule(retry_statuses={503}, retry_exceptions=(httpx.ConnectError,)),
+			'files/batch': EndpointRetryRule(retry_statuses=()),
+		},
+	)
+
+	assert policy.should_retry_response(_response(429), '/chat/completions')
+	assert not policy.should_retry_response(_response(429), '/files')
+	assert policy.should_retry_response(_response(503), '/files/file-1/content')
+	assert not policy.should_retry_response(_response(503), '/files/batch')
+	assert not policy.should_retry_response(_response(400), '/chat/completions')
+	assert policy.should_retry_response(_response(400, {'x-should-retry': 'true'}), '/files')
+
+	assert policy.should_retry_exception(httpx.ReadTimeout('timeout'), '/chat/completions')
+	assert not policy.should_retry_exception(httpx.ReadTimeout('timeout'), '/files')
+	assert policy.should_retry_exception(httpx.ConnectError('refused'), '/files')
+
+
+def test_retry_budget_caps_retries_to_a_fraction_of_traffic():
+	budget = RetryBudget(ratio=0.5, min_retries=1)
+
+	assert budget.try_acquire()
+	assert not budget.try_acquire()
+
+	for _ in range(4):
+		budget.record_request()
+	assert budget.try_acquire()
+	assert budget.try_acquire()
+	assert not budget.try_acquire()
+
+
+def test_client_honours_retry_after():
+	responses = iter([httpx.Response(429, headers={'retry-after': '2'}), httpx.Response(200, json=_COMPLETION)])
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(lambda request: next(responses))),
+	)
+
+	with patch('zai.core._http_client.time.sleep') as sleep:
+		completion = client.chat.completions.create(model='glm-4', messages=[])
+
+	assert completion.id == 'chatcmpl-1'
+	sleep.assert_called_once_with(2.0)
+
+
+def test_client_stops_retrying_when_budget_is_exhausted():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		return httpx.Response(503, json={'error': {'message': 'busy'}})
+
+	client = ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		max_retries=3,
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		retry_policy=RetryPolicy(budget=RetryBudget(ratio=0, min_retries=1)),
+	)
+
+	with patch('zai.core._http_client.time.sleep'), pytest.raises(APIStatusError):
+		client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(calls) == 2
+
+
+async def test_async_client_does_not_retry_excluded_exceptions():
+	calls = []
+
+	def handler(request):
+		calls.append(request)
+		raise httpx.ConnectError('refused', request=request)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		max_retries=2,
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		retry_policy=RetryPolicy(retry_exceptions=(httpx.TimeoutException,)),
+	) as client:
+		with pytest.raises(Exception):
+			await client.chat.completions.create(model='glm-4', messages=[])
+
+	assert len(calls) == 1
@@ -0,0 +1,156 @@
+import json
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core import StreamMetrics
+
+_CHUNK = {'id': '1', 'model': 'glm-4.5', 'choices': [{'index': 0, 'delta': {'role': 'assistant'}}]}
+
+
+def _chunk(**delta) -> str:
+	chunk = json.loads(json.dumps(_CHUNK))
+	chunk['choices'][0]['delta'].update(delta)
+	return json.dumps(chunk)
+
+
+_USAGE_CHUNK = json.dumps(
+	{
+		'id': '1',
+		'model': 'glm-4.5',
+		'choices': [{'index': 0, 'finish_reason': 'stop', 'delta': {}}],
+		'usage': {'prompt_tokens': 3, 'completion_tokens': 4, 'total_tokens': 7},
+	}
+)
+
+
+def _body(payloads: List[str]) -> Iterator[bytes]:
+	for payload in payloads:
+		yield f'data: {payload}\n\n'.encode()
+
+
+def _make_client(payloads: List[str], callback) -> ZaiClient:
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=_body(payloads), headers={'content-type': 'text/event-stream'})
+
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+		stream_metrics_callback=callback,
+	)
+
+
+def test_stream_metrics_are_recorded():
+	reported = []
+	payloads = [
+		_chunk(),
+		_chunk(reasoning_content='thinking'),
+		_chunk(content='hi'),
+		_chunk(content=' there'),
+		_USAGE_CHUNK,
+		'[DONE]',
+	]
+	client = _make_client(payloads, reported.append)
+
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+	list(stream)
+	metrics = stream.metrics
+
+	assert reported == [metrics]
+	assert metrics.finished
+	assert metrics.url == 'https://api.test.com/v4/chat/completions'
+	assert metrics.model == 'glm-4.5'
+	assert metrics.request_sent_at is not None
+	assert metrics.chunk_count == 5
+	assert len(metrics.inter_chunk_gaps) == 4
+	assert sum(metrics.gap_histogram()) == 4
+	assert 0 <= metrics.time_to_headers <= metrics.time_to_first_chunk
+	assert metrics.time_to_first_chunk <= metrics.time_to_first_reasoning_token <= metrics.time_to_first_token
+	assert metrics.time_to_first_token <= metrics.total_duration
+	assert metrics.completion_tokens == 4
+	assert metrics.tokens_per_second is None or metrics.tokens_per_second > 0
+
+
+def test_stream_metrics_reported_once_on_early_close():
+	reported = []
+	client = _make_client([_chunk(content='a'), _chunk(content='b'), '[DONE]'], reported.append)
+
+	stream = client.chat.completions.create(model='glm-4.5', messages=[], stream='raw')
+	next(stream)
+	stream.close()
+	stream.close()
+
+	assert list(stream) == []
+	assert len(reported) == 1
+	assert reported[0].chunk_count == 1
+	assert reported[0].time_to_first_token is not None
+
+
+def test_stream_metrics_callback_errors_are_swallowed():
+	def callback(metrics: StreamMetrics) -> None:
+		raise RuntimeError('boom')
+
+	client = _make_client([_chunk(content='a'), '[DONE]'], callback)
+
+	assert len(list(client.chat.completions.create(model='glm-4.5', messages=[], stream=True))) == 1
+
+
+def test_gap_histogram_buckets():
+	metrics = StreamMetrics()
+	metrics.inter_chunk_gaps = [0.001, 0.02, 0.02, 3.0, 10.0]
+
+	assert metrics.gap_histogram(buckets=(0.01, 0.1, 5.0)) == [1, 2, 1, 1]
+
+
+def test_tokens_per_second():
+	metrics = StreamMetrics(sent_perf=0.0)
+	metrics.time_to_first_token = 1.0
+	metrics.total_duration = 3.0
+	metrics.usage = {'completion_tokens': 10}
+
+	assert metrics.tokens_per_second == pytest.approx(5.0)
+
+
+async def test_async_stream_metrics():
+	reported = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=b''.join(_body([_chunk(content='a'), _USAGE_CHUNK, '[DONE]'])))
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		stream_metrics_callback=reported.append,
+	) as client:
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		[chunk async for chunk in stream]
+
+	assert reported == [stream.metrics]
+	assert stream.metrics.chunk_count == 2
+	assert stream.metrics.time_to_first_token is not None
+	assert stream.metrics.completion_tokens == 4
+
+
+async def test_async_stream_metrics_reported_on_early_close():
+	reported = []
+
+	def handler(request: httpx.Request) -> httpx.Response:
+		return httpx.Response(200, content=b''.join(_body([_chunk(content='a'), _chunk(content='b'), '[DONE]'])))
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+		stream_metrics_callback=reported.append,
+	) as client:
+		stream = await client.chat.completions.create(model='glm-4.5', messages=[], stream=True)
+		await stream.__anext__()
+		await stream.aclose()
+
+		assert [chunk async for chunk in stream] == []
+		assert reported == [stream.metrics]
+		assert stream.metrics.chunk_count == 1
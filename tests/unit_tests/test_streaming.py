@@ -1,8 +1,11 @@
+import math
 from typing import Iterator
+from unittest.mock import patch
 
 import pytest
 
-from zai.core._streaming import SSELineParser
+from zai.core._json_encoder import json_loads
+from zai.core._streaming import Event, SSEDecoder, SSELineParser
 
 
 def test_basic() -> None:
@@ -90,3 +93,51 @@ def test_multiple_events_with_data() -> None:
 
 	with pytest.raises(StopIteration):
 		next(it)
+
+
+def test_decoder_reassembles_split_events() -> None:
+	def body() -> Iterator[bytes]:
+		yield b'event: comp'
+		yield b'letion\ndata: {"fo'
+		yield b'o":true}\r'
+		yield b'\n\r\ndata: {"bar":1}\n\n'
+
+	events = list(SSEDecoder().iter_bytes(body()))
+
+	assert len(events) == 2
+	assert events[0].event == 'completion'
+	assert events[0].json_data() == {'foo': True}
+	assert events[1].event is None
+	assert events[1].json_data() == {'bar': 1}
+
+
+def test_decoder_flushes_unterminated_event() -> None:
+	events = list(SSEDecoder().iter_bytes(iter([b'data: [DONE]'])))
+
+	assert len(events) == 1
+	assert events[0].is_done()
+	assert events[0].raw_data == b'[DONE]'
+
+
+def test_decoder_keeps_payload_as_bytes() -> None:
+	events = list(SSEDecoder().iter_bytes(iter(['data: {"text":"你好"}\n\n'.encode()])))
+
+	assert events[0].raw_data == '{"text":"你好"}'.encode()
+	assert events[0].data == '{"text":"你好"}'
+
+
+def test_event_json_data_parsed_once() -> None:
+	sse = Event(data=b'{"foo":[1,2]}')
+
+	with patch('zai.core._streaming.json_loads', wraps=json_loads) as loads:
+		first = sse.json_data()
+		second = sse.json_data()
+
+	assert first == {'foo': [1, 2]}
+	assert first is second
+	assert loads.call_count == 1
+
+
+def test_json_loads_falls_back_for_non_standard_json() -> None:
+	assert math.isnan(json_loads(b'{"score": NaN}')['score'])
+	assert json_loads('{"a": 1}') == {'a': 1}
@@ -0,0 +1,101 @@
+import io
+import os
+from unittest.mock import patch
+
+import httpx
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.core._files import LazyPathFile, to_httpx_files
+
+_FILE_OBJECT = {'id': 'file-1', 'object': 'file', 'bytes': 0, 'created_at': 0, 'filename': 'x', 'purpose': 'batch'}
+
+
+class _StreamingTransport(httpx.BaseTransport):
+	"""Consumes the request body chunk by chunk like a real connection; fails the first attempt."""
+
+	def __init__(self, failures=0):
+		self.failures = failures
+		self.bodies = []
+		self.chunk_sizes = []
+
+	def handle_request(self, request):
+		body = bytearray()
+		for chunk in request.stream:
+			self.chunk_sizes.append(len(chunk))
+			body += chunk
+		self.bodies.append(bytes(body))
+		if len(self.bodies) <= self.failures:
+			return httpx.Response(503, json={'error': {'code': '500', 'message': 'busy'}})
+		return httpx.Response(200, json=_FILE_OBJECT)
+
+
+def test_lazy_file_opens_on_read_and_reopens_after_rewind(tmp_path):
+	path = tmp_path / 'data.bin'
+	path.write_bytes(b'0123456789')
+	file = LazyPathFile(path)
+
+	assert file._file is None
+	assert file.seek(0, os.SEEK_END) == 10 and file.seek(0) == 0
+	assert file.read(4) == b'0123'
+	assert file.read() == b'456789'
+	assert file.read(1) == b''
+	assert file._file is None
+
+	file.seek(2)
+	assert file.read(3) == b'234'
+	file.close()
+	assert file._file is None and file.closed
+
+
+def test_paths_are_not_read_into_memory(tmp_path):
+	path = tmp_path / 'batch.jsonl'
+	path.write_bytes(b'{}\n')
+
+	files = to_httpx_files({'file': path, 'tuple': ('renamed.jsonl', path, 'application/jsonl')})
+
+	assert files['file'][0] == 'batch.jsonl'
+	assert isinstance(files['file'][1], LazyPathFile)
+	assert isinstance(files['tuple'][1], LazyPathFile) and files['tuple'][2] == 'application/jsonl'
+
+
+def test_upload_is_streamed_in_chunks_and_resent_on_retry(tmp_path):
+	path = tmp_path / 'batch.jsonl'
+	content = os.urandom(300 * 1024)
+	path.write_bytes(content)
+	transport = _StreamingTransport(failures=1)
+	client = ZaiClient(
+		api_key='test-key', base_url='https://api.test.com/v4', http_client=httpx.Client(transport=transport)
+	)
+
+	with patch('zai.core._http_client.time.sleep'):
+		client.files.create(file=path, purpose='batch')
+
+	assert len(transport.bodies) == 2
+	assert transport.bodies[0] == transport.bodies[1]
+	assert content in transport.bodies[1]
+	assert max(transport.chunk_sizes) <= 64 * 1024
+
+
+async def test_async_upload_streams_from_path(tmp_path):
+	path = tmp_path / 'speech.wav'
+	path.write_bytes(b'RIFF' + b'\0' * 1000)
+	requests = []
+
+	async def handler(request):
+		requests.append(await request.aread())
+		return httpx.Response(200, json=_FILE_OBJECT)
+
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+	) as client:
+		await client.files.create(file=path, purpose='batch')
+
+	assert b'filename="speech.wav"' in requests[0]
+	assert b'RIFF' + b'\0' * 1000 in requests[0]
+
+
+def test_open_file_handles_are_passed_through():
+	handle = io.BytesIO(b'data')
+	assert to_httpx_files([('file', handle)]) == [('file', handle)]
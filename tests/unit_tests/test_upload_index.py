@@ -0,0 +1,175 @@
+import io
+import multiprocessing
+import threading
+
+import httpx
+import pytest
+
+from zai import AsyncZaiClient, ZaiClient
+from zai.api_resource import UploadIndex
+from zai.api_resource.files.upload_index import file_sha256
+from zai.core._errors import APIStatusError
+from zai.types.files import FileObject
+
+
+class _Server:
+	def __init__(self):
+		self.uploads = 0
+		self.deleted = set()
+		self.probes = []
+		self.probe_status = None
+
+	def __call__(self, request):
+		if request.method == 'POST':
+			self.uploads += 1
+			file = {'id': f'file-{self.uploads}', 'object': 'file', 'bytes': 5, 'created_at': 0, 'filename': 'a.txt'}
+			return httpx.Response(200, json={**file, 'purpose': 'retrieval'})
+		file_id = request.url.path.split('/')[3]
+		if request.method == 'DELETE':
+			self.deleted.add(file_id)
+			return httpx.Response(200, json={'id': file_id, 'object': 'file', 'deleted': True})
+		self.probes.append(request.headers.get('range'))
+		if self.probe_status is not None:
+			return httpx.Response(self.probe_status, json={'error': {'message': 'unavailable'}})
+		if file_id in self.deleted:
+			return httpx.Response(404, json={'error': {'message': 'not found'}})
+		return httpx.Response(206, content=b'h', headers={'content-range': 'bytes 0-0/5'})
+
+
+def _client(server, index):
+	return ZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.Client(transport=httpx.MockTransport(server)),
+		upload_index=index,
+		max_retries=0,
+	)
+
+
+def test_file_sha256_of_inputs(tmp_path):
+	path = tmp_path / 'a.txt'
+	path.write_bytes(b'hello')
+	expected = file_sha256(b'hello')
+
+	assert file_sha256(path) == expected
+	assert file_sha256(('a.txt', b'hello', 'text/plain')) == expected
+	stream = io.BytesIO(b'xhello')
+	stream.seek(1)
+	assert file_sha256(stream) == expected
+	assert stream.tell() == 1
+
+
+def test_identical_content_is_uploaded_once(tmp_path):
+	server = _Server()
+	index = UploadIndex(tmp_path / 'uploads.db')
+	client = _client(server, index)
+	(tmp_path / 'a.txt').write_bytes(b'hello')
+	(tmp_path / 'copy.txt').write_bytes(b'hello')
+
+	first = client.files.create(file=tmp_path / 'a.txt', purpose='retrieval', knowledge_id='kb-1')
+	second = client.files.create(file=tmp_path / 'copy.txt', purpose='retrieval', knowledge_id='kb-1')
+	other_kb = client.files.create(file=tmp_path / 'a.txt', purpose='retrieval', knowledge_id='kb-2')
+
+	assert second == first
+	assert other_kb.id == 'file-2'
+	assert server.uploads == 2
+	assert server.probes == ['bytes=0-0']
+	assert (index.hits, index.misses) == (1, 2)
+
+
+def test_deleted_files_are_uploaded_again(tmp_path):
+	server = _Server()
+	index = UploadIndex(tmp_path / 'uploads.db')
+	client = _client(server, index)
+
+	assert client.files.create(file=b'hello', purpose='batch').id == 'file-1'
+	server.deleted.add('file-1')
+	assert client.files.create(file=b'hello', purpose='batch').id == 'file-2'
+
+	client.files.delete('file-2')
+	assert index.get(file_sha256(b'hello'), 'batch', None) is None
+	assert client.files.create(file=b'hello', purpose='batch').id == 'file-3'
+	assert server.uploads == 3
+
+
+def test_probe_errors_other_than_gone_are_raised(tmp_path):
+	server = _Server()
+	index = UploadIndex(tmp_path / 'uploads.db')
+	client = _client(server, index)
+	first = client.files.create(file=b'hello', purpose='batch')
+
+	server.probe_status = 500
+	with pytest.raises(APIStatusError):
+		client.files.create(file=b'hello', purpose='batch')
+	assert server.uploads == 1
+	assert index.get(file_sha256(b'hello'), 'batch', None) == first
+
+	server.probe_status = 410
+	assert client.files.create(file=b'hello', purpose='batch').id == 'file-2'
+
+
+def _record(path):
+	index = UploadIndex(path)
+	index.set(file_sha256(b'shared'), 'batch', None, FileObject(id='file-shared', purpose='batch'))
+	index.close()
+
+
+def test_index_is_shared_between_processes(tmp_path):
+	path = tmp_path / 'uploads.db'
+	index = UploadIndex(path)
+	process = multiprocessing.get_context('spawn').Process(target=_record, args=(path,))
+	process.start()
+	process.join(30)
+
+	assert process.exitcode == 0
+	assert index.get(file_sha256(b'shared'), 'batch', None).id == 'file-shared'
+
+
+async def test_async_create_uses_index(tmp_path):
+	server = _Server()
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+		upload_index=UploadIndex(tmp_path / 'uploads.db'),
+		max_retries=0,
+	) as client:
+		first = await client.files.create(file=b'hello', purpose='batch')
+		assert await client.files.create(file=b'hello', purpose='batch') == first
+		server.deleted.add(first.id)
+		assert (await client.files.create(file=b'hello', purpose='batch')).id == 'file-2'
+
+	assert server.uploads == 2
+
+
+async def test_async_create_hashes_off_the_event_loop(tmp_path, monkeypatch):
+	threads = []
+
+	def sha256(file):
+		threads.append(threading.get_ident())
+		return file_sha256(file)
+
+	monkeypatch.setattr('zai.api_resource.files.files.file_sha256', sha256)
+	async with AsyncZaiClient(
+		api_key='test-key',
+		base_url='https://api.test.com/v4',
+		http_client=httpx.AsyncClient(transport=httpx.MockTransport(_Server())),
+		upload_index=UploadIndex(tmp_path / 'uploads.db'),
+		max_retries=0,
+	) as client:
+		first = await client.files.create(file=b'hello', purpose='batch')
+		assert await client.files.create(file=b'hello', purpose='batch') == first
+
+	assert len(threads) == 2
+	assert threading.get_ident() not in threads
+
+
+def test_unseekable_streams_skip_the_index(tmp_path):
+	server = _Server()
+	client = _client(server, UploadIndex(tmp_path / 'uploads.db'))
+
+	for _ in range(2):
+		stream = io.BytesIO(b'hello')
+		stream.seekable = lambda: False
+		client.files.create(file=stream, purpose='batch')
+	assert server.uploads == 2